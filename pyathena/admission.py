@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pyathena.error import QueryTimeoutError
+from pyathena.executor import PriorityThreadPoolExecutor
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class _WorkGroupState(object):
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self.queue: List[Tuple[float, int]] = []
+        self.admitted = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class AdmissionController(object):
+    """Caps the number of the running queries of each work group.
+
+    A query is admitted when the number of the running queries of its work group
+    is less than the limit, otherwise it waits in the queue of the work group,
+    in the order of the submission, or of the priority if ``priority`` is True.
+    The priority of a waiting query is increased by one for every ``aging_interval``
+    seconds it waits, so the queries of the low priority are also admitted.
+    The limit is increased additively while the queries are started successfully,
+    up to ``max_limit``, and multiplied by ``decrease_factor`` when StartQueryExecution
+    is throttled, down to ``min_limit``."""
+
+    # Work group of the queries that do not specify a work group.
+    DEFAULT_WORK_GROUP: str = "primary"
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        decrease_factor: float = 0.5,
+        priority: bool = False,
+        aging_interval: float = PriorityThreadPoolExecutor.DEFAULT_AGING_INTERVAL,
+        throttling_exceptions: Iterable[str] = ("TooManyRequestsException",),
+    ) -> None:
+        assert (
+            0 < min_limit <= initial_limit <= max_limit
+        ), "The limits must satisfy 0 < min_limit <= initial_limit <= max_limit."
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.priority = priority
+        self.aging_interval = aging_interval
+        self.throttling_exceptions = tuple(throttling_exceptions)
+        self._condition = threading.Condition()
+        self._states: Dict[str, _WorkGroupState] = dict()
+        self._counter = itertools.count()
+
+    def _get_state(self, work_group: Optional[str]) -> _WorkGroupState:
+        work_group = work_group if work_group else self.DEFAULT_WORK_GROUP
+        state = self._states.get(work_group, None)
+        if not state:
+            state = _WorkGroupState(self.initial_limit)
+            self._states[work_group] = state
+        return state
+
+    def acquire(
+        self,
+        work_group: Optional[str],
+        priority: int = 0,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Wait until the query is admitted, and return the seconds it waited."""
+        started = time.monotonic()
+        entry = (
+            started - priority * self.aging_interval if self.priority else 0.0,
+            next(self._counter),
+        )
+        with self._condition:
+            state = self._get_state(work_group)
+            heapq.heappush(state.queue, entry)
+            try:
+                while state.queue[0] is not entry or state.in_flight >= int(
+                    state.limit
+                ):
+                    remaining = (
+                        timeout - (time.monotonic() - started)
+                        if timeout is not None
+                        else None
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise QueryTimeoutError(
+                            "Timed out waiting for the admission of the query."
+                        )
+                    self._condition.wait(remaining)
+            except BaseException:
+                state.queue.remove(entry)
+                heapq.heapify(state.queue)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(state.queue)
+            state.in_flight += 1
+            waited = time.monotonic() - started
+            state.admitted += 1
+            state.total_wait += waited
+            state.max_wait = max(state.max_wait, waited)
+            # The next query in the queue may also be admitted.
+            self._condition.notify_all()
+        return waited
+
+    def release(self, work_group: Optional[str]) -> None:
+        with self._condition:
+            state = self._get_state(work_group)
+            state.in_flight = max(state.in_flight - 1, 0)
+            self._condition.notify_all()
+
+    def record_success(self, work_group: Optional[str]) -> None:
+        """Increase the limit by one for every ``limit`` queries started successfully."""
+        with self._condition:
+            state = self._get_state(work_group)
+            state.limit = min(state.limit + 1 / state.limit, self.max_limit)
+            self._condition.notify_all()
+
+    def record_throttle(self, work_group: Optional[str]) -> None:
+        with self._condition:
+            state = self._get_state(work_group)
+            state.throttled += 1
+            state.limit = max(state.limit * self.decrease_factor, self.min_limit)
+            _logger.warning(
+                "StartQueryExecution is throttled, the limit of the running queries "
+                "is decreased to %d.",
+                int(state.limit),
+            )
+
+    def is_throttled(self, error: Exception) -> bool:
+        code = getattr(error, "response", {}).get("Error", {}).get("Code", None)
+        return code in self.throttling_exceptions
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._condition:
+            return {
+                work_group: {
+                    "limit": int(state.limit),
+                    "in_flight": state.in_flight,
+                    "queued": len(state.queue),
+                    "admitted": state.admitted,
+                    "throttled": state.throttled,
+                    "total_wait": state.total_wait,
+                    "max_wait": state.max_wait,
+                    "avg_wait": state.total_wait / state.admitted
+                    if state.admitted
+                    else 0.0,
+                }
+                for work_group, state in self._states.items()
+            }
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import functools
+import logging
+from concurrent.futures.thread import ThreadPoolExecutor
+from multiprocessing import cpu_count
+from typing import Callable, TypeVar
+
+from pyathena.aio.cursor import AioCursor
+from pyathena.connection import Connection
+
+_logger = logging.getLogger(__name__)  # type: ignore
+_T = TypeVar("_T")
+
+
+class AioConnection(Connection):
+    """Connection for asyncio.
+
+    The blocking calls of the API are run in a thread pool of ``max_workers``
+    threads shared by the cursors of the connection, so the number of threads
+    does not grow with the number of the running queries."""
+
+    def __init__(self, max_workers: int = (cpu_count() or 1) * 5, **kwargs) -> None:
+        kwargs.setdefault("cursor_class", AioCursor)
+        super(AioConnection, self).__init__(**kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._ensure_max_pool_connections(max_workers)
+
+    async def run_in_executor(self, fn: Callable[..., _T], *args, **kwargs) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        super(AioConnection, self).close()
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+
+from pyathena.common import BaseCursor, CursorIterator
+from pyathena.converter import Converter
+from pyathena.error import OperationalError, ProgrammingError, QueryTimeoutError
+from pyathena.formatter import Formatter
+from pyathena.model import AthenaQueryExecution
+from pyathena.polling import PollingStrategy
+from pyathena.result_set import AthenaResultSet, WithResultSet
+from pyathena.util import RetryConfig
+
+if TYPE_CHECKING:
+    from pyathena.aio.connection import AioConnection
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class AioCursor(BaseCursor, WithResultSet):
+    """Cursor for asyncio.
+
+    The state of the query execution is polled with ``asyncio.sleep`` in between,
+    and the calls of the API are run in the thread pool of the connection."""
+
+    def __init__(
+        self,
+        connection: "AioConnection",
+        s3_staging_dir: str,
+        poll_interval: float,
+        encryption_option: str,
+        kms_key: str,
+        converter: Converter,
+        formatter: Formatter,
+        retry_config: RetryConfig,
+        schema_name: Optional[str] = None,
+        catalog_name: Optional[str] = None,
+        work_group: Optional[str] = None,
+        arraysize: int = CursorIterator.DEFAULT_FETCH_SIZE,
+        kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+    ) -> None:
+        super(AioCursor, self).__init__(
+            connection=connection,
+            s3_staging_dir=s3_staging_dir,
+            poll_interval=poll_interval,
+            encryption_option=encryption_option,
+            kms_key=kms_key,
+            converter=converter,
+            formatter=formatter,
+            retry_config=retry_config,
+            schema_name=schema_name,
+            catalog_name=catalog_name,
+            work_group=work_group,
+            kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
+        )
+        self._aio_connection = connection
+        self._arraysize = arraysize
+        self._query_id: Optional[str] = None
+        self._result_set: Optional[AthenaResultSet] = None
+
+    @property
+    def arraysize(self) -> int:
+        return self._arraysize
+
+    @arraysize.setter
+    def arraysize(self, value: int) -> None:
+        if value <= 0 or value > CursorIterator.DEFAULT_FETCH_SIZE:
+            raise ProgrammingError(
+                "MaxResults is more than maximum allowed length {0}.".format(
+                    CursorIterator.DEFAULT_FETCH_SIZE
+                )
+            )
+        self._arraysize = value
+
+    @property
+    def result_set(self) -> Optional[AthenaResultSet]:
+        return self._result_set
+
+    @result_set.setter
+    def result_set(self, val) -> None:
+        self._result_set = val
+
+    @property
+    def query_id(self) -> Optional[str]:
+        return self._query_id
+
+    @query_id.setter
+    def query_id(self, val) -> None:
+        self._query_id = val
+
+    @property
+    def rownumber(self) -> Optional[int]:
+        return self.result_set.rownumber if self.result_set else None
+
+    @property
+    def rowcount(self) -> int:
+        return -1
+
+    def close(self) -> None:
+        if self.result_set and not self.result_set.is_closed:
+            self.result_set.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def _poll_async(
+        self, query_id: str, deadline: Optional[float] = None
+    ) -> AthenaQueryExecution:
+        started = time.monotonic()
+        attempt = 0
+        try:
+            while True:
+                query_execution = await self._aio_connection.run_in_executor(
+                    self._get_query_execution, query_id
+                )
+                if query_execution.state in [
+                    AthenaQueryExecution.STATE_SUCCEEDED,
+                    AthenaQueryExecution.STATE_FAILED,
+                    AthenaQueryExecution.STATE_CANCELLED,
+                ]:
+                    self._record_query_execution(query_execution)
+                    return query_execution
+                now = time.monotonic()
+                interval = self._polling_strategy.get_interval(
+                    attempt, now - started, query_execution
+                )
+                if deadline is not None:
+                    if now >= deadline:
+                        _logger.warning("Query canceled by timeout.")
+                        await self._aio_connection.run_in_executor(
+                            self._cancel, query_id
+                        )
+                        raise QueryTimeoutError(
+                            "Query {0} did not finish by the deadline.".format(query_id)
+                        )
+                    interval = min(interval, deadline - now)
+                await asyncio.sleep(interval)
+                attempt += 1
+        except asyncio.CancelledError:
+            if self._kill_on_interrupt:
+                _logger.warning("Query canceled by task cancellation.")
+                await self._aio_connection.run_in_executor(self._cancel, query_id)
+            raise
+        finally:
+            self._release_admission(query_id)
+
+    async def execute(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        work_group: Optional[str] = None,
+        s3_staging_dir: Optional[str] = None,
+        cache_size: int = 0,
+        cache_expiration_time: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
+    ):
+        self._reset_state()
+        query_deadline = self._get_deadline(timeout, deadline)
+        self.query_id = await self._aio_connection.run_in_executor(
+            self._execute,
+            operation,
+            parameters=parameters,
+            work_group=work_group,
+            s3_staging_dir=s3_staging_dir,
+            cache_size=cache_size,
+            cache_expiration_time=cache_expiration_time,
+            deadline=query_deadline,
+            prepare=prepare,
+        )
+        query_execution = await self._poll_async(self.query_id, query_deadline)
+        if query_execution.state != AthenaQueryExecution.STATE_SUCCEEDED:
+            raise OperationalError(query_execution.state_change_reason)
+        self.result_set = await self._aio_connection.run_in_executor(
+            AthenaResultSet,
+            self._connection,
+            self._converter,
+            query_execution,
+            self.arraysize,
+            self._retry_config,
+        )
+        return self
+
+    async def executemany(
+        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
+    ):
+        for parameters in seq_of_parameters:
+            await self.execute(operation, parameters)
+        # Operations that have result sets are not allowed with executemany.
+        self._reset_state()
+
+    async def cancel(self) -> None:
+        if not self.query_id:
+            raise ProgrammingError("QueryExecutionId is none or empty.")
+        await self._aio_connection.run_in_executor(self._cancel, self.query_id)
+
+    def _get_result_set(self) -> AthenaResultSet:
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        return cast(AthenaResultSet, self.result_set)
+
+    @staticmethod
+    def _is_buffered(result_set: AthenaResultSet, size: Optional[int]) -> bool:
+        # The rows of the current page are fetched without calling the API.
+        return not result_set._next_token or (
+            size is not None and len(result_set._rows) >= size
+        )
+
+    async def fetchone(self):
+        result_set = self._get_result_set()
+        if self._is_buffered(result_set, 1):
+            return result_set.fetchone()
+        return await self._aio_connection.run_in_executor(result_set.fetchone)
+
+    async def fetchmany(self, size: Optional[int] = None):
+        result_set = self._get_result_set()
+        if self._is_buffered(
+            result_set, size if size and size > 0 else result_set.arraysize
+        ):
+            return result_set.fetchmany(size)
+        return await self._aio_connection.run_in_executor(result_set.fetchmany, size)
+
+    async def fetchall(self):
+        result_set = self._get_result_set()
+        if self._is_buffered(result_set, None):
+            return result_set.fetchall()
+        return await self._aio_connection.run_in_executor(result_set.fetchall)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration
+        return row
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+import logging
+from concurrent.futures import Future
+from multiprocessing import cpu_count
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from pyathena.arrow.result_set import AthenaArrowResultSet
+from pyathena.async_cursor import AsyncCursor
+from pyathena.common import CursorIterator
+from pyathena.converter import Converter
+from pyathena.executor import PriorityThreadPoolExecutor
+from pyathena.formatter import Formatter
+from pyathena.model import AthenaQueryExecution
+from pyathena.polling import PollingStrategy
+from pyathena.util import RetryConfig
+
+if TYPE_CHECKING:
+    from pyathena.connection import Connection
+    from pyathena.result_set import AthenaResultSet
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class AsyncArrowCursor(AsyncCursor):
+    def __init__(
+        self,
+        connection: "Connection",
+        s3_staging_dir: str,
+        poll_interval: float,
+        encryption_option: str,
+        kms_key: str,
+        converter: Converter,
+        formatter: Formatter,
+        retry_config: RetryConfig,
+        schema_name: Optional[str],
+        catalog_name: Optional[str],
+        work_group: Optional[str],
+        max_workers: int = (cpu_count() or 1) * 5,
+        arraysize: int = CursorIterator.DEFAULT_FETCH_SIZE,
+        kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        aging_interval: float = PriorityThreadPoolExecutor.DEFAULT_AGING_INTERVAL,
+        block_size: Optional[int] = None,
+        use_threads: bool = True,
+        download_max_workers: int = AthenaArrowResultSet.DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = AthenaArrowResultSet.DEFAULT_DOWNLOAD_PART_SIZE,
+        unload: bool = False,
+    ) -> None:
+        super(AsyncArrowCursor, self).__init__(
+            connection=connection,
+            s3_staging_dir=s3_staging_dir,
+            poll_interval=poll_interval,
+            encryption_option=encryption_option,
+            kms_key=kms_key,
+            converter=converter,
+            formatter=formatter,
+            retry_config=retry_config,
+            max_workers=max_workers,
+            arraysize=arraysize,
+            schema_name=schema_name,
+            catalog_name=catalog_name,
+            work_group=work_group,
+            kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
+            aging_interval=aging_interval,
+        )
+        self._block_size = block_size
+        self._use_threads = use_threads
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload = unload
+
+    def _collect_result_set(
+        self,
+        query_execution: AthenaQueryExecution,
+        unload_location: Optional[str] = None,
+    ) -> AthenaArrowResultSet:
+        return AthenaArrowResultSet(
+            connection=self._connection,
+            converter=self._converter,
+            query_execution=query_execution,
+            arraysize=self._arraysize,
+            retry_config=self._retry_config,
+            block_size=self._block_size,
+            use_threads=self._use_threads,
+            download_max_workers=self._download_max_workers,
+            download_part_size=self._download_part_size,
+            unload_location=unload_location,
+        )
+
+    def execute(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        work_group: Optional[str] = None,
+        s3_staging_dir: Optional[str] = None,
+        cache_size: int = 0,
+        cache_expiration_time: int = 0,
+        *,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
+    ) -> Tuple[str, "Future[Union[AthenaResultSet, AthenaArrowResultSet]]"]:
+        query_deadline = self._get_deadline(timeout, deadline)
+        unload_location = None
+        if self._unload:
+            operation, unload_location = self._prepare_unload(operation, s3_staging_dir)
+        query_id = self._execute(
+            operation,
+            parameters=parameters,
+            work_group=work_group,
+            s3_staging_dir=s3_staging_dir,
+            cache_size=cache_size,
+            cache_expiration_time=cache_expiration_time,
+            priority=priority,
+            deadline=query_deadline,
+            prepare=prepare,
+        )
+        return (
+            query_id,
+            self._submit(
+                query_id,
+                self._collect_result_set,
+                unload_location,
+                priority=priority,
+                deadline=query_deadline,
+                kill_on_cancel=True,
+            ),
+        )
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+
+from pyathena.arrow.result_set import AthenaArrowResultSet
+from pyathena.common import CursorIterator
+from pyathena.converter import Converter
+from pyathena.cursor import BaseCursor
+from pyathena.error import OperationalError, ProgrammingError
+from pyathena.formatter import Formatter
+from pyathena.model import AthenaQueryExecution
+from pyathena.polling import PollingStrategy
+from pyathena.result_set import WithResultSet
+from pyathena.util import RetryConfig, synchronized
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pyarrow import Table
+
+    from pyathena.connection import Connection
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class ArrowCursor(BaseCursor, CursorIterator, WithResultSet):
+    def __init__(
+        self,
+        connection: "Connection",
+        s3_staging_dir: str,
+        schema_name: str,
+        work_group: str,
+        poll_interval: float,
+        encryption_option: str,
+        kms_key: str,
+        converter: Converter,
+        formatter: Formatter,
+        retry_config: RetryConfig,
+        kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        block_size: Optional[int] = None,
+        use_threads: bool = True,
+        download_max_workers: int = AthenaArrowResultSet.DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = AthenaArrowResultSet.DEFAULT_DOWNLOAD_PART_SIZE,
+        unload: bool = False,
+        **kwargs,
+    ) -> None:
+        super(ArrowCursor, self).__init__(
+            connection=connection,
+            s3_staging_dir=s3_staging_dir,
+            schema_name=schema_name,
+            work_group=work_group,
+            poll_interval=poll_interval,
+            encryption_option=encryption_option,
+            kms_key=kms_key,
+            converter=converter,
+            formatter=formatter,
+            retry_config=retry_config,
+            kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
+            **kwargs,
+        )
+        self._query_id: Optional[str] = None
+        self._result_set: Optional[AthenaArrowResultSet] = None
+        self._block_size = block_size
+        self._use_threads = use_threads
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload = unload
+
+    @property  # type: ignore
+    def result_set(self) -> Optional[AthenaArrowResultSet]:
+        return self._result_set
+
+    @result_set.setter
+    def result_set(self, val) -> None:
+        self._result_set = val
+
+    @property
+    def query_id(self) -> Optional[str]:
+        return self._query_id
+
+    @query_id.setter
+    def query_id(self, val) -> None:
+        self._query_id = val
+
+    @property
+    def rownumber(self) -> Optional[int]:
+        return self.result_set.rownumber if self.result_set else None
+
+    def close(self) -> None:
+        if self.result_set and not self.result_set.is_closed:
+            self.result_set.close()
+
+    @synchronized
+    def execute(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        work_group: Optional[str] = None,
+        s3_staging_dir: Optional[str] = None,
+        cache_size: int = 0,
+        cache_expiration_time: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
+    ):
+        self._reset_state()
+        query_deadline = self._get_deadline(timeout, deadline)
+        unload_location = None
+        if self._unload:
+            operation, unload_location = self._prepare_unload(operation, s3_staging_dir)
+        self.query_id = self._execute(
+            operation,
+            parameters=parameters,
+            work_group=work_group,
+            s3_staging_dir=s3_staging_dir,
+            cache_size=cache_size,
+            cache_expiration_time=cache_expiration_time,
+            deadline=query_deadline,
+            prepare=prepare,
+        )
+        query_execution = self._poll(self.query_id, query_deadline)
+        if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
+            self.result_set = AthenaArrowResultSet(
+                connection=self._connection,
+                converter=self._converter,
+                query_execution=query_execution,
+                arraysize=self.arraysize,
+                retry_config=self._retry_config,
+                block_size=self._block_size,
+                use_threads=self._use_threads,
+                download_max_workers=self._download_max_workers,
+                download_part_size=self._download_part_size,
+                unload_location=unload_location,
+            )
+        else:
+            raise OperationalError(query_execution.state_change_reason)
+        return self
+
+    def executemany(
+        self,
+        operation: str,
+        seq_of_parameters: List[Optional[Dict[str, Any]]],
+        concurrency: int = BaseCursor.DEFAULT_EXECUTEMANY_CONCURRENCY,
+    ) -> None:
+        # Operations that have result sets are not allowed with executemany.
+        self._reset_state()
+        self._execute_many(operation, seq_of_parameters, concurrency)
+
+    def cancel(self) -> None:
+        # Not synchronized, so that the query polled by execute can be canceled.
+        if not self.query_id:
+            raise ProgrammingError("QueryExecutionId is none or empty.")
+        self._cancel(self.query_id)
+
+    @synchronized
+    def fetchone(self):
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.fetchone()
+
+    @synchronized
+    def fetchmany(self, size: Optional[int] = None):
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.fetchmany(size)
+
+    @synchronized
+    def fetchall(self):
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.fetchall()
+
+    @synchronized
+    def as_arrow(self) -> "Table":
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.as_arrow()
+
+    @synchronized
+    def as_pandas(self, **kwargs) -> "DataFrame":
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.as_pandas(**kwargs)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+import logging
+from multiprocessing import cpu_count
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
+
+from pyathena.arrow.util import read_parquet, to_column_info
+from pyathena.converter import Converter
+from pyathena.error import OperationalError, ProgrammingError
+from pyathena.model import AthenaQueryExecution
+from pyathena.result_set import AthenaResultSet
+from pyathena.util import RetryConfig, get_object, parse_output_location
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pyarrow import Schema, Table
+
+    from pyathena.connection import Connection
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class AthenaArrowResultSet(AthenaResultSet):
+
+    DEFAULT_DOWNLOAD_MAX_WORKERS: int = min(32, (cpu_count() or 1) + 4)
+    DEFAULT_DOWNLOAD_PART_SIZE: int = 1024 * 1024 * 16
+
+    def __init__(
+        self,
+        connection: "Connection",
+        converter: Converter,
+        query_execution: AthenaQueryExecution,
+        arraysize: int,
+        retry_config: RetryConfig,
+        block_size: Optional[int] = None,
+        use_threads: bool = True,
+        download_max_workers: int = DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+        unload_location: Optional[str] = None,
+    ) -> None:
+        super(AthenaArrowResultSet, self).__init__(
+            connection=connection,
+            converter=converter,
+            query_execution=query_execution,
+            arraysize=1,  # Fetch one row to retrieve metadata
+            retry_config=retry_config,
+        )
+        self._arraysize = arraysize
+        self._block_size = block_size
+        self._use_threads = use_threads
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload_location = unload_location
+        self._client = connection.get_client(
+            "s3", max_pool_connections=self._download_max_workers
+        )
+        if self.state == AthenaQueryExecution.STATE_SUCCEEDED and self._unload_location:
+            self._table = self._read_unload()
+        elif (
+            self.state == AthenaQueryExecution.STATE_SUCCEEDED
+            and self.output_location
+            and self.output_location.endswith((".csv", ".txt"))
+        ):
+            self._table = self._as_arrow()
+        else:
+            self._table = self._schema.empty_table()
+        self._offset = 0
+        self._rows.clear()
+        self._next_token = self.output_location if self._table.num_rows else None
+
+    def _read_unload(self) -> "Table":
+        """Read the Parquet files written by the UNLOAD statement.
+
+        The description is taken from the schema of the files."""
+        locations = self._get_unload_locations(
+            self._client, cast(str, self._unload_location)
+        )
+        try:
+            table = read_parquet(
+                self._client,
+                locations,
+                max_workers=self._download_max_workers,
+                config=self._retry_config,
+                logger=_logger,
+            )
+        except Exception as e:
+            _logger.exception("Failed to read parquet.")
+            raise OperationalError(*e.args) from e
+        self._meta_data = to_column_info(table.schema)
+        # The values are already typed by Parquet.
+        self._decoders = tuple(None for _ in self._meta_data)
+        return table
+
+    @property
+    def _schema(self) -> "Schema":
+        import pyarrow as pa
+
+        description = self.description if self.description else []
+        return pa.schema(
+            [(d[0], self._column_types.get(d[0], pa.string())) for d in description]
+        )
+
+    @property
+    def _column_types(self) -> Dict[Optional[Any], Any]:
+        import pyarrow as pa
+
+        description = self.description if self.description else []
+        column_types = {
+            d[0]: self._converter.types[d[1]]
+            for d in description
+            if d[1] in self._converter.types
+        }
+        column_types.update(
+            {
+                d[0]: pa.decimal128(d[4], d[5])
+                for d in description
+                if d[1] == "decimal" and d[4]
+            }
+        )
+        return column_types
+
+    def _as_arrow(self) -> "Table":
+        from pyarrow import csv
+
+        if not self.output_location:
+            raise ProgrammingError("OutputLocation is none or empty.")
+        bucket, key = parse_output_location(self.output_location)
+        try:
+            length, body = get_object(
+                self._client,
+                bucket,
+                key,
+                max_workers=self._download_max_workers,
+                part_size=self._download_part_size,
+                config=self._retry_config,
+                logger=_logger,
+            )
+        except Exception as e:
+            _logger.exception("Failed to download csv.")
+            raise OperationalError(*e.args) from e
+        else:
+            if not length:  # Allow empty response
+                body.close()
+                return self._schema.empty_table()
+            description = self.description if self.description else []
+            names = [d[0] for d in description]
+            if self.output_location.endswith(".txt"):
+                read_options = csv.ReadOptions(column_names=names)
+                parse_options = csv.ParseOptions(
+                    delimiter="\t", quote_char=False, ignore_empty_lines=False
+                )
+            else:  # csv format
+                # Skip the header row, column names are taken from the metadata.
+                read_options = csv.ReadOptions(skip_rows=1, column_names=names)
+                # A row with a single NULL column is an empty line.
+                parse_options = csv.ParseOptions(ignore_empty_lines=False)
+            read_options.use_threads = self._use_threads
+            if self._block_size:
+                read_options.block_size = self._block_size
+            convert_options = csv.ConvertOptions(
+                column_types=self._column_types,
+                null_values=[""],
+                strings_can_be_null=True,
+                # Athena quotes every value except NULL.
+                quoted_strings_can_be_null=False,
+            )
+            try:
+                table: "Table" = csv.read_csv(
+                    body,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                )
+            except Exception as e:
+                _logger.exception("Failed to read csv.")
+                raise OperationalError(*e.args) from e
+            finally:
+                body.close()
+            return table
+
+    def _fetch_page(
+        self, next_token: Optional[str]
+    ) -> Tuple[
+        List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]], Optional[str]
+    ]:
+        table = self._table.slice(self._offset, self._arraysize)
+        self._offset += table.num_rows
+        columns = [
+            [decoder(v) for v in values] if decoder else values
+            for decoder, values in zip(
+                self._decoders, (column.to_pylist() for column in table.columns)
+            )
+        ]
+        rows = cast(
+            List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]],
+            list(zip(*columns)),
+        )
+        if self._offset >= self._table.num_rows:
+            return rows, None
+        return rows, next_token
+
+    def as_arrow(self) -> "Table":
+        return self._table
+
+    def as_pandas(self, **kwargs) -> "DataFrame":
+        # Avoid consolidating the columns into blocks, so that numeric columns
+        # without nulls can be converted without copying.
+        kwargs.setdefault("split_blocks", True)
+        df: "DataFrame" = self._table.to_pandas(**kwargs)
+        return df
+
+    def close(self) -> None:
+        super(AthenaArrowResultSet, self).close()
+        self._table = self._schema.empty_table()
+        self._offset = 0
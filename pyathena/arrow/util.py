@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import logging
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from pyathena.util import RetryConfig, parse_output_location, retry_api_call
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+    from pyarrow import DataType, Schema, Table
+
+
+def _to_athena_type(type_: "DataType") -> str:
+    import pyarrow as pa
+
+    if pa.types.is_boolean(type_):
+        return "boolean"
+    elif pa.types.is_int8(type_):
+        return "tinyint"
+    elif pa.types.is_int16(type_):
+        return "smallint"
+    elif pa.types.is_int32(type_):
+        return "integer"
+    elif pa.types.is_int64(type_):
+        return "bigint"
+    elif pa.types.is_float32(type_):
+        return "float"
+    elif pa.types.is_float64(type_):
+        return "double"
+    elif pa.types.is_decimal(type_):
+        return "decimal"
+    elif pa.types.is_timestamp(type_):
+        return "timestamp"
+    elif pa.types.is_date(type_):
+        return "date"
+    elif pa.types.is_binary(type_) or pa.types.is_large_binary(type_):
+        return "varbinary"
+    elif pa.types.is_list(type_) or pa.types.is_large_list(type_):
+        return "array"
+    elif pa.types.is_map(type_):
+        return "map"
+    elif pa.types.is_struct(type_):
+        return "row"
+    else:
+        return "varchar"
+
+
+def to_column_info(schema: "Schema") -> Tuple[Dict[str, Any], ...]:
+    """Build the Athena column metadata from the schema of the Parquet files."""
+    columns = []
+    for field in schema:
+        column = {
+            "Name": field.name,
+            "Type": _to_athena_type(field.type),
+            "Precision": getattr(field.type, "precision", 0),
+            "Scale": getattr(field.type, "scale", 0),
+            "Nullable": "NULLABLE" if field.nullable else "NOT_NULL",
+        }
+        columns.append(column)
+    return tuple(columns)
+
+
+def read_parquet(
+    client: "BaseClient",
+    locations: List[str],
+    max_workers: int,
+    config: RetryConfig,
+    logger: Optional[logging.Logger] = None,
+) -> "Table":
+    """Read the Parquet files concurrently and concatenate them into one table."""
+    import pyarrow as pa
+    from pyarrow import parquet as pq
+
+    def _read(location: str) -> "Table":
+        bucket, key = parse_output_location(location)
+        response = retry_api_call(
+            client.get_object,
+            config=config,
+            logger=logger,
+            Bucket=bucket,
+            Key=key,
+        )
+        try:
+            return pq.read_table(pa.BufferReader(response["Body"].read()))
+        finally:
+            response["Body"].close()
+
+    if not locations:
+        return pa.table({})
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(locations))) as executor:
+        tables = list(executor.map(_read, locations))
+    return pa.concat_tables(tables)
@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 import logging
+import sys
 from concurrent.futures import Future
-from concurrent.futures.thread import ThreadPoolExecutor
 from multiprocessing import cpu_count
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from pyathena.common import CursorIterator
 from pyathena.converter import Converter
 from pyathena.cursor import BaseCursor
-from pyathena.error import NotSupportedError, ProgrammingError
+from pyathena.error import ProgrammingError, QueryTimeoutError
+from pyathena.executor import PriorityThreadPoolExecutor
 from pyathena.formatter import Formatter
 from pyathena.model import AthenaQueryExecution
+from pyathena.polling import PollingStrategy
 from pyathena.result_set import AthenaDictResultSet, AthenaResultSet
 from pyathena.util import RetryConfig
 
@@ -19,6 +31,7 @@ if TYPE_CHECKING:
     from pyathena.pandas.result_set import AthenaPandasResultSet
 
 _logger = logging.getLogger(__name__)  # type: ignore
+_T = TypeVar("_T")
 
 
 class AsyncCursor(BaseCursor):
@@ -38,6 +51,9 @@ class AsyncCursor(BaseCursor):
         max_workers: int = (cpu_count() or 1) * 5,
         arraysize: int = CursorIterator.DEFAULT_FETCH_SIZE,
         kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        prefetch_pages: int = 0,
+        aging_interval: float = PriorityThreadPoolExecutor.DEFAULT_AGING_INTERVAL,
     ) -> None:
         super(AsyncCursor, self).__init__(
             connection=connection,
@@ -52,9 +68,14 @@ class AsyncCursor(BaseCursor):
             catalog_name=catalog_name,
             work_group=work_group,
             kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
         )
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._executor = PriorityThreadPoolExecutor(
+            max_workers=max_workers, aging_interval=aging_interval
+        )
+        connection._ensure_max_pool_connections(max_workers)
         self._arraysize = arraysize
+        self._prefetch_pages = prefetch_pages
         self._result_set_class = AthenaResultSet
 
     @property
@@ -75,7 +96,7 @@ class AsyncCursor(BaseCursor):
         self._executor.shutdown(wait=wait)
 
     def _description(
-        self, query_id: str
+        self, query_execution: AthenaQueryExecution
     ) -> Optional[
         List[
             Tuple[
@@ -89,7 +110,7 @@ class AsyncCursor(BaseCursor):
             ]
         ]
     ]:
-        result_set = self._collect_result_set(query_id)
+        result_set = self._collect_result_set(query_execution)
         return result_set.description
 
     def description(
@@ -109,22 +130,92 @@ class AsyncCursor(BaseCursor):
             ]\
         ]\
     ]":
-        return self._executor.submit(self._description, query_id)
+        return self._submit(query_id, self._description)
 
     def query_execution(self, query_id: str) -> "Future[AthenaQueryExecution]":
         return self._executor.submit(self._get_query_execution, query_id)
 
     def poll(self, query_id: str) -> "Future[AthenaQueryExecution]":
-        return self._executor.submit(self._poll, query_id)
+        def _poll(query_execution: AthenaQueryExecution) -> AthenaQueryExecution:
+            return query_execution
+
+        return self._submit(query_id, _poll)
+
+    def _submit(
+        self,
+        query_id: str,
+        fn: Callable[..., _T],
+        *args: Any,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        kill_on_cancel: bool = False,
+    ) -> "Future[_T]":
+        """Call the function with the final query execution in the executor.
+
+        The query execution is polled by the poller of the connection,
+        so no thread of the executor is used until the query finishes.
+        The functions of the finished queries are run in the order of the priority.
+        The query is canceled if it does not finish by the deadline,
+        or if the future is canceled and ``kill_on_cancel`` is True."""
+        future: "Future[_T]" = Future()
+
+        def _run(query_execution: AthenaQueryExecution) -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(query_execution, *args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        def _polled(polled: "Future[AthenaQueryExecution]") -> None:
+            self._release_admission(query_id)
+            try:
+                query_execution = polled.result()
+                self._record_query_execution(query_execution)
+                self._executor.submit_with_priority(priority, _run, query_execution)
+            except QueryTimeoutError as e:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+                _logger.warning("Query canceled by timeout.")
+                self._cancel_in_background(query_id)
+            except BaseException as e:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(e)
 
-    def _collect_result_set(self, query_id: str) -> AthenaResultSet:
-        query_execution = self._poll(query_id)
+        def _cancelled(f: "Future[_T]") -> None:
+            if f.cancelled():
+                _logger.warning("Query canceled by the cancellation of the future.")
+                self._cancel_in_background(query_id)
+
+        if kill_on_cancel:
+            future.add_done_callback(_cancelled)
+        try:
+            polled = self._connection.poller.submit(
+                query_id, self._polling_strategy, deadline
+            )
+        except BaseException:
+            self._release_admission(query_id)
+            raise
+        polled.add_done_callback(_polled)
+        return future
+
+    def _cancel_in_background(self, query_id: str) -> None:
+        try:
+            self._executor.submit_with_priority(sys.maxsize, self._cancel, query_id)
+        except RuntimeError:
+            # The executor has been shut down.
+            self._cancel(query_id)
+
+    def _collect_result_set(
+        self, query_execution: AthenaQueryExecution
+    ) -> AthenaResultSet:
         return self._result_set_class(
             connection=self._connection,
             converter=self._converter,
             query_execution=query_execution,
             arraysize=self._arraysize,
             retry_config=self._retry_config,
+            prefetch_pages=self._prefetch_pages,
         )
 
     def execute(
@@ -135,7 +226,13 @@ class AsyncCursor(BaseCursor):
         s3_staging_dir: Optional[str] = None,
         cache_size: int = 0,
         cache_expiration_time: int = 0,
+        *,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
     ) -> Tuple[str, "Future[Union[AthenaResultSet, AthenaPandasResultSet]]"]:
+        query_deadline = self._get_deadline(timeout, deadline)
         query_id = self._execute(
             operation,
             parameters=parameters,
@@ -143,13 +240,27 @@ class AsyncCursor(BaseCursor):
             s3_staging_dir=s3_staging_dir,
             cache_size=cache_size,
             cache_expiration_time=cache_expiration_time,
+            priority=priority,
+            deadline=query_deadline,
+            prepare=prepare,
+        )
+        return query_id, self._submit(
+            query_id,
+            self._collect_result_set,
+            priority=priority,
+            deadline=query_deadline,
+            kill_on_cancel=True,
         )
-        return query_id, self._executor.submit(self._collect_result_set, query_id)
 
     def executemany(
-        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
-    ):
-        raise NotSupportedError
+        self,
+        operation: str,
+        seq_of_parameters: List[Optional[Dict[str, Any]]],
+        concurrency: int = BaseCursor.DEFAULT_EXECUTEMANY_CONCURRENCY,
+    ) -> "Future[None]":
+        return self._executor.submit(
+            self._execute_many, operation, seq_of_parameters, concurrency
+        )
 
     def cancel(self, query_id: str) -> "Future[None]":
         return self._executor.submit(self._cancel, query_id)
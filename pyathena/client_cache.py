@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+import collections
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from botocore.client import BaseClient
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+# The session of the cache or the weak reference to the session of the key, and the client.
+_Entry = Tuple[Any, "BaseClient"]
+
+
+class ClientCache(object):
+    """Thread-safe cache of the boto3 clients shared by the connections.
+
+    The clients are keyed by the session, the service, the region, the endpoint,
+    the configuration and the size of the connection pool. The session is either
+    the boto3 session or the arguments of the session, e.g. the profile,
+    the credentials and the region. The clients of the arguments are created by
+    the session of the cache, which is only used under the lock of the cache,
+    as the sessions of boto3 are not thread-safe, and are shared by the connections
+    created with the same arguments. The clients of the boto3 session are shared by
+    the sessions of the same ``session_key``, e.g. the key of the credential cache,
+    or only by the same session if no key is given.
+    The least recently used entries are evicted when there are more than
+    ``max_size`` sessions or clients.
+
+    The clients can be used from multiple threads, but the sessions cannot,
+    so each connection has its own session, e.g. for the resources of boto3."""
+
+    DEFAULT_MAX_SIZE: int = 64
+    # https://botocore.amazonaws.com/v1/documentation/api/latest/reference/config.html
+    DEFAULT_MAX_POOL_CONNECTIONS: int = 10
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._sessions: "collections.OrderedDict[Tuple[Any, ...], Session]" = (
+            collections.OrderedDict()
+        )
+        self._clients: "collections.OrderedDict[Tuple[Any, ...], _Entry]" = (
+            collections.OrderedDict()
+        )
+
+    @staticmethod
+    def _get_key(value: Any) -> Any:
+        from botocore.config import Config
+
+        if isinstance(value, Config):
+            # The options can be dicts, e.g. retries.
+            return repr(sorted(value._user_provided_options.items()))
+        if isinstance(value, (str, int, float, bool, type(None))):
+            return value
+        # e.g. botocore_session, the session of the cache keeps a reference to the object.
+        return id(value)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sessions": len(self._sessions),
+            "clients": len(self._clients),
+        }
+
+    def _get_session(self, key: Any, session_kwargs: Dict[str, Any]) -> "Session":
+        from boto3.session import Session
+
+        session = self._sessions.get(key, None)
+        if session is None:
+            session = Session(**session_kwargs)
+            self._sessions[key] = session
+            while len(self._sessions) > self.max_size:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(key)
+        return session
+
+    def get_client(
+        self,
+        session: Union["Session", Dict[str, Any]],
+        service_name: str,
+        region_name: Optional[str] = None,
+        max_pool_connections: Optional[int] = None,
+        session_key: Optional[str] = None,
+        **kwargs
+    ) -> "BaseClient":
+        """Return the client of the service created by the session,
+        or by the session of the cache created with the arguments if they are given.
+
+        The clients of the boto3 session are shared by the sessions of
+        the same ``session_key``, which have the same credentials and the same
+        configuration. Without the key, the client is only returned for the same
+        session, which is referenced weakly, so its id can be reused by another one.
+
+        The connection pool of the client has at least ``max_pool_connections``
+        connections, or the number of the configuration if it is larger."""
+        from botocore.config import Config
+
+        config: Optional[Config] = kwargs.pop("config", None)
+        if max_pool_connections:
+            configured = (
+                config.max_pool_connections
+                if config and config.max_pool_connections
+                else self.DEFAULT_MAX_POOL_CONNECTIONS
+            )
+            if max_pool_connections > configured:
+                pool_config = Config(max_pool_connections=max_pool_connections)
+                config = config.merge(pool_config) if config else pool_config
+        if isinstance(session, dict):
+            cache_key: Any = ("kwargs",) + tuple(
+                (k, self._get_key(v)) for k, v in sorted(session.items())
+            )
+        elif session_key is not None:
+            cache_key = ("key", session_key)
+        else:
+            cache_key = ("id", id(session))
+        key = (cache_key, service_name, region_name, self._get_key(config)) + tuple(
+            (k, self._get_key(v)) for k, v in sorted(kwargs.items())
+        )
+        with self._lock:
+            entry = self._clients.get(key, None)
+            if (
+                entry is not None
+                and isinstance(entry[0], weakref.ref)
+                and entry[0]() is not session
+            ):
+                # The id of the session that has been garbage collected.
+                entry = None
+            if entry is None:
+                self.misses += 1
+                owner: Any = None
+                if isinstance(session, dict):
+                    # The entry keeps the session of the cache, and the objects of
+                    # the arguments referenced by it, so that their ids are not reused.
+                    session = self._get_session(cache_key, session)
+                    owner = session
+                elif session_key is None:
+                    owner = weakref.ref(session)
+                client = session.client(
+                    service_name, region_name=region_name, config=config, **kwargs
+                )
+                self._clients[key] = (owner, client)
+                while len(self._clients) > self.max_size:
+                    self._clients.popitem(last=False)
+                return client
+            self.hits += 1
+            self._clients.move_to_end(key)
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._clients.clear()
+
+
+# The cache shared by the connections of the process.
+default_client_cache = ClientCache()
@@ -1,19 +1,31 @@
 # -*- coding: utf-8 -*-
 import logging
+import random
 import sys
+import threading
 import time
+import uuid
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from pyathena.converter import Converter
-from pyathena.error import DatabaseError, OperationalError, ProgrammingError
+from pyathena.error import (
+    DatabaseError,
+    OperationalError,
+    ProgrammingError,
+    QueryTimeoutError,
+)
 from pyathena.formatter import Formatter
 from pyathena.model import AthenaQueryExecution, AthenaTableMetadata
+from pyathena.polling import BackoffPollingStrategy, PollingStrategy
 from pyathena.util import RetryConfig, retry_api_call
 
 if TYPE_CHECKING:
+    from pyathena.admission import AdmissionController
     from pyathena.connection import Connection
+    from pyathena.query_history import QueryHistory
 
 _logger = logging.getLogger(__name__)  # type: ignore
 
@@ -83,6 +95,8 @@ class BaseCursor(object, metaclass=ABCMeta):
     # https://docs.aws.amazon.com/athena/latest/APIReference/API_ListTableMetadata.html
     # Valid Range: Minimum value of 1. Maximum value of 50.
     LIST_TABLE_METADATA_MAX_RESULTS = 50
+    # Number of the queries running at the same time in executemany.
+    DEFAULT_EXECUTEMANY_CONCURRENCY = 20
 
     def __init__(
         self,
@@ -98,6 +112,7 @@ class BaseCursor(object, metaclass=ABCMeta):
         formatter: Formatter,
         retry_config: RetryConfig,
         kill_on_interrupt: bool,
+        polling_strategy: Optional[PollingStrategy] = None,
         **kwargs
     ) -> None:
         super(BaseCursor, self).__init__()
@@ -113,6 +128,18 @@ class BaseCursor(object, metaclass=ABCMeta):
         self._formatter = formatter
         self._retry_config = retry_config
         self._kill_on_interrupt = kill_on_interrupt
+        # Work groups of the queries admitted by the admission controller.
+        self._admitted_query_ids: Dict[str, Optional[str]] = dict()
+        self._polling_strategy = (
+            polling_strategy
+            if polling_strategy
+            else BackoffPollingStrategy(
+                initial_interval=min(
+                    poll_interval, BackoffPollingStrategy.DEFAULT_INITIAL_INTERVAL
+                ),
+                max_interval=poll_interval,
+            )
+        )
 
     @property
     def connection(self) -> "Connection":
@@ -233,7 +260,27 @@ class BaseCursor(object, metaclass=ABCMeta):
                 for r in response.get("TableMetadataList", [])
             ]
 
-    def __poll(self, query_id: str) -> AthenaQueryExecution:
+    @staticmethod
+    def _get_deadline(
+        timeout: Optional[float] = None, deadline: Optional[float] = None
+    ) -> Optional[float]:
+        """Return the earlier of the timeout and the deadline in the monotonic clock.
+
+        The timeout is in seconds from now, and the deadline is in seconds
+        since the epoch, e.g. ``time.time() + 30``."""
+        now = time.monotonic()
+        deadlines = []
+        if timeout is not None:
+            deadlines.append(now + timeout)
+        if deadline is not None:
+            deadlines.append(now + deadline - time.time())
+        return min(deadlines) if deadlines else None
+
+    def __poll(
+        self, query_id: str, deadline: Optional[float] = None
+    ) -> AthenaQueryExecution:
+        attempt = 0
+        started = time.monotonic()
         while True:
             query_execution = self._get_query_execution(query_id)
             if query_execution.state in [
@@ -243,11 +290,24 @@ class BaseCursor(object, metaclass=ABCMeta):
             ]:
                 return query_execution
             else:
-                time.sleep(self._poll_interval)
-
-    def _poll(self, query_id: str) -> AthenaQueryExecution:
+                now = time.monotonic()
+                interval = self._polling_strategy.get_interval(
+                    attempt, now - started, query_execution
+                )
+                if deadline is not None:
+                    if now >= deadline:
+                        raise QueryTimeoutError(
+                            "Query {0} did not finish by the deadline.".format(query_id)
+                        )
+                    interval = min(interval, deadline - now)
+                time.sleep(interval)
+                attempt += 1
+
+    def _poll(
+        self, query_id: str, deadline: Optional[float] = None
+    ) -> AthenaQueryExecution:
         try:
-            query_execution = self.__poll(query_id)
+            query_execution = self.__poll(query_id, deadline)
         except KeyboardInterrupt as e:
             if self._kill_on_interrupt:
                 _logger.warning("Query canceled by user.")
@@ -255,8 +315,22 @@ class BaseCursor(object, metaclass=ABCMeta):
                 query_execution = self.__poll(query_id)
             else:
                 raise e
+        except QueryTimeoutError:
+            _logger.warning("Query canceled by timeout.")
+            self._cancel(query_id)
+            raise
+        finally:
+            self._release_admission(query_id)
+        self._record_query_execution(query_execution)
         return query_execution
 
+    def _record_query_execution(self, query_execution: AthenaQueryExecution) -> None:
+        """Record the query execution that has reached the final state."""
+        self._polling_strategy.record(query_execution)
+        query_history = self._connection.query_history
+        if query_history:
+            query_history.add(query_execution)
+
     def _build_start_query_execution_request(
         self,
         query: str,
@@ -349,6 +423,15 @@ class BaseCursor(object, metaclass=ABCMeta):
             )
         else:
             expiration_time = datetime.now(timezone.utc)
+        query_history = self._connection.query_history
+        if query_history and cache_size > 0:
+            return self._find_previous_query_id_from_history(
+                query_history,
+                query,
+                work_group,
+                cache_size,
+                expiration_time if cache_expiration_time > 0 else None,
+            )
         try:
             next_token = None
             while cache_size > 0:
@@ -387,6 +470,219 @@ class BaseCursor(object, metaclass=ABCMeta):
             )
         return query_id
 
+    def _find_previous_query_id_from_history(
+        self,
+        query_history: "QueryHistory",
+        query: str,
+        work_group: Optional[str],
+        cache_size: int,
+        expiration_time: Optional[datetime],
+    ) -> Optional[str]:
+        work_group = work_group if work_group else self._work_group
+        try:
+            if query_history.needs_sync(work_group):
+                self._sync_query_history(
+                    query_history, work_group, cache_size, expiration_time
+                )
+        except Exception:
+            _logger.warning(
+                "Failed to sync the query history. Moving on with the local history.",
+                exc_info=True,
+            )
+        return query_history.get(
+            query,
+            work_group,
+            expiration_time,
+            # Only the expiration time is checked if cache_size is not specified.
+            cache_size if cache_size != sys.maxsize else None,
+        )
+
+    def _sync_query_history(
+        self,
+        query_history: "QueryHistory",
+        work_group: Optional[str],
+        cache_size: int,
+        expiration_time: Optional[datetime],
+    ) -> None:
+        """Add the query executions listed since the last sync to the query history.
+
+        The executions are listed from the newest one, up to the marker of the last sync,
+        ``cache_size`` executions or the expiration time. The new marker is the newest
+        execution older than any execution that has not finished yet,
+        so that those are listed again by the next sync."""
+        marker = query_history.get_marker(work_group)
+        new_marker: Optional[str] = None
+        listed: List[AthenaQueryExecution] = []
+        next_token = None
+        while cache_size > 0:
+            max_results = min(cache_size, self.LIST_QUERY_EXECUTIONS_MAX_RESULTS)
+            cache_size -= max_results
+            request = self._build_list_query_executions_request(
+                max_results=max_results, work_group=work_group, next_token=next_token
+            )
+            try:
+                response = retry_api_call(
+                    self.connection.client.list_query_executions,
+                    config=self._retry_config,
+                    logger=_logger,
+                    **request
+                )
+            except Exception as e:
+                _logger.exception("Failed to list query executions.")
+                raise OperationalError(*e.args) from e
+            next_token = response.get("NextToken", None)
+            query_ids = response.get("QueryExecutionIds", [])
+            reached_marker = marker in query_ids
+            if reached_marker:
+                query_ids = query_ids[: query_ids.index(marker)]
+            query_executions = (
+                {e.query_id: e for e in self._batch_get_query_execution(query_ids)}
+                if query_ids
+                else {}
+            )
+            expired = False
+            for query_id in query_ids:
+                query_execution = query_executions.get(query_id, None)
+                if not query_execution:
+                    continue
+                if query_execution.state in [
+                    AthenaQueryExecution.STATE_QUEUED,
+                    AthenaQueryExecution.STATE_RUNNING,
+                ]:
+                    new_marker = None
+                    continue
+                if not new_marker:
+                    new_marker = query_id
+                listed.append(query_execution)
+                if (
+                    expiration_time
+                    and query_execution.completion_date_time
+                    and query_execution.completion_date_time.astimezone(timezone.utc)
+                    < expiration_time
+                ):
+                    expired = True
+                    break
+            if reached_marker or expired or next_token is None:
+                break
+        # The executions are listed from the newest one, and added from the oldest one,
+        # as the query history counts the executions in the order they are added.
+        for query_execution in reversed(listed):
+            query_history.add(query_execution)
+        query_history.set_marker(work_group, new_marker)
+
+    @staticmethod
+    def _is_select(operation: str) -> bool:
+        return operation.strip().upper().startswith(("SELECT", "WITH"))
+
+    def _get_result_cache_key(
+        self,
+        operation: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        work_group: Optional[str] = None,
+    ) -> Optional[str]:
+        """Return the key of the query in the result cache of the connection.
+
+        None if the connection has no result cache or the query is not a SELECT statement."""
+        result_cache = self._connection.result_cache
+        if not result_cache or not self._is_select(operation):
+            return None
+        return result_cache.get_key(
+            self._formatter.format(operation, parameters),
+            self._catalog_name,
+            self._schema_name,
+            work_group if work_group else self._work_group,
+        )
+
+    def _prepare_unload(
+        self, operation: str, s3_staging_dir: Optional[str] = None
+    ) -> Tuple[str, Optional[str]]:
+        """Wrap the SELECT statement in UNLOAD to write the result as Parquet files.
+
+        Returns the operation and the location of the unloaded files,
+        the location is None if the operation is not a SELECT statement."""
+        if not self._is_select(operation):
+            return operation, None
+        s3_staging_dir = s3_staging_dir if s3_staging_dir else self._s3_staging_dir
+        if not s3_staging_dir:
+            raise ProgrammingError(
+                "If the unload option is used, s3_staging_dir is required."
+            )
+        if not s3_staging_dir.endswith("/"):
+            s3_staging_dir += "/"
+        unload_location = "{0}unload/{1}/{2}/".format(
+            s3_staging_dir,
+            datetime.now(timezone.utc).strftime("%Y%m%d"),
+            uuid.uuid4(),
+        )
+        unload = """UNLOAD (
+{0}
+)
+TO '{1}'
+WITH (
+    format = 'PARQUET',
+    compression = 'SNAPPY'
+)
+"""
+        operation = unload.format(operation.strip().rstrip(";"), unload_location)
+        return operation, unload_location
+
+    def _create_prepared_statement(
+        self, statement_name: str, statement: str, work_group: Optional[str]
+    ) -> None:
+        request = {
+            "StatementName": statement_name,
+            # The prepared statements always belong to a work group.
+            "WorkGroup": work_group if work_group else "primary",
+            "QueryStatement": statement,
+        }
+        try:
+            retry_api_call(
+                self._connection.client.create_prepared_statement,
+                config=self._retry_config,
+                logger=_logger,
+                **request
+            )
+        except Exception as e:
+            # The statement of the same name has been created by another connection,
+            # or by this one before it was evicted from the cache.
+            try:
+                retry_api_call(
+                    self._connection.client.update_prepared_statement,
+                    config=self._retry_config,
+                    logger=_logger,
+                    **request
+                )
+            except Exception:
+                _logger.exception("Failed to create prepared statement.")
+                raise OperationalError(*e.args) from e
+
+    def _format_prepared_statement(
+        self,
+        operation: str,
+        parameters: Dict[str, Any],
+        work_group: Optional[str] = None,
+    ) -> str:
+        """Return the query executing the prepared statement of the operation.
+
+        The statement is prepared in the work group once per distinct operation
+        that is not in the prepared statement cache of the connection,
+        so the query is the same every time it is executed with the same parameters."""
+        work_group = work_group if work_group else self._work_group
+        cache = self._connection.prepared_statement_cache
+        cached = cache.get(work_group, operation)
+        if cached:
+            statement_name, names = cached
+        else:
+            statement, names = self._formatter.prepare(operation)
+            statement_name = cache.get_name(statement)
+            self._create_prepared_statement(statement_name, statement, work_group)
+            cache.put(work_group, operation, statement_name, names)
+        if not names:
+            return "EXECUTE {0}".format(statement_name)
+        return "EXECUTE {0} USING {1}".format(
+            statement_name, self._formatter.format_arguments(names, parameters)
+        )
+
     def _execute(
         self,
         operation: str,
@@ -395,8 +691,14 @@ class BaseCursor(object, metaclass=ABCMeta):
         s3_staging_dir: Optional[str] = None,
         cache_size: int = 0,
         cache_expiration_time: int = 0,
+        priority: int = 0,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
     ) -> str:
-        query = self._formatter.format(operation, parameters)
+        if prepare and parameters is not None:
+            query = self._format_prepared_statement(operation, parameters, work_group)
+        else:
+            query = self._formatter.format(operation, parameters)
         _logger.debug(query)
 
         request = self._build_start_query_execution_request(
@@ -409,6 +711,15 @@ class BaseCursor(object, metaclass=ABCMeta):
             cache_expiration_time=cache_expiration_time,
         )
         if query_id is None:
+            admission_controller = self._connection.admission_controller
+            if admission_controller:
+                return self._start_admitted_query_execution(
+                    admission_controller,
+                    request,
+                    work_group if work_group else self._work_group,
+                    priority,
+                    deadline,
+                )
             try:
                 query_id = retry_api_call(
                     self._connection.client.start_query_execution,
@@ -421,6 +732,159 @@ class BaseCursor(object, metaclass=ABCMeta):
                 raise DatabaseError(*e.args) from e
         return query_id
 
+    def _start_admitted_query_execution(
+        self,
+        admission_controller: "AdmissionController",
+        request: Dict[str, Any],
+        work_group: Optional[str],
+        priority: int = 0,
+        deadline: Optional[float] = None,
+    ) -> str:
+        """Start the query once it is admitted by the admission controller.
+
+        The throttling of StartQueryExecution is not retried in retry_api_call,
+        it decreases the limit of the admission controller and the query waits
+        in the queue again, after a random delay to spread the retries."""
+        retry_config = RetryConfig(
+            exceptions=[
+                e
+                for e in self._retry_config.exceptions
+                if e not in admission_controller.throttling_exceptions
+            ],
+            attempt=self._retry_config.attempt,
+            multiplier=self._retry_config.multiplier,
+            max_delay=self._retry_config.max_delay,
+            exponential_base=self._retry_config.exponential_base,
+        )
+        attempt = 0
+        while True:
+            admission_controller.acquire(
+                work_group,
+                priority,
+                deadline - time.monotonic() if deadline is not None else None,
+            )
+            try:
+                query_id: str = retry_api_call(
+                    self._connection.client.start_query_execution,
+                    config=retry_config,
+                    logger=_logger,
+                    **request
+                ).get("QueryExecutionId", None)
+            except Exception as e:
+                admission_controller.release(work_group)
+                attempt += 1
+                if (
+                    admission_controller.is_throttled(e)
+                    and attempt < self._retry_config.attempt
+                ):
+                    admission_controller.record_throttle(work_group)
+                    delay = self._retry_config.multiplier * (
+                        self._retry_config.exponential_base ** attempt
+                    )
+                    time.sleep(
+                        random.uniform(0, min(delay, self._retry_config.max_delay))
+                    )
+                    continue
+                _logger.exception("Failed to execute query.")
+                raise DatabaseError(*e.args) from e
+            admission_controller.record_success(work_group)
+            self._admitted_query_ids[query_id] = work_group
+            return query_id
+
+    def _release_admission(self, query_id: str) -> None:
+        """Release the admission of the query that has been started by this cursor."""
+        try:
+            work_group = self._admitted_query_ids.pop(query_id)
+        except KeyError:
+            return
+        admission_controller = self._connection.admission_controller
+        if admission_controller:
+            admission_controller.release(work_group)
+
+    def _execute_many(
+        self,
+        operation: str,
+        seq_of_parameters: List[Optional[Dict[str, Any]]],
+        concurrency: int,
+    ) -> None:
+        """Execute the operation with each of the parameters concurrently.
+
+        The parameters are combined into fewer queries if the formatter supports it,
+        e.g. the multi-row INSERT INTO ... VALUES statements.
+        Up to ``concurrency`` queries run at the same time, and they are polled
+        together by the poller of the connection. All the statements are executed
+        even if some of them fail, and the failures are raised together at the end."""
+        if concurrency <= 0:
+            raise ProgrammingError("Concurrency must be greater than 0.")
+        self._connection._ensure_max_pool_connections(concurrency)
+        queries = self._formatter.format_many(operation, seq_of_parameters)
+        statements: Iterable[Tuple[int, int, str, Optional[Dict[str, Any]]]] = (
+            ((start, end, query, None) for start, end, query in queries)
+            if queries is not None
+            else ((i, i + 1, operation, p) for i, p in enumerate(seq_of_parameters))
+        )
+        semaphore = threading.BoundedSemaphore(concurrency)
+        poller = self._connection.poller
+        futures: List[Tuple[int, int, str, "Future[AthenaQueryExecution]"]] = []
+        errors: List[Tuple[int, int, Optional[str], str]] = []
+        count = 0
+
+        def _polled(query_id: str) -> Any:
+            def _release(_: "Future[AthenaQueryExecution]") -> None:
+                self._release_admission(query_id)
+                semaphore.release()
+
+            return _release
+
+        def _rows(start: int, end: int) -> str:
+            return str(start) if end - start == 1 else "{0}-{1}".format(start, end - 1)
+
+        try:
+            for start, end, query, parameters in statements:
+                count += 1
+                semaphore.acquire()
+                query_id: Optional[str] = None
+                try:
+                    query_id = self._execute(query, parameters)
+                    future = poller.submit(query_id, self._polling_strategy)
+                except Exception as e:
+                    if query_id:
+                        self._release_admission(query_id)
+                    semaphore.release()
+                    errors.append((start, end, query_id, str(e)))
+                    continue
+                future.add_done_callback(_polled(query_id))
+                futures.append((start, end, query_id, future))
+            for start, end, query_id, future in futures:
+                try:
+                    query_execution = future.result()
+                except Exception as e:
+                    errors.append((start, end, query_id, str(e)))
+                    continue
+                self._record_query_execution(query_execution)
+                if query_execution.state != AthenaQueryExecution.STATE_SUCCEEDED:
+                    errors.append(
+                        (start, end, query_id, str(query_execution.state_change_reason))
+                    )
+        except KeyboardInterrupt as e:
+            if self._kill_on_interrupt:
+                _logger.warning("Queries canceled by user.")
+                for _, _, query_id, future in futures:
+                    if not future.done():
+                        self._cancel(query_id)
+            raise e
+        if errors:
+            raise OperationalError(
+                "Failed to execute {0} of {1} statements:\n{2}".format(
+                    len(errors),
+                    count,
+                    "\n".join(
+                        "#{0} {1}: {2}".format(_rows(start, end), query_id, reason)
+                        for start, end, query_id, reason in sorted(errors)
+                    ),
+                )
+            )
+
     @abstractmethod
     def execute(
         self,
@@ -1,25 +1,36 @@
 # -*- coding: utf-8 -*-
 import logging
 import os
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
-
-from boto3.session import Session
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
 
+from pyathena.client_cache import ClientCache, default_client_cache
 from pyathena.common import BaseCursor
 from pyathena.converter import (
     Converter,
+    DefaultArrowTypeConverter,
     DefaultPandasTypeConverter,
     DefaultTypeConverter,
 )
 from pyathena.cursor import Cursor
 from pyathena.error import NotSupportedError
 from pyathena.formatter import DefaultParameterFormatter, Formatter
+from pyathena.poller import BatchPoller
+from pyathena.prepared_statement import PreparedStatementCache
 from pyathena.util import RetryConfig
 
 if TYPE_CHECKING:
+    from boto3.session import Session
     from botocore.client import BaseClient
 
+    from pyathena.admission import AdmissionController
+    from pyathena.credential_cache import CredentialCache
+    from pyathena.polling import PollingStrategy
+    from pyathena.query_history import QueryHistory
+    from pyathena.result_cache import ResultCache
+
 _logger = logging.getLogger(__name__)  # type: ignore
 
 
@@ -66,7 +77,14 @@ class Connection(object):
         retry_config: Optional[RetryConfig] = None,
         cursor_class: Type[BaseCursor] = Cursor,
         kill_on_interrupt: bool = True,
-        session: Optional[Session] = None,
+        session: Optional["Session"] = None,
+        result_cache: Optional["ResultCache"] = None,
+        query_history: Optional["QueryHistory"] = None,
+        polling_strategy: Optional["PollingStrategy"] = None,
+        admission_controller: Optional["AdmissionController"] = None,
+        prepared_statement_cache: Optional[PreparedStatementCache] = None,
+        client_cache: Optional[ClientCache] = None,
+        credential_cache: Optional["CredentialCache"] = None,
         **kwargs
     ) -> None:
         self._kwargs = {
@@ -95,12 +113,45 @@ class Connection(object):
         assert (
             self.s3_staging_dir or self.work_group
         ), "Required argument `s3_staging_dir` or `work_group` not found."
+        self._client_cache = client_cache if client_cache else default_client_cache
 
+        self._client_session: Union["Session", Dict[str, Any]]
+        # The key of the refreshable credentials of the credential cache, which also keys
+        # the clients of the session. The refreshable credentials are frozen to be passed
+        # to the other processes, e.g. by to_sql.
+        self._credential_cache_key: Optional[str] = None
         if session:
             self._session = session
+            self._client_session = session
+        elif role_arn and not serial_number and credential_cache:
+            # The credentials are refreshed without the MFA code.
+            self._credential_cache_key = credential_cache.get_key(
+                role_arn,
+                None,
+                self.profile_name,
+                self._kwargs.get("aws_access_key_id", None),
+                role_session_name,
+                duration_seconds,
+            )
+            self._session = credential_cache.get_session(
+                self._credential_cache_key,
+                partial(
+                    self._assume_role,
+                    profile_name=self.profile_name,
+                    region_name=self.region_name,
+                    role_arn=role_arn,
+                    role_session_name=role_session_name,
+                    serial_number=None,
+                    duration_seconds=duration_seconds,
+                ),
+                region_name=self.region_name,
+            )
+            self._client_session = self._session
+            self.profile_name = None
         else:
             if role_arn:
-                creds = self._assume_role(
+                fetch = partial(
+                    self._assume_role,
                     profile_name=self.profile_name,
                     region_name=self.region_name,
                     role_arn=role_arn,
@@ -108,6 +159,21 @@ class Connection(object):
                     serial_number=serial_number,
                     duration_seconds=duration_seconds,
                 )
+                creds = (
+                    credential_cache.get_credentials(
+                        credential_cache.get_key(
+                            role_arn,
+                            serial_number,
+                            self.profile_name,
+                            self._kwargs.get("aws_access_key_id", None),
+                            role_session_name,
+                            duration_seconds,
+                        ),
+                        fetch,
+                    )
+                    if credential_cache
+                    else fetch()
+                )
                 self.profile_name = None
                 self._kwargs.update(
                     {
@@ -117,12 +183,28 @@ class Connection(object):
                     }
                 )
             elif serial_number:
-                creds = self._get_session_token(
+                fetch = partial(
+                    self._get_session_token,
                     profile_name=self.profile_name,
                     region_name=self.region_name,
                     serial_number=serial_number,
                     duration_seconds=duration_seconds,
                 )
+                creds = (
+                    credential_cache.get_credentials(
+                        credential_cache.get_key(
+                            None,
+                            serial_number,
+                            self.profile_name,
+                            self._kwargs.get("aws_access_key_id", None),
+                            None,
+                            duration_seconds,
+                        ),
+                        fetch,
+                    )
+                    if credential_cache
+                    else fetch()
+                )
                 self.profile_name = None
                 self._kwargs.update(
                     {
@@ -131,17 +213,31 @@ class Connection(object):
                         "aws_session_token": creds["SessionToken"],
                     }
                 )
-            self._session = Session(
-                profile_name=self.profile_name, **self._session_kwargs
-            )
-        self._client = self._session.client(
-            "athena", region_name=self.region_name, **self._client_kwargs
-        )
+            from boto3.session import Session
+
+            session_kwargs = {"profile_name": self.profile_name, **self._session_kwargs}
+            self._session = Session(**session_kwargs)
+            # The clients are shared by the connections created with the same arguments.
+            self._client_session = session_kwargs
+        self._client = self.get_client("athena")
+        self._max_pool_connections = 0
+        self._client_lock = threading.Lock()
         self._converter = converter
         self._formatter = formatter if formatter else DefaultParameterFormatter()
         self._retry_config = retry_config if retry_config else RetryConfig()
         self.cursor_class = cursor_class
         self.kill_on_interrupt = kill_on_interrupt
+        self._result_cache = result_cache
+        self._query_history = query_history
+        self.polling_strategy = polling_strategy
+        self._admission_controller = admission_controller
+        self._prepared_statement_cache = (
+            prepared_statement_cache
+            if prepared_statement_cache
+            else PreparedStatementCache()
+        )
+        self._poller: Optional[BatchPoller] = None
+        self._poller_lock = threading.Lock()
 
     def _assume_role(
         self,
@@ -152,6 +248,8 @@ class Connection(object):
         serial_number: Optional[str],
         duration_seconds: int,
     ) -> Dict[str, Any]:
+        from boto3.session import Session
+
         session = Session(profile_name=profile_name, **self._session_kwargs)
         client = session.client("sts", region_name=region_name, **self._client_kwargs)
         request = {
@@ -178,6 +276,8 @@ class Connection(object):
         serial_number: Optional[str],
         duration_seconds: int,
     ) -> Dict[str, Any]:
+        from boto3.session import Session
+
         session = Session(profile_name=profile_name, **self._session_kwargs)
         client = session.client("sts", region_name=region_name, **self._client_kwargs)
         token_code = input("Enter the MFA code: ")
@@ -201,17 +301,73 @@ class Connection(object):
         return {k: v for k, v in self._kwargs.items() if k in self._CLIENT_PASSING_ARGS}
 
     @property
-    def session(self) -> Session:
+    def session(self) -> "Session":
         return self._session
 
     @property
     def client(self) -> "BaseClient":
         return self._client
 
+    @property
+    def client_cache(self) -> ClientCache:
+        return self._client_cache
+
+    def get_client(
+        self, service_name: str, max_pool_connections: Optional[int] = None
+    ) -> "BaseClient":
+        """Return the client of the service from the client cache of the connection.
+
+        The connection pool of the client has at least ``max_pool_connections``
+        connections, e.g. the number of the threads using the client."""
+        return self._client_cache.get_client(
+            self._client_session,
+            service_name,
+            region_name=self.region_name,
+            max_pool_connections=max_pool_connections,
+            session_key=self._credential_cache_key,
+            **self._client_kwargs
+        )
+
+    def _ensure_max_pool_connections(self, max_pool_connections: int) -> None:
+        """Replace the Athena client of the connection and its poller with the one that
+        has the larger connection pool, if the connection pool of the current client
+        is smaller."""
+        with self._client_lock:
+            if max_pool_connections > self._max_pool_connections:
+                self._client = self.get_client("athena", max_pool_connections)
+                self._max_pool_connections = max_pool_connections
+                with self._poller_lock:
+                    if self._poller:
+                        self._poller.client = self._client
+
     @property
     def retry_config(self) -> RetryConfig:
         return self._retry_config
 
+    @property
+    def result_cache(self) -> Optional["ResultCache"]:
+        return self._result_cache
+
+    @property
+    def poller(self) -> BatchPoller:
+        """The poller of the query executions shared by the asynchronous cursors."""
+        with self._poller_lock:
+            if not self._poller:
+                self._poller = BatchPoller(self._client, self._retry_config)
+            return self._poller
+
+    @property
+    def admission_controller(self) -> Optional["AdmissionController"]:
+        return self._admission_controller
+
+    @property
+    def prepared_statement_cache(self) -> PreparedStatementCache:
+        return self._prepared_statement_cache
+
+    @property
+    def query_history(self) -> Optional["QueryHistory"]:
+        return self._query_history
+
     def __enter__(self):
         return self
 
@@ -223,11 +379,15 @@ class Connection(object):
             cursor = self.cursor_class
         converter = kwargs.pop("converter", self._converter)
         if not converter:
+            from pyathena.arrow.async_cursor import AsyncArrowCursor
+            from pyathena.arrow.cursor import ArrowCursor
             from pyathena.pandas.async_cursor import AsyncPandasCursor
             from pyathena.pandas.cursor import PandasCursor
 
             if cursor is PandasCursor or cursor is AsyncPandasCursor:
                 converter = DefaultPandasTypeConverter()
+            elif cursor is ArrowCursor or cursor is AsyncArrowCursor:
+                converter = DefaultArrowTypeConverter()
             else:
                 converter = DefaultTypeConverter()
         return cursor(
@@ -243,11 +403,15 @@ class Connection(object):
             catalog_name=kwargs.pop("catalog_name", self.catalog_name),
             work_group=kwargs.pop("work_group", self.work_group),
             kill_on_interrupt=kwargs.pop("kill_on_interrupt", self.kill_on_interrupt),
+            polling_strategy=kwargs.pop("polling_strategy", self.polling_strategy),
             **kwargs
         )
 
     def close(self) -> None:
-        pass
+        with self._poller_lock:
+            if self._poller:
+                self._poller.close()
+                self._poller = None
 
     def commit(self) -> None:
         pass
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 import binascii
+import functools
 import json
 import logging
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 from datetime import date, datetime, time
 from decimal import Decimal
-from distutils.util import strtobool
 from typing import Any, Callable, Dict, Optional, Type
 
 _logger = logging.getLogger(__name__)  # type: ignore
@@ -53,6 +53,14 @@ class Converter(object, metaclass=ABCMeta):
     ) -> None:
         self.mappings.update(mappings)
 
+    def get_decoder(
+        self, type_: str
+    ) -> Optional[Callable[[Optional[str]], Optional[Any]]]:
+        """Return the callable that converts a value of the type, including None.
+
+        None means the value is returned as is."""
+        return functools.partial(self.convert, type_)
+
     @abstractmethod
     def convert(self, type_: str, value: Optional[str]) -> Optional[Any]:
         raise NotImplementedError  # pragma: no cover
@@ -97,7 +105,13 @@ def _to_decimal(varchar_value: Optional[str]) -> Optional[Decimal]:
 def _to_boolean(varchar_value: Optional[str]) -> Optional[bool]:
     if varchar_value is None or varchar_value == "":
         return None
-    return bool(strtobool(varchar_value))
+    # The same values as distutils.util.strtobool, without importing distutils.
+    value = varchar_value.lower()
+    if value in ("y", "yes", "t", "true", "on", "1"):
+        return True
+    elif value in ("n", "no", "f", "false", "off", "0"):
+        return False
+    raise ValueError("invalid truth value {0!r}".format(varchar_value))
 
 
 def _to_binary(varchar_value: Optional[str]) -> Optional[bytes]:
@@ -145,6 +159,13 @@ _DEFAULT_PANDAS_CONVERTERS: Dict[str, Callable[[Optional[str]], Optional[Any]]]
     "json": _to_json,
 }
 
+_DEFAULT_ARROW_CONVERTERS: Dict[str, Callable[[Optional[str]], Optional[Any]]] = {
+    "decimal": _to_decimal,
+    "time": _to_time,
+    "varbinary": _to_binary,
+    "json": _to_json,
+}
+
 
 class DefaultTypeConverter(Converter):
     def __init__(self) -> None:
@@ -152,6 +173,17 @@ class DefaultTypeConverter(Converter):
             mappings=deepcopy(_DEFAULT_CONVERTERS), default=_to_default
         )
 
+    def get_decoder(
+        self, type_: str
+    ) -> Optional[Callable[[Optional[str]], Optional[Any]]]:
+        if type(self).convert is not DefaultTypeConverter.convert:
+            # Respect the convert method overridden by the subclass.
+            return super(DefaultTypeConverter, self).get_decoder(type_)
+        converter = self.get(type_)
+        if not converter or converter is _to_default:
+            return None
+        return converter
+
     def convert(self, type_: str, value: Optional[str]) -> Optional[Any]:
         converter = self.get(type_)
         if converter:
@@ -191,3 +223,56 @@ class DefaultPandasTypeConverter(Converter):
 
     def convert(self, type_: str, value: Optional[str]) -> Optional[Any]:
         pass
+
+
+class DefaultArrowTypeConverter(Converter):
+    """Converter for the Arrow result set.
+
+    The types are the pyarrow data types used to read the CSV file, the mappings
+    convert the values that pyarrow can not parse when rows are fetched."""
+
+    def __init__(self) -> None:
+        super(DefaultArrowTypeConverter, self).__init__(
+            mappings=deepcopy(_DEFAULT_ARROW_CONVERTERS),
+            default=_to_default,
+            types=self._dtypes,
+        )
+
+    @property
+    def _dtypes(self) -> Dict[str, Type[Any]]:
+        import pyarrow as pa
+
+        return {
+            "boolean": pa.bool_(),
+            "tinyint": pa.int8(),
+            "smallint": pa.int16(),
+            "integer": pa.int32(),
+            "bigint": pa.int64(),
+            "float": pa.float32(),
+            "real": pa.float32(),
+            "double": pa.float64(),
+            # Replaced with the decimal type if the precision is known.
+            "decimal": pa.string(),
+            "char": pa.string(),
+            "varchar": pa.string(),
+            "string": pa.string(),
+            "timestamp": pa.timestamp("ms"),
+            "date": pa.date32(),
+            "time": pa.string(),
+            "varbinary": pa.string(),
+            "array": pa.string(),
+            "map": pa.string(),
+            "row": pa.string(),
+            "json": pa.string(),
+        }
+
+    def get_decoder(
+        self, type_: str
+    ) -> Optional[Callable[[Optional[str]], Optional[Any]]]:
+        return self.mappings.get(type_, None)
+
+    def convert(self, type_: str, value: Optional[str]) -> Optional[Any]:
+        converter = self.get(type_)
+        if converter:
+            return converter(value)
+        return value
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from botocore.credentials import RefreshableCredentials
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class CredentialCache(object):
+    """Cache of the temporary credentials returned by AssumeRole and GetSessionToken.
+
+    The credentials are keyed by the role, the serial number of the MFA device,
+    the profile, the access key ID of the source credentials, the session name and
+    the duration, and are used until ``refresh_margin`` seconds before they expire.
+    They are kept in memory, and also saved in a JSON file if the path is specified,
+    so that other processes can use them without calling STS or prompting for
+    the MFA code. The file is only readable by the owner, as it contains secret keys.
+
+    The default margin is the same as the advisory refresh timeout of
+    the refreshable credentials of botocore, so that the refresh always
+    gets new credentials."""
+
+    DEFAULT_REFRESH_MARGIN: int = 15 * 60
+
+    def __init__(
+        self, path: Optional[str] = None, refresh_margin: float = DEFAULT_REFRESH_MARGIN
+    ) -> None:
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._credentials: Dict[str, Dict[str, Any]] = dict()
+        self._refreshable_credentials: Dict[str, "RefreshableCredentials"] = dict()
+
+    @staticmethod
+    def get_key(
+        role_arn: Optional[str],
+        serial_number: Optional[str],
+        profile_name: Optional[str],
+        access_key_id: Optional[str],
+        role_session_name: Optional[str],
+        duration_seconds: int,
+    ) -> str:
+        key = json.dumps(
+            [
+                role_arn,
+                serial_number,
+                profile_name,
+                access_key_id,
+                role_session_name,
+                duration_seconds,
+            ]
+        )
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._credentials),
+        }
+
+    def _is_valid(self, credentials: Dict[str, Any]) -> bool:
+        expiration: datetime = credentials["Expiration"]
+        return expiration - timedelta(seconds=self.refresh_margin) > datetime.now(
+            timezone.utc
+        )
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path or not os.path.exists(self.path):
+            return dict()
+        try:
+            with open(self.path, "r") as f:
+                entries = json.load(f)
+            return {
+                k: {**v, "Expiration": datetime.fromisoformat(v["Expiration"])}
+                for k, v in entries.items()
+            }
+        except Exception:
+            _logger.warning("Failed to read the credential cache.", exc_info=True)
+            return dict()
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        path = self.path
+        if not path:
+            return
+        try:
+            # mkstemp creates the file readable and writable only by the owner.
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        k: {**v, "Expiration": v["Expiration"].isoformat()}
+                        for k, v in entries.items()
+                    },
+                    f,
+                )
+            os.replace(tmp, path)
+        except Exception:
+            _logger.warning("Failed to write the credential cache.", exc_info=True)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            credentials = self._credentials.get(key, None)
+            if not credentials or not self._is_valid(credentials):
+                # The credentials may have been saved by another process.
+                credentials = self._read().get(key, None)
+            if not credentials or not self._is_valid(credentials):
+                self._credentials.pop(key, None)
+                return None
+            self._credentials[key] = credentials
+            return credentials
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            credentials = self._get(key)
+            if credentials:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return credentials
+
+    def put(self, key: str, credentials: Dict[str, Any]) -> None:
+        credentials = {
+            k: credentials[k]
+            for k in ["AccessKeyId", "SecretAccessKey", "SessionToken", "Expiration"]
+        }
+        with self._lock:
+            self._credentials[key] = credentials
+            entries = {k: v for k, v in self._read().items() if self._is_valid(v)}
+            entries[key] = credentials
+            self._write(entries)
+
+    def get_credentials(
+        self, key: str, fetch: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Return the cached credentials, or the ones fetched and cached if there are none.
+
+        The credentials are fetched without the lock, as fetching may prompt for
+        the MFA code, so the threads of the same key may fetch them at the same time.
+        The credentials cached first are kept, so that all of them use the same ones."""
+        credentials = self.get(key)
+        if credentials:
+            return credentials
+        fetched = fetch()
+        with self._lock:
+            # The credentials may have been fetched by another thread or process.
+            credentials = self._get(key)
+            if credentials:
+                return credentials
+            self.put(key, fetched)
+            return fetched
+
+    def get_session(
+        self,
+        key: str,
+        fetch: Callable[[], Dict[str, Any]],
+        region_name: Optional[str] = None,
+    ) -> "Session":
+        """Return the new session of the refreshable credentials.
+
+        botocore refreshes the credentials with the cache when they are about to expire,
+        so the session can be used longer than the duration of the credentials.
+        The sessions of boto3 are not thread-safe, so a new session is returned for
+        each connection, and the refreshable credentials, which are thread-safe,
+        are shared by the sessions of the same key."""
+        from boto3.session import Session
+        from botocore.credentials import RefreshableCredentials
+        from botocore.session import get_session
+
+        def _refresh() -> Dict[str, Any]:
+            credentials = self.get_credentials(key, fetch)
+            return {
+                "access_key": credentials["AccessKeyId"],
+                "secret_key": credentials["SecretAccessKey"],
+                "token": credentials["SessionToken"],
+                "expiry_time": credentials["Expiration"].isoformat(),
+            }
+
+        with self._lock:
+            refreshable = self._refreshable_credentials.get(key, None)
+        if refreshable is None:
+            refreshable = RefreshableCredentials.create_from_metadata(
+                metadata=_refresh(),
+                refresh_using=_refresh,
+                method="assume-role",
+            )
+            with self._lock:
+                refreshable = self._refreshable_credentials.setdefault(key, refreshable)
+        botocore_session = get_session()
+        botocore_session._credentials = refreshable
+        return Session(botocore_session=botocore_session, region_name=region_name)
+
+    def clear(self) -> None:
+        """Clear the credentials of this cache.
+
+        The file may be shared with other processes, so only the credentials
+        of this cache are removed from it."""
+        with self._lock:
+            keys = set(self._credentials) | set(self._refreshable_credentials)
+            self._credentials.clear()
+            self._refreshable_credentials.clear()
+            if self.path and os.path.exists(self.path):
+                self._write(
+                    {
+                        k: v
+                        for k, v in self._read().items()
+                        if k not in keys and self._is_valid(v)
+                    }
+                )
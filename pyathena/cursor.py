@@ -7,7 +7,14 @@ from pyathena.converter import Converter
 from pyathena.error import OperationalError, ProgrammingError
 from pyathena.formatter import Formatter
 from pyathena.model import AthenaQueryExecution
-from pyathena.result_set import AthenaDictResultSet, AthenaResultSet, WithResultSet
+from pyathena.polling import PollingStrategy
+from pyathena.result_set import (
+    AthenaDictResultSet,
+    AthenaResultSet,
+    AthenaStreamingDictResultSet,
+    AthenaStreamingResultSet,
+    WithResultSet,
+)
 from pyathena.util import RetryConfig, synchronized
 
 if TYPE_CHECKING:
@@ -17,6 +24,10 @@ _logger = logging.getLogger(__name__)  # type: ignore
 
 
 class Cursor(BaseCursor, CursorIterator, WithResultSet):
+
+    # The rows taken out of the result set at a time by the iterator.
+    ITER_CHUNK_SIZE: int = 100
+
     def __init__(
         self,
         connection: "Connection",
@@ -31,6 +42,9 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
         catalog_name: Optional[str] = None,
         work_group: Optional[str] = None,
         kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        streaming: bool = False,
+        prefetch_pages: int = 0,
         **kwargs
     ) -> None:
         super(Cursor, self).__init__(
@@ -46,11 +60,16 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
             catalog_name=catalog_name,
             work_group=work_group,
             kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
             **kwargs
         )
         self._query_id: Optional[str] = None
         self._result_set: Optional[AthenaResultSet] = None
-        self._result_set_class = AthenaResultSet
+        self._streaming = streaming
+        self._prefetch_pages = prefetch_pages
+        self._result_set_class = (
+            AthenaStreamingResultSet if streaming else AthenaResultSet
+        )
 
     @property
     def result_set(self) -> Optional[AthenaResultSet]:
@@ -85,8 +104,33 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
         s3_staging_dir: Optional[str] = None,
         cache_size: int = 0,
         cache_expiration_time: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
     ):
         self._reset_state()
+        query_deadline = self._get_deadline(timeout, deadline)
+        # The streaming result set does not read the pages of GetQueryResults.
+        cache_key = (
+            None
+            if self._streaming
+            else self._get_result_cache_key(operation, parameters, work_group)
+        )
+        result_cache = self._connection.result_cache
+        if result_cache and cache_key:
+            cached = result_cache.get(cache_key)
+            if cached:
+                self.query_id = cached["query_execution"].query_id
+                self.result_set = self._result_set_class(
+                    self._connection,
+                    self._converter,
+                    cached["query_execution"],
+                    self.arraysize,
+                    self._retry_config,
+                    prefetch_pages=self._prefetch_pages,
+                    cached_pages=cached["pages"],
+                )
+                return self
         self.query_id = self._execute(
             operation,
             parameters=parameters,
@@ -94,8 +138,10 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
             s3_staging_dir=s3_staging_dir,
             cache_size=cache_size,
             cache_expiration_time=cache_expiration_time,
+            deadline=query_deadline,
+            prepare=prepare,
         )
-        query_execution = self._poll(self.query_id)
+        query_execution = self._poll(self.query_id, query_deadline)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
             self.result_set = self._result_set_class(
                 self._connection,
@@ -103,25 +149,57 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
                 query_execution,
                 self.arraysize,
                 self._retry_config,
+                prefetch_pages=self._prefetch_pages,
+                result_cache=result_cache if cache_key else None,
+                cache_key=cache_key,
             )
         else:
             raise OperationalError(query_execution.state_change_reason)
         return self
 
     def executemany(
-        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
+        self,
+        operation: str,
+        seq_of_parameters: List[Optional[Dict[str, Any]]],
+        concurrency: int = BaseCursor.DEFAULT_EXECUTEMANY_CONCURRENCY,
     ):
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
         # Operations that have result sets are not allowed with executemany.
         self._reset_state()
+        self._execute_many(operation, seq_of_parameters, concurrency)
 
-    @synchronized
     def cancel(self) -> None:
+        # Not synchronized, so that the query polled by execute can be canceled.
         if not self.query_id:
             raise ProgrammingError("QueryExecutionId is none or empty.")
         self._cancel(self.query_id)
 
+    def __iter__(self):
+        """Iterate the rows in chunks, the lock is acquired twice per chunk instead of
+        once per row. The rows of the chunk that are not iterated, e.g. after break,
+        are put back to the result set when the iterator is closed."""
+        while True:
+            result_set, rows = self._next_rows()
+            if not rows:
+                break
+            count = 0
+            try:
+                for row in rows:
+                    count += 1
+                    yield row
+            finally:
+                self._return_rows(result_set, rows, count)
+
+    @synchronized
+    def _next_rows(self):
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaResultSet, self.result_set)
+        return result_set, result_set._next_rows(self.ITER_CHUNK_SIZE)
+
+    @synchronized
+    def _return_rows(self, result_set: AthenaResultSet, rows, count: int) -> None:
+        result_set._return_rows(rows, count)
+
     @synchronized
     def fetchone(self):
         if not self.has_result_set:
@@ -147,6 +225,8 @@ class Cursor(BaseCursor, CursorIterator, WithResultSet):
 class DictCursor(Cursor):
     def __init__(self, **kwargs) -> None:
         super(DictCursor, self).__init__(**kwargs)
-        self._result_set_class = AthenaDictResultSet
+        self._result_set_class = (
+            AthenaStreamingDictResultSet if self._streaming else AthenaDictResultSet
+        )
         if "dict_type" in kwargs:
             AthenaDictResultSet.dict_type = kwargs["dict_type"]
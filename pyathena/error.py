@@ -6,6 +6,7 @@ __all__ = [
     "DatabaseError",
     "InternalError",
     "OperationalError",
+    "QueryTimeoutError",
     "ProgrammingError",
     "DataError",
     "NotSupportedError",
@@ -36,6 +37,12 @@ class OperationalError(DatabaseError):
     pass
 
 
+class QueryTimeoutError(OperationalError):
+    """The query did not finish by the timeout or the deadline, and was canceled."""
+
+    pass
+
+
 class ProgrammingError(DatabaseError):
     pass
 
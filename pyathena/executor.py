@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+import atexit
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+_logger = logging.getLogger(__name__)  # type: ignore
+_T = TypeVar("_T")
+
+# The executors are shut down at the exit of the interpreter, as concurrent.futures does,
+# so that the work submitted is finished.
+_executors: "weakref.WeakSet[PriorityThreadPoolExecutor]" = weakref.WeakSet()
+
+
+def _python_exit() -> None:
+    for executor in list(_executors):
+        executor.shutdown(wait=True)
+
+
+if hasattr(threading, "_register_atexit"):
+    # Python 3.9+ calls the function before joining the non-daemon threads.
+    threading._register_atexit(_python_exit)  # type: ignore
+    _DAEMON = False
+else:
+    # The function of atexit is called after joining the non-daemon threads.
+    atexit.register(_python_exit)
+    _DAEMON = True
+
+
+class _WorkItem(object):
+    def __init__(
+        self,
+        future: "Future[Any]",
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(result)
+
+
+class PriorityThreadPoolExecutor(Executor):
+    """Thread pool executor that runs the submitted functions in the priority order.
+
+    The waiting functions are aged, their priority is increased by one for every
+    ``aging_interval`` seconds they wait, so the functions of the low priority are
+    also run while the functions of the high priority are submitted continuously.
+    The functions of the same priority are run in the order of the submission."""
+
+    # Seconds to wait for the priority to be increased by one.
+    DEFAULT_AGING_INTERVAL: float = 10.0
+
+    def __init__(
+        self, max_workers: int, aging_interval: float = DEFAULT_AGING_INTERVAL
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        self._max_workers = max_workers
+        self._aging_interval = aging_interval
+        self._condition = threading.Condition()
+        self._queue: List[Tuple[float, int, _WorkItem]] = []
+        self._counter = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._shutdown = False
+        _executors.add(self)
+
+    def submit(
+        self, __fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> "Future[_T]":
+        return self.submit_with_priority(0, __fn, *args, **kwargs)
+
+    def submit_with_priority(
+        self, priority: int, fn: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> "Future[_T]":
+        """Submit the function to be run when no function of the higher priority waits.
+
+        The waiting functions are ordered by the time they are submitted
+        minus ``priority * aging_interval`` seconds, which is the same as ordering
+        them by the priority increased by the seconds waited / ``aging_interval``."""
+        future: "Future[_T]" = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            key = time.monotonic() - priority * self._aging_interval
+            heapq.heappush(
+                self._queue,
+                (key, next(self._counter), _WorkItem(future, fn, args, kwargs)),
+            )
+            # The idle threads include the ones notified but not woken up yet.
+            if len(self._queue) > self._idle and len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._run,
+                    name="PriorityThreadPoolExecutor-{0}".format(len(self._threads)),
+                    daemon=_DAEMON,
+                )
+                thread.start()
+                self._threads.append(thread)
+            self._condition.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._idle += 1
+                    self._condition.wait()
+                    self._idle -= 1
+                if not self._queue:
+                    return
+                _, _, item = heapq.heappop(self._queue)
+            item.run()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for _, _, item in self._queue:
+                    item.future.cancel()
+                self._queue = []
+            self._condition.notify_all()
+            threads = list(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    @property
+    def queued(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def aging_interval(self) -> float:
+        return self._aging_interval
@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 import logging
+import re
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Match, Optional, Tuple, Type, TypeVar
 
-from pyathena.error import ProgrammingError
+from pyathena.error import NotSupportedError, ProgrammingError
 
 _logger = logging.getLogger(__name__)  # type: ignore
 _T = TypeVar("_T", bound="Formatter")
@@ -51,6 +52,26 @@ class Formatter(object, metaclass=ABCMeta):
     ) -> str:
         raise NotImplementedError  # pragma: no cover
 
+    def format_many(
+        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
+    ) -> Optional[List[Tuple[int, int, str]]]:
+        """Format the operation executed with each of the parameters into fewer queries.
+
+        Return the list of the range of the parameters and the query combining them,
+        or None if the operation cannot be combined."""
+        return None
+
+    def prepare(self, operation: str) -> Tuple[str, List[str]]:
+        """Convert the operation into the statement of a prepared statement.
+
+        Return the statement with the ``?`` placeholders and the names of
+        the parameters in the order of the placeholders."""
+        raise NotSupportedError("Prepared statements are not supported.")
+
+    def format_arguments(self, names: List[str], parameters: Dict[str, Any]) -> str:
+        """Format the parameters as the arguments of ``EXECUTE ... USING``."""
+        raise NotSupportedError("Prepared statements are not supported.")
+
 
 def _escape_presto(val: str) -> str:
     """ParamEscaper
@@ -150,10 +171,48 @@ _DEFAULT_FORMATTERS: Dict[
 
 
 class DefaultParameterFormatter(Formatter):
-    def __init__(self) -> None:
+
+    # https://docs.aws.amazon.com/athena/latest/APIReference/API_StartQueryExecution.html
+    # QueryString Length Constraints: Minimum length of 1. Maximum length of 262144.
+    MAX_QUERY_LENGTH: int = 262144
+
+    _PATTERN_INSERT_VALUES = re.compile(
+        r"^(INSERT\s+INTO\s+.+?\s+VALUES)\s*(\(.*\))\s*;?$",
+        re.IGNORECASE | re.DOTALL,
+    )
+
+    _PATTERN_PLACEHOLDER = re.compile(r"%\((\w+)\)[a-z]|%%")
+
+    def __init__(self, max_query_length: int = MAX_QUERY_LENGTH) -> None:
         super(DefaultParameterFormatter, self).__init__(
             mappings=deepcopy(_DEFAULT_FORMATTERS), default=None
         )
+        self.max_query_length = max_query_length
+
+    @staticmethod
+    def _get_escaper(operation: str) -> Callable[[str], str]:
+        # UNLOAD statements, e.g. of the unload option of the cursors, run on Presto.
+        if operation.upper().startswith(("SELECT", "WITH", "UNLOAD")):
+            return _escape_presto
+        else:
+            return _escape_hive
+
+    def _format_parameters(
+        self, parameters: Any, escaper: Callable[[str], str]
+    ) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = dict()
+        if isinstance(parameters, dict):
+            for k, v in parameters.items():
+                func = self.get(v)
+                if not func:
+                    raise TypeError("{0} is not defined formatter.".format(type(v)))
+                kwargs.update({k: func(self, escaper, v)})
+        else:
+            raise ProgrammingError(
+                "Unsupported parameter "
+                + "(Support for dict only): {0}".format(parameters)
+            )
+        return kwargs
 
     def format(
         self, operation: str, parameters: Optional[Dict[str, Any]] = None
@@ -161,27 +220,101 @@ class DefaultParameterFormatter(Formatter):
         if not operation or not operation.strip():
             raise ProgrammingError("Query is none or empty.")
         operation = operation.strip()
-
-        if operation.upper().startswith("SELECT") or operation.upper().startswith(
-            "WITH"
-        ):
-            escaper = _escape_presto
-        else:
-            escaper = _escape_hive
+        escaper = self._get_escaper(operation)
 
         kwargs: Optional[Dict[str, Any]] = None
         if parameters is not None:
-            kwargs = dict()
-            if isinstance(parameters, dict):
-                for k, v in parameters.items():
-                    func = self.get(v)
-                    if not func:
-                        raise TypeError("{0} is not defined formatter.".format(type(v)))
-                    kwargs.update({k: func(self, escaper, v)})
-            else:
-                raise ProgrammingError(
-                    "Unsupported parameter "
-                    + "(Support for dict only): {0}".format(parameters)
-                )
+            kwargs = self._format_parameters(parameters, escaper)
 
         return (operation % kwargs).strip() if kwargs is not None else operation.strip()
+
+    @staticmethod
+    def _is_single_row(values: str) -> bool:
+        """Return True if the parentheses of the values are closed only at the end."""
+        depth = 0
+        quoted = False
+        for i, c in enumerate(values):
+            if c == "'":
+                quoted = not quoted
+            elif quoted:
+                continue
+            elif c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+                if depth == 0 and i != len(values) - 1:
+                    return False
+        return depth == 0 and not quoted
+
+    def format_many(
+        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
+    ) -> Optional[List[Tuple[int, int, str]]]:
+        """Combine the single-row INSERT INTO ... VALUES statement into the multi-row
+        statements, each of them is not longer than ``max_query_length`` bytes."""
+        if not operation or not operation.strip():
+            raise ProgrammingError("Query is none or empty.")
+        match = self._PATTERN_INSERT_VALUES.match(operation.strip())
+        if not match or not self._is_single_row(match.group(2)):
+            return None
+        statement, values = match.group(1), match.group(2)
+        escaper = self._get_escaper(statement)
+
+        queries: List[Tuple[int, int, str]] = []
+        rows: List[str] = []
+        start, length = 0, 0
+        prefix_length = len(statement.encode("utf-8")) + 1
+        for i, parameters in enumerate(seq_of_parameters):
+            row = (
+                values % self._format_parameters(parameters, escaper)
+                if parameters is not None
+                else values
+            )
+            row_length = len(row.encode("utf-8")) + 2
+            if rows and prefix_length + length + row_length > self.max_query_length:
+                queries.append((start, i, "{0} {1}".format(statement, ", ".join(rows))))
+                rows, start, length = [], i, 0
+            rows.append(row)
+            length += row_length
+        if rows:
+            end = start + len(rows)
+            queries.append((start, end, "{0} {1}".format(statement, ", ".join(rows))))
+        return queries
+
+    def prepare(self, operation: str) -> Tuple[str, List[str]]:
+        """Replace the ``%(name)s`` placeholders of the operation with ``?``,
+        and ``%%`` with ``%``."""
+        if not operation or not operation.strip():
+            raise ProgrammingError("Query is none or empty.")
+        names: List[str] = []
+
+        def _replace(match: Match[str]) -> str:
+            if match.group(1) is None:
+                return "%"
+            names.append(match.group(1))
+            return "?"
+
+        statement = self._PATTERN_PLACEHOLDER.sub(_replace, operation.strip())
+        return statement.rstrip(";").strip(), names
+
+    def format_arguments(self, names: List[str], parameters: Dict[str, Any]) -> str:
+        """Format the parameters as the literals of the statements of Presto."""
+        if not isinstance(parameters, dict):
+            raise ProgrammingError(
+                "Unsupported parameter "
+                + "(Support for dict only): {0}".format(parameters)
+            )
+        arguments = []
+        for name in names:
+            try:
+                v = parameters[name]
+            except KeyError:
+                raise ProgrammingError("Parameter {0} is not found.".format(name))
+            if isinstance(v, (list, set, tuple)):
+                raise ProgrammingError(
+                    "{0} is not supported in prepared statements.".format(type(v))
+                )
+            func = self.get(v)
+            if not func:
+                raise TypeError("{0} is not defined formatter.".format(type(v)))
+            arguments.append(str(func(self, _escape_presto, v)))
+        return ", ".join(arguments)
@@ -7,8 +7,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from pyathena.async_cursor import AsyncCursor
 from pyathena.common import CursorIterator
 from pyathena.converter import Converter
+from pyathena.executor import PriorityThreadPoolExecutor
 from pyathena.formatter import Formatter
+from pyathena.model import AthenaQueryExecution
 from pyathena.pandas.result_set import AthenaPandasResultSet
+from pyathena.polling import PollingStrategy
 from pyathena.util import RetryConfig
 
 if TYPE_CHECKING:
@@ -35,6 +38,11 @@ class AsyncPandasCursor(AsyncCursor):
         max_workers: int = (cpu_count() or 1) * 5,
         arraysize: int = CursorIterator.DEFAULT_FETCH_SIZE,
         kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        aging_interval: float = PriorityThreadPoolExecutor.DEFAULT_AGING_INTERVAL,
+        download_max_workers: int = AthenaPandasResultSet.DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = AthenaPandasResultSet.DEFAULT_DOWNLOAD_PART_SIZE,
+        unload: bool = False,
     ) -> None:
         super(AsyncPandasCursor, self).__init__(
             connection=connection,
@@ -51,19 +59,25 @@ class AsyncPandasCursor(AsyncCursor):
             catalog_name=catalog_name,
             work_group=work_group,
             kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
+            aging_interval=aging_interval,
         )
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload = unload
 
     def _collect_result_set(
         self,
-        query_id: str,
+        query_execution: AthenaQueryExecution,
         keep_default_na: bool = False,
         na_values: List[str] = None,
         quoting: int = 1,
+        chunksize: Optional[int] = None,
+        unload_location: Optional[str] = None,
         kwargs: Dict[str, Any] = None,
     ) -> AthenaPandasResultSet:
         if kwargs is None:
             kwargs = dict()
-        query_execution = self._poll(query_id)
         return AthenaPandasResultSet(
             connection=self._connection,
             converter=self._converter,
@@ -73,6 +87,10 @@ class AsyncPandasCursor(AsyncCursor):
             keep_default_na=keep_default_na,
             na_values=na_values,
             quoting=quoting,
+            chunksize=chunksize,
+            download_max_workers=self._download_max_workers,
+            download_part_size=self._download_part_size,
+            unload_location=unload_location,
             **kwargs,
         )
 
@@ -87,8 +105,18 @@ class AsyncPandasCursor(AsyncCursor):
         keep_default_na: bool = False,
         na_values: List[str] = None,
         quoting: int = 1,
+        chunksize: Optional[int] = None,
+        *,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
         **kwargs,
     ) -> Tuple[str, "Future[Union[AthenaResultSet, AthenaPandasResultSet]]"]:
+        query_deadline = self._get_deadline(timeout, deadline)
+        unload_location = None
+        if self._unload:
+            operation, unload_location = self._prepare_unload(operation, s3_staging_dir)
         query_id = self._execute(
             operation,
             parameters=parameters,
@@ -96,15 +124,23 @@ class AsyncPandasCursor(AsyncCursor):
             s3_staging_dir=s3_staging_dir,
             cache_size=cache_size,
             cache_expiration_time=cache_expiration_time,
+            priority=priority,
+            deadline=query_deadline,
+            prepare=prepare,
         )
         return (
             query_id,
-            self._executor.submit(
-                self._collect_result_set,
+            self._submit(
                 query_id,
+                self._collect_result_set,
                 keep_default_na,
                 na_values,
                 quoting,
+                chunksize,
+                unload_location,
                 kwargs,
+                priority=priority,
+                deadline=query_deadline,
+                kill_on_cancel=True,
             ),
         )
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union, cast
 
 from pyathena.common import CursorIterator
 from pyathena.converter import Converter
@@ -8,7 +8,8 @@ from pyathena.cursor import BaseCursor
 from pyathena.error import OperationalError, ProgrammingError
 from pyathena.formatter import Formatter
 from pyathena.model import AthenaQueryExecution
-from pyathena.pandas.result_set import AthenaPandasResultSet
+from pyathena.pandas.result_set import AthenaPandasResultSet, DataFrameIterator
+from pyathena.polling import PollingStrategy
 from pyathena.result_set import WithResultSet
 from pyathena.util import RetryConfig, synchronized
 
@@ -34,6 +35,10 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
         formatter: Formatter,
         retry_config: RetryConfig,
         kill_on_interrupt: bool = True,
+        polling_strategy: Optional[PollingStrategy] = None,
+        download_max_workers: int = AthenaPandasResultSet.DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = AthenaPandasResultSet.DEFAULT_DOWNLOAD_PART_SIZE,
+        unload: bool = False,
         **kwargs,
     ) -> None:
         super(PandasCursor, self).__init__(
@@ -48,10 +53,14 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
             formatter=formatter,
             retry_config=retry_config,
             kill_on_interrupt=kill_on_interrupt,
+            polling_strategy=polling_strategy,
             **kwargs,
         )
         self._query_id: Optional[str] = None
         self._result_set: Optional[AthenaPandasResultSet] = None
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload = unload
 
     @property
     def result_set(self) -> Optional[AthenaPandasResultSet]:
@@ -89,9 +98,18 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
         keep_default_na: bool = False,
         na_values: Optional[Iterable[str]] = ("",),
         quoting: int = 1,
+        chunksize: Optional[int] = None,
+        *,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        prepare: bool = False,
         **kwargs,
     ):
         self._reset_state()
+        query_deadline = self._get_deadline(timeout, deadline)
+        unload_location = None
+        if self._unload:
+            operation, unload_location = self._prepare_unload(operation, s3_staging_dir)
         self.query_id = self._execute(
             operation,
             parameters=parameters,
@@ -99,8 +117,10 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
             s3_staging_dir=s3_staging_dir,
             cache_size=cache_size,
             cache_expiration_time=cache_expiration_time,
+            deadline=query_deadline,
+            prepare=prepare,
         )
-        query_execution = self._poll(self.query_id)
+        query_execution = self._poll(self.query_id, query_deadline)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
             self.result_set = AthenaPandasResultSet(
                 connection=self._connection,
@@ -111,6 +131,10 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
                 keep_default_na=keep_default_na,
                 na_values=na_values,
                 quoting=quoting,
+                chunksize=chunksize,
+                download_max_workers=self._download_max_workers,
+                download_part_size=self._download_part_size,
+                unload_location=unload_location,
                 **kwargs,
             )
         else:
@@ -118,15 +142,17 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
         return self
 
     def executemany(
-        self, operation: str, seq_of_parameters: List[Optional[Dict[str, Any]]]
+        self,
+        operation: str,
+        seq_of_parameters: List[Optional[Dict[str, Any]]],
+        concurrency: int = BaseCursor.DEFAULT_EXECUTEMANY_CONCURRENCY,
     ) -> None:
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
         # Operations that have result sets are not allowed with executemany.
         self._reset_state()
+        self._execute_many(operation, seq_of_parameters, concurrency)
 
-    @synchronized
     def cancel(self) -> None:
+        # Not synchronized, so that the query polled by execute can be canceled.
         if not self.query_id:
             raise ProgrammingError("QueryExecutionId is none or empty.")
         self._cancel(self.query_id)
@@ -153,7 +179,7 @@ class PandasCursor(BaseCursor, CursorIterator, WithResultSet):
         return result_set.fetchall()
 
     @synchronized
-    def as_pandas(self) -> "DataFrame":
+    def as_pandas(self) -> Union["DataFrame", DataFrameIterator]:
         if not self.has_result_set:
             raise ProgrammingError("No result set.")
         result_set = cast(AthenaPandasResultSet, self.result_set)
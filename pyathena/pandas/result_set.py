@@ -1,23 +1,83 @@
 # -*- coding: utf-8 -*-
+import itertools
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Type
+from multiprocessing import cpu_count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from pyathena.converter import Converter
 from pyathena.error import OperationalError, ProgrammingError
 from pyathena.model import AthenaQueryExecution
 from pyathena.result_set import AthenaResultSet
-from pyathena.util import RetryConfig, parse_output_location, retry_api_call
+from pyathena.util import RetryConfig, get_object, parse_output_location
 
 if TYPE_CHECKING:
     from pandas import DataFrame
+    from pandas.io.parsers import TextFileReader
+    from pyarrow import DataType, Table
 
     from pyathena.connection import Connection
 
 _logger = logging.getLogger(__name__)  # type: ignore
 
 
+class DataFrameIterator(Iterator["DataFrame"]):
+    """Iterator of the DataFrame chunks read from the query result."""
+
+    def __init__(
+        self,
+        reader: Optional[Union["TextFileReader", Generator["DataFrame", None, None]]],
+        trunc_date: Callable[["DataFrame"], "DataFrame"],
+        body: Optional[Any] = None,
+    ) -> None:
+        self._reader = reader
+        self._trunc_date = trunc_date
+        self._body = body
+
+    def __next__(self) -> "DataFrame":
+        if not self._reader:
+            raise StopIteration
+        try:
+            df = next(self._reader)
+        except StopIteration:
+            self.close()
+            raise
+        return self._trunc_date(df)
+
+    def __iter__(self) -> "DataFrameIterator":
+        return self
+
+    def itertuples(self) -> Iterator[Tuple[Any, ...]]:
+        for df in self:
+            yield from df.itertuples(index=False, name=None)
+
+    def close(self) -> None:
+        if self._reader:
+            self._reader.close()
+            self._reader = None
+        if self._body:
+            self._body.close()
+            self._body = None
+
+
 class AthenaPandasResultSet(AthenaResultSet):
 
+    DEFAULT_DOWNLOAD_MAX_WORKERS: int = min(32, (cpu_count() or 1) + 4)
+    DEFAULT_DOWNLOAD_PART_SIZE: int = 1024 * 1024 * 16
+
     _parse_dates: List[str] = [
         "date",
         "time",
@@ -36,6 +96,10 @@ class AthenaPandasResultSet(AthenaResultSet):
         keep_default_na: bool = False,
         na_values: Optional[Iterable[str]] = ("",),
         quoting: int = 1,
+        chunksize: Optional[int] = None,
+        download_max_workers: int = DEFAULT_DOWNLOAD_MAX_WORKERS,
+        download_part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+        unload_location: Optional[str] = None,
         **kwargs,
     ) -> None:
         super(AthenaPandasResultSet, self).__init__(
@@ -49,21 +113,34 @@ class AthenaPandasResultSet(AthenaResultSet):
         self._keep_default_na = keep_default_na
         self._na_values = na_values
         self._quoting = quoting
+        self._chunksize = chunksize
+        self._download_max_workers = download_max_workers
+        self._download_part_size = download_part_size
+        self._unload_location = unload_location
         self._kwargs = kwargs
-        self._client = connection.session.client(
-            "s3", region_name=connection.region_name, **connection._client_kwargs
+        self._client = connection.get_client(
+            "s3", max_pool_connections=self._download_max_workers
         )
-        if (
+        self._df: Union["DataFrame", DataFrameIterator]
+        if self.state == AthenaQueryExecution.STATE_SUCCEEDED and self._unload_location:
+            self._df = self._as_pandas_from_unload()
+        elif (
             self.state == AthenaQueryExecution.STATE_SUCCEEDED
             and self.output_location
             and self.output_location.endswith((".csv", ".txt"))
         ):
             self._df = self._as_pandas()
+        elif self._chunksize:
+            self._df = DataFrameIterator(None, self._trunc_date)
         else:
             import pandas as pd
 
             self._df = pd.DataFrame()
-        self._iterrows = self._df.iterrows()
+        self._itertuples: Optional[Iterator[Tuple[Any, ...]]] = (
+            self._df.itertuples()
+            if isinstance(self._df, DataFrameIterator)
+            else self._df.itertuples(index=False, name=None)
+        )
 
     @property
     def dtypes(self) -> Dict[Optional[Any], Type[Any]]:
@@ -97,60 +174,53 @@ class AthenaPandasResultSet(AthenaResultSet):
             df.loc[:, times] = df.loc[:, times].apply(lambda r: r.dt.time)
         return df
 
-    def _fetch(self):
+    def fetchone(self):
+        if not self._itertuples:
+            return None
         try:
-            row = next(self._iterrows)
+            row = next(self._itertuples)
         except StopIteration:
             return None
         else:
-            self._rownumber = row[0] + 1
-            description = self.description if self.description else []
-            return tuple([row[1][d[0]] for d in description])
-
-    def fetchone(self):
-        return self._fetch()
+            self._add_rownumber(1)
+            return row
 
     def fetchmany(self, size: Optional[int] = None):
+        if not self._itertuples:
+            return []
         if not size or size <= 0:
             size = self._arraysize
-        rows = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
-                break
+        rows = list(itertools.islice(self._itertuples, size))
+        self._add_rownumber(len(rows))
         return rows
 
     def fetchall(self):
-        rows = []
-        while True:
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
-                break
+        if not self._itertuples:
+            return []
+        rows = list(self._itertuples)
+        self._add_rownumber(len(rows))
         return rows
 
-    def _as_pandas(self) -> "DataFrame":
+    def _as_pandas(self) -> Union["DataFrame", DataFrameIterator]:
         import pandas as pd
 
         if not self.output_location:
             raise ProgrammingError("OutputLocation is none or empty.")
         bucket, key = parse_output_location(self.output_location)
         try:
-            response = retry_api_call(
-                self._client.get_object,
+            length, body = get_object(
+                self._client,
+                bucket,
+                key,
+                max_workers=self._download_max_workers,
+                part_size=self._download_part_size,
                 config=self._retry_config,
                 logger=_logger,
-                Bucket=bucket,
-                Key=key,
             )
         except Exception as e:
             _logger.exception("Failed to download csv.")
             raise OperationalError(*e.args) from e
         else:
-            length = response["ContentLength"]
             if length:
                 if self.output_location.endswith(".txt"):
                     sep = "\t"
@@ -161,8 +231,7 @@ class AthenaPandasResultSet(AthenaResultSet):
                     sep = ","
                     header = 0
                     names = None
-                df = pd.read_csv(
-                    response["Body"],
+                read_csv_kwargs = dict(
                     sep=sep,
                     header=header,
                     names=names,
@@ -176,17 +245,81 @@ class AthenaPandasResultSet(AthenaResultSet):
                     quoting=self._quoting,
                     **self._kwargs,
                 )
+                if self._chunksize:
+                    # The body is closed by the iterator after the last chunk.
+                    reader = pd.read_csv(
+                        body, chunksize=self._chunksize, **read_csv_kwargs
+                    )
+                    return DataFrameIterator(reader, self._trunc_date, body)
+                try:
+                    df = pd.read_csv(body, **read_csv_kwargs)
+                finally:
+                    body.close()
                 df = self._trunc_date(df)
+            elif self._chunksize:  # Allow empty response
+                df = DataFrameIterator(None, self._trunc_date)
             else:  # Allow empty response
                 df = pd.DataFrame()
             return df
 
-    def as_pandas(self) -> "DataFrame":
+    def _read_unload(self) -> "Table":
+        """Read the Parquet files written by the UNLOAD statement.
+
+        The description is taken from the schema of the files."""
+        from pyathena.arrow.util import read_parquet, to_column_info
+
+        locations = self._get_unload_locations(
+            self._client, cast(str, self._unload_location)
+        )
+        try:
+            table = read_parquet(
+                self._client,
+                locations,
+                max_workers=self._download_max_workers,
+                config=self._retry_config,
+                logger=_logger,
+            )
+        except Exception as e:
+            _logger.exception("Failed to read parquet.")
+            raise OperationalError(*e.args) from e
+        self._meta_data = to_column_info(table.schema)
+        # The values are already typed by Parquet.
+        self._decoders = tuple(None for _ in self._meta_data)
+        return table
+
+    def _as_pandas_from_unload(self) -> Union["DataFrame", DataFrameIterator]:
+        import pandas as pd
+        import pyarrow as pa
+
+        table = self._read_unload()
+
+        def _types_mapper(type_: "DataType") -> Optional[Any]:
+            # Same as the CSV result, integers are nullable.
+            return pd.Int64Dtype() if pa.types.is_integer(type_) else None
+
+        def _to_pandas(t: "Table") -> "DataFrame":
+            df: "DataFrame" = t.to_pandas(
+                types_mapper=_types_mapper, date_as_object=False
+            )
+            return df
+
+        if self._chunksize:
+            chunksize = self._chunksize
+            chunks = (
+                _to_pandas(table.slice(offset, chunksize))
+                for offset in range(0, table.num_rows, chunksize)
+            )
+            return DataFrameIterator(chunks, self._trunc_date)
+        return _to_pandas(table)
+
+    def as_pandas(self) -> Union["DataFrame", DataFrameIterator]:
         return self._df
 
     def close(self) -> None:
         import pandas as pd
 
         super(AthenaPandasResultSet, self).close()
+        if isinstance(self._df, DataFrameIterator):
+            self._df.close()
         self._df = pd.DataFrame()
-        self._iterrows = None
+        self._itertuples = None
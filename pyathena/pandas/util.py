@@ -20,9 +20,8 @@ from typing import (
     Union,
 )
 
-from boto3 import Session
-
 from pyathena import OperationalError
+from pyathena.client_cache import default_client_cache
 from pyathena.model import AthenaCompression
 from pyathena.util import RetryConfig, parse_output_location, retry_api_call
 
@@ -117,19 +116,20 @@ def to_parquet(
     import pyarrow as pa
     from pyarrow import parquet as pq
 
-    session = Session(**session_kwargs)
-    client = session.resource("s3", **client_kwargs)
-    bucket = client.Bucket(bucket_name)
+    # The client is shared by the chunks written in the same process.
+    client = default_client_cache.get_client(session_kwargs, "s3", **client_kwargs)
     table = pa.Table.from_pandas(df)
     buf = pa.BufferOutputStream()
     pq.write_table(table, buf, compression=compression, flavor=flavor)
-    response = retry_api_call(
-        bucket.put_object,
+    key = prefix + str(uuid.uuid4())
+    retry_api_call(
+        client.put_object,
         config=retry_config,
+        Bucket=bucket_name,
         Body=buf.getvalue().to_pybytes(),
-        Key=prefix + str(uuid.uuid4()),
+        Key=key,
     )
-    return f"s3://{response.bucket_name}/{response.key}"
+    return f"s3://{bucket_name}/{key}"
 
 
 def to_sql(
@@ -163,9 +163,6 @@ def to_sql(
         location += "/"
 
     bucket_name, key_prefix = parse_output_location(location)
-    bucket = conn.session.resource(
-        "s3", region_name=conn.region_name, **conn._client_kwargs
-    ).Bucket(bucket_name)
     cursor = conn.cursor()
 
     table = cursor.execute(
@@ -190,6 +187,9 @@ def to_sql(
                     """
                 )
             )
+            bucket = conn.session.resource(
+                "s3", region_name=conn.region_name, **conn._client_kwargs
+            ).Bucket(bucket_name)
             objects = bucket.objects.filter(Prefix=key_prefix)
             if list(objects.limit(1)):
                 objects.delete()
@@ -200,8 +200,21 @@ def to_sql(
         futures = []
         session_kwargs = deepcopy(conn._session_kwargs)
         session_kwargs.update({"profile_name": conn.profile_name})
+        if conn._credential_cache_key:
+            # The refreshable credentials of the credential cache
+            # cannot be passed to the other processes.
+            frozen = conn.session.get_credentials().get_frozen_credentials()
+            session_kwargs.update(
+                {
+                    "aws_access_key_id": frozen.access_key,
+                    "aws_secret_access_key": frozen.secret_key,
+                    "aws_session_token": frozen.token,
+                }
+            )
         client_kwargs = deepcopy(conn._client_kwargs)
-        client_kwargs.update({"region_name": conn.region_name})
+        client_kwargs.update(
+            {"region_name": conn.region_name, "max_pool_connections": max_workers}
+        )
         partition_prefixes = []
         if partitions:
             for keys, group in df.groupby(by=partitions, observed=True):
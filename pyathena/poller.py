@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from pyathena.error import OperationalError, ProgrammingError, QueryTimeoutError
+from pyathena.model import AthenaQueryExecution
+from pyathena.polling import PollingStrategy
+from pyathena.util import RetryConfig, retry_api_call
+
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class _PendingQueryExecution(object):
+    def __init__(self, polling_strategy: PollingStrategy) -> None:
+        self.polling_strategy = polling_strategy
+        # The futures and their deadlines in the monotonic clock.
+        self.futures: List[Tuple["Future[AthenaQueryExecution]", Optional[float]]] = []
+        self.attempt = 0
+        self.started = time.monotonic()
+        self.next_poll = self.started
+
+    def expire(self, now: float) -> List["Future[AthenaQueryExecution]"]:
+        """Remove and return the futures whose deadline has passed."""
+        expired = [f for f, d in self.futures if d is not None and d <= now]
+        self.futures = [(f, d) for f, d in self.futures if d is None or d > now]
+        return expired
+
+    def schedule(self, next_poll: float) -> None:
+        """Schedule the next poll, not later than the earliest deadline."""
+        deadlines = [d for _, d in self.futures if d is not None]
+        self.next_poll = min([next_poll] + deadlines)
+
+
+class BatchPoller(object):
+    """Polls the query executions of a connection in a single thread.
+
+    The query executions that are due, as decided by their polling strategy,
+    are checked together with BatchGetQueryExecution, and the future of
+    a query execution is resolved when it reaches the final state."""
+
+    BATCH_GET_QUERY_EXECUTION_MAX_IDS: int = 50
+
+    def __init__(self, client: "BaseClient", retry_config: RetryConfig) -> None:
+        self._client = client
+        self._retry_config = retry_config
+        self._condition = threading.Condition()
+        self._pending: Dict[str, _PendingQueryExecution] = dict()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def client(self) -> "BaseClient":
+        return self._client
+
+    @client.setter
+    def client(self, client: "BaseClient") -> None:
+        """Replace the client used by the next batches,
+        e.g. the one with the larger connection pool."""
+        self._client = client
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def submit(
+        self,
+        query_id: str,
+        polling_strategy: PollingStrategy,
+        deadline: Optional[float] = None,
+    ) -> "Future[AthenaQueryExecution]":
+        """Poll the query execution until it reaches the final state.
+
+        If the deadline in the monotonic clock passes before that,
+        the future fails with QueryTimeoutError. The query is not canceled."""
+        future: "Future[AthenaQueryExecution]" = Future()
+        with self._condition:
+            if self._closed:
+                raise ProgrammingError("BatchPoller is closed.")
+            pending = self._pending.get(query_id, None)
+            if not pending:
+                pending = _PendingQueryExecution(polling_strategy)
+                self._pending[query_id] = pending
+            pending.futures.append((future, deadline))
+            pending.schedule(pending.next_poll)
+            if not self._thread:
+                self._thread = threading.Thread(
+                    target=self._run, name="BatchPoller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            pending = self._pending
+            self._pending = dict()
+            self._condition.notify()
+        for p in pending.values():
+            self._set_exception(p, ProgrammingError("BatchPoller is closed."))
+
+    def _get_due_query_ids(self) -> Optional[List[str]]:
+        """Wait for the query executions that are due to be polled.
+
+        The last batch is filled up with the query executions that are due next,
+        as they are checked in the same call of the API."""
+        size = self.BATCH_GET_QUERY_EXECUTION_MAX_IDS
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                pending = sorted(
+                    (p.next_poll, query_id) for query_id, p in self._pending.items()
+                )
+                due = sum(1 for next_poll, _ in pending if next_poll <= now)
+                if due:
+                    batches = (due + size - 1) // size
+                    return [query_id for _, query_id in pending[: batches * size]]
+                self._condition.wait(pending[0][0] - now if pending else None)
+            return None
+
+    def _run(self) -> None:
+        try:
+            while True:
+                query_ids = self._get_due_query_ids()
+                if query_ids is None:
+                    break
+                size = self.BATCH_GET_QUERY_EXECUTION_MAX_IDS
+                for start in range(0, len(query_ids), size):
+                    end = start + size
+                    self._poll(query_ids[start:end])
+        except Exception as e:
+            # The futures would never be resolved without the thread,
+            # the next submission starts a new thread.
+            _logger.exception("Failed to poll query executions.")
+            with self._condition:
+                pending = self._pending
+                self._pending = dict()
+                self._thread = None
+            for p in pending.values():
+                self._set_exception(p, OperationalError(*e.args))
+
+    def _poll(self, query_ids: List[str]) -> None:
+        try:
+            response = retry_api_call(
+                self._client.batch_get_query_execution,
+                config=self._retry_config,
+                logger=_logger,
+                QueryExecutionIds=query_ids,
+            )
+        except Exception as e:
+            _logger.exception("Failed to batch get query execution.")
+            with self._condition:
+                pending_list = [
+                    self._pending.pop(q) for q in query_ids if q in self._pending
+                ]
+            for p in pending_list:
+                self._set_exception(p, OperationalError(*e.args))
+            return
+
+        now = time.monotonic()
+        finished: List[Tuple[_PendingQueryExecution, AthenaQueryExecution]] = []
+        failed: List[Tuple[_PendingQueryExecution, Exception]] = []
+        expired: List[Tuple[str, "Future[AthenaQueryExecution]"]] = []
+        with self._condition:
+            polled = set()
+            for r in response.get("QueryExecutions", []):
+                query_execution = AthenaQueryExecution({"QueryExecution": r})
+                query_id = r["QueryExecutionId"]
+                pending = self._pending.get(query_id, None)
+                if not pending:
+                    continue
+                polled.add(query_id)
+                if query_execution.state in [
+                    AthenaQueryExecution.STATE_SUCCEEDED,
+                    AthenaQueryExecution.STATE_FAILED,
+                    AthenaQueryExecution.STATE_CANCELLED,
+                ]:
+                    del self._pending[query_id]
+                    finished.append((pending, query_execution))
+                else:
+                    expired.extend((query_id, f) for f in pending.expire(now))
+                    if not pending.futures:
+                        del self._pending[query_id]
+                        continue
+                    try:
+                        interval = pending.polling_strategy.get_interval(
+                            pending.attempt, now - pending.started, query_execution
+                        )
+                    except Exception as e:
+                        _logger.exception("Failed to get the polling interval.")
+                        del self._pending[query_id]
+                        failed.append((pending, OperationalError(*e.args)))
+                        continue
+                    pending.schedule(now + interval)
+                    pending.attempt += 1
+            errors = {
+                u["QueryExecutionId"]: u.get("ErrorMessage", None)
+                for u in response.get("UnprocessedQueryExecutionIds", [])
+            }
+            for query_id in query_ids:
+                if query_id in polled or query_id not in self._pending:
+                    continue
+                failed.append(
+                    (
+                        self._pending.pop(query_id),
+                        OperationalError(
+                            "Failed to get query execution {0}: {1}".format(
+                                query_id, errors.get(query_id, None)
+                            )
+                        ),
+                    )
+                )
+        for pending, query_execution in finished:
+            for future, _ in pending.futures:
+                if future.set_running_or_notify_cancel():
+                    future.set_result(query_execution)
+        for pending, exc in failed:
+            self._set_exception(pending, exc)
+        for query_id, future in expired:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    QueryTimeoutError(
+                        "Query {0} did not finish by the deadline.".format(query_id)
+                    )
+                )
+
+    @staticmethod
+    def _set_exception(pending: _PendingQueryExecution, exc: Exception) -> None:
+        for future, _ in pending.futures:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exc)
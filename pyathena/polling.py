@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import logging
+import random
+import threading
+from abc import ABCMeta, abstractmethod
+from typing import Optional, Tuple
+
+from pyathena.model import AthenaQueryExecution
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+_PredictionKey = Tuple[str, Optional[str]]
+
+
+class PollingStrategy(object, metaclass=ABCMeta):
+    """Decides how long to wait between the calls of GetQueryExecution.
+
+    A strategy is shared by the cursors of the connection, so it must not keep
+    the state of a single query execution."""
+
+    @abstractmethod
+    def get_interval(
+        self, attempt: int, elapsed: float, query_execution: AthenaQueryExecution
+    ) -> float:
+        """Return the seconds to wait before the next poll.
+
+        ``attempt`` is the number of polls that have already waited, and ``elapsed``
+        is the seconds since the polling of the query execution started."""
+        raise NotImplementedError  # pragma: no cover
+
+    def record(self, query_execution: AthenaQueryExecution) -> None:
+        """Called with the query execution that has reached the final state."""
+        pass
+
+
+class FixedPollingStrategy(PollingStrategy):
+    def __init__(self, interval: float = 1) -> None:
+        self.interval = interval
+
+    def get_interval(
+        self, attempt: int, elapsed: float, query_execution: AthenaQueryExecution
+    ) -> float:
+        return self.interval
+
+
+class BackoffPollingStrategy(PollingStrategy):
+    """Polls quickly at first, then waits exponentially longer up to ``max_interval``.
+
+    The interval is reduced randomly by up to ``jitter`` of itself, so that
+    the queries started at the same time do not poll at the same time."""
+
+    DEFAULT_INITIAL_INTERVAL: float = 0.05
+
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = 1,
+        multiplier: float = 2,
+        jitter: float = 0.2,
+    ) -> None:
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+    def get_interval(
+        self, attempt: int, elapsed: float, query_execution: AthenaQueryExecution
+    ) -> float:
+        interval = min(
+            self.max_interval, self.initial_interval * self.multiplier ** attempt
+        )
+        return interval * (1 - random.uniform(0, self.jitter))
+
+
+class PredictivePollingStrategy(BackoffPollingStrategy):
+    """Waits until the predicted completion of the query before backing off.
+
+    The completion is predicted from the execution time (the queue time and
+    the engine execution time) of the previous executions of the same query
+    in the same work group, smoothed with the weight of ``smoothing``.
+    The predictions of up to ``max_entries`` queries are kept."""
+
+    def __init__(
+        self,
+        initial_interval: float = BackoffPollingStrategy.DEFAULT_INITIAL_INTERVAL,
+        max_interval: float = 1,
+        multiplier: float = 2,
+        jitter: float = 0.2,
+        max_wait: float = 60,
+        smoothing: float = 0.5,
+        max_entries: int = 1000,
+    ) -> None:
+        super(PredictivePollingStrategy, self).__init__(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            multiplier=multiplier,
+            jitter=jitter,
+        )
+        self.max_wait = max_wait
+        self.smoothing = smoothing
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Predicted seconds of the execution in the order of the last update.
+        self._predictions: "collections.OrderedDict[_PredictionKey, float]" = (
+            collections.OrderedDict()
+        )
+
+    @staticmethod
+    def _get_key(query_execution: AthenaQueryExecution) -> Optional[_PredictionKey]:
+        if not query_execution.query:
+            return None
+        query_hash = hashlib.sha256(query_execution.query.encode("utf-8")).hexdigest()
+        return query_hash, query_execution.work_group
+
+    @staticmethod
+    def _get_execution_time(query_execution: AthenaQueryExecution) -> Optional[float]:
+        engine = query_execution.engine_execution_time_in_millis
+        if engine is None:
+            return None
+        queue = query_execution.query_queue_time_in_millis
+        return (engine + (queue if queue else 0)) / 1000
+
+    def predict(self, query_execution: AthenaQueryExecution) -> Optional[float]:
+        """Return the predicted seconds of the execution, if the query has been recorded."""
+        key = self._get_key(query_execution)
+        if not key:
+            return None
+        with self._lock:
+            return self._predictions.get(key, None)
+
+    def record(self, query_execution: AthenaQueryExecution) -> None:
+        if query_execution.state != AthenaQueryExecution.STATE_SUCCEEDED:
+            return
+        key = self._get_key(query_execution)
+        execution_time = self._get_execution_time(query_execution)
+        if not key or execution_time is None:
+            return
+        with self._lock:
+            prediction = self._predictions.pop(key, None)
+            if prediction is not None:
+                execution_time = (
+                    self.smoothing * execution_time + (1 - self.smoothing) * prediction
+                )
+            self._predictions[key] = execution_time
+            while len(self._predictions) > self.max_entries:
+                self._predictions.popitem(last=False)
+
+    def get_interval(
+        self, attempt: int, elapsed: float, query_execution: AthenaQueryExecution
+    ) -> float:
+        interval = super(PredictivePollingStrategy, self).get_interval(
+            attempt, elapsed, query_execution
+        )
+        prediction = self.predict(query_execution)
+        if prediction is not None and elapsed + interval < prediction:
+            return min(prediction - elapsed, self.max_wait)
+        return interval
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+# Work group and operation of the prepared statement.
+_Key = Tuple[Optional[str], str]
+
+
+class PreparedStatementCache(object):
+    """Cache of the prepared statements created by a connection.
+
+    The entries are keyed by the work group and the operation, and hold the name
+    of the prepared statement and the names of the parameters in the order of
+    the placeholders. The least recently used entries are evicted when there
+    are more than ``max_size`` entries.
+
+    The name of a prepared statement is derived from its statement,
+    so preparing the statement again after the eviction is idempotent,
+    and the evicted statements are not deleted from the work group."""
+
+    DEFAULT_MAX_SIZE: int = 100
+
+    _NAME_PREFIX: str = "pyathena_"
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Name and parameter names of the statements in the order of the last access.
+        self._entries: "collections.OrderedDict[_Key, Tuple[str, List[str]]]" = (
+            collections.OrderedDict()
+        )
+
+    @classmethod
+    def get_name(cls, statement: str) -> str:
+        return cls._NAME_PREFIX + hashlib.sha256(statement.encode("utf-8")).hexdigest()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
+
+    def get(
+        self, work_group: Optional[str], operation: str
+    ) -> Optional[Tuple[str, List[str]]]:
+        with self._lock:
+            entry = self._entries.get((work_group, operation), None)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((work_group, operation))
+            self.hits += 1
+            return entry
+
+    def put(
+        self, work_group: Optional[str], operation: str, name: str, names: List[str]
+    ) -> None:
+        with self._lock:
+            self._entries[(work_group, operation)] = (name, names)
+            self._entries.move_to_end((work_group, operation))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
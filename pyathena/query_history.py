@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from pyathena.model import AthenaQueryExecution
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+# The query ID, the completion time and the sequence number of the execution.
+_Entry = Tuple[str, float, int]
+
+
+class QueryHistory(object):
+    """Index of the succeeded DML queries, used to find a previous query to re-use.
+
+    The index maps the hash of the query and the work group to the query ID,
+    the completion time and the sequence number of the latest execution.
+    The sequence number counts the executions added to the index for each work group,
+    so the executions added after an entry are counted without scanning the index.
+    The least recently added entries are evicted when there are more than
+    ``max_entries`` entries. It is kept in memory and, if ``path`` is specified,
+    in an SQLite file shared between processes."""
+
+    # ListQueryExecutions lists the primary work group if no work group is specified.
+    DEFAULT_WORK_GROUP: str = "primary"
+    DEFAULT_MAX_ENTRIES: int = 10000
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        sync_interval: float = 0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.path = path
+        self.sync_interval = sync_interval
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._entries: "collections.OrderedDict[Tuple[str, str], _Entry]" = (
+            collections.OrderedDict()
+        )
+        self._sequences: Dict[str, int] = dict()
+        self._markers: Dict[str, str] = dict()
+        self._synced_at: Dict[str, float] = dict()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS query_history (
+                        query_hash TEXT NOT NULL,
+                        work_group TEXT NOT NULL,
+                        query_id TEXT NOT NULL,
+                        completion_date_time REAL NOT NULL,
+                        PRIMARY KEY (query_hash, work_group)
+                    )
+                    """
+                )
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS query_history_marker (
+                        work_group TEXT NOT NULL PRIMARY KEY,
+                        query_id TEXT NOT NULL
+                    )
+                    """
+                )
+            for query_hash, work_group, query_id, completion in self._conn.execute(
+                "SELECT query_hash, work_group, query_id, completion_date_time "
+                "FROM query_history ORDER BY completion_date_time"
+            ):
+                self._put((query_hash, work_group), query_id, completion)
+            for work_group, query_id in self._conn.execute(
+                "SELECT work_group, query_id FROM query_history_marker"
+            ):
+                self._markers[work_group] = query_id
+
+    @staticmethod
+    def get_hash(query: str) -> str:
+        return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+    def _put(
+        self, key: Tuple[str, str], query_id: str, completion: float
+    ) -> List[Tuple[str, str, float]]:
+        """Add the entry as the newest one, and return the keys and the completion
+        times of the entries evicted."""
+        sequence = self._sequences.get(key[1], 0) + 1
+        self._sequences[key[1]] = sequence
+        self._entries.pop(key, None)
+        self._entries[key] = (query_id, completion, sequence)
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            evicted_key, (_, evicted_completion, _) = self._entries.popitem(last=False)
+            evicted.append((evicted_key[0], evicted_key[1], evicted_completion))
+        return evicted
+
+    def add(self, query_execution: AthenaQueryExecution) -> None:
+        if (
+            query_execution.state != AthenaQueryExecution.STATE_SUCCEEDED
+            or query_execution.statement_type != AthenaQueryExecution.STATEMENT_TYPE_DML
+            or not query_execution.query
+            or not query_execution.query_id
+            or not query_execution.completion_date_time
+        ):
+            return
+        key = (
+            self.get_hash(query_execution.query),
+            query_execution.work_group
+            if query_execution.work_group
+            else self.DEFAULT_WORK_GROUP,
+        )
+        completion = query_execution.completion_date_time.timestamp()
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry and entry[1] >= completion:
+                return
+            evicted = self._put(key, query_execution.query_id, completion)
+            if self._conn:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO query_history VALUES (?, ?, ?, ?)",
+                        (key[0], key[1], query_execution.query_id, completion),
+                    )
+                    # The entries updated by the other processes are kept.
+                    self._conn.executemany(
+                        "DELETE FROM query_history WHERE query_hash = ? "
+                        "AND work_group = ? AND completion_date_time <= ?",
+                        evicted,
+                    )
+
+    def get(
+        self,
+        query: str,
+        work_group: Optional[str] = None,
+        expiration_time: Optional[datetime] = None,
+        cache_size: Optional[int] = None,
+    ) -> Optional[str]:
+        """Return the query ID of the latest execution of the query,
+        if it completed after the expiration time and is among the last
+        ``cache_size`` executions added to the index for the work group.
+
+        Only the succeeded DML queries are indexed, so the query can be older
+        than the last ``cache_size`` executions of the work group."""
+        work_group = work_group if work_group else self.DEFAULT_WORK_GROUP
+        key = (self.get_hash(query), work_group)
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if not entry:
+                return None
+            query_id, completion, sequence = entry
+            if expiration_time and completion < expiration_time.timestamp():
+                return None
+            if (
+                cache_size is not None
+                and self._sequences[work_group] - sequence >= cache_size
+            ):
+                return None
+        return query_id
+
+    def get_marker(self, work_group: Optional[str] = None) -> Optional[str]:
+        """Return the newest query ID up to which ListQueryExecutions has been synced."""
+        with self._lock:
+            return self._markers.get(
+                work_group if work_group else self.DEFAULT_WORK_GROUP, None
+            )
+
+    def set_marker(self, work_group: Optional[str], query_id: Optional[str]) -> None:
+        """Record the sync of the work group, and the new marker if the query ID is not None."""
+        work_group = work_group if work_group else self.DEFAULT_WORK_GROUP
+        with self._lock:
+            self._synced_at[work_group] = time.monotonic()
+            if not query_id or self._markers.get(work_group, None) == query_id:
+                return
+            self._markers[work_group] = query_id
+            if self._conn:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO query_history_marker VALUES (?, ?)",
+                        (work_group, query_id),
+                    )
+
+    def needs_sync(self, work_group: Optional[str] = None) -> bool:
+        work_group = work_group if work_group else self.DEFAULT_WORK_GROUP
+        with self._lock:
+            synced_at = self._synced_at.get(work_group, None)
+        return synced_at is None or time.monotonic() - synced_at >= self.sync_interval
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+import collections
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_logger = logging.getLogger(__name__)  # type: ignore
+
+
+class ResultCache(object):
+    """Local on-disk cache of query results.
+
+    The entries are keyed by the query and the catalog, schema and work group
+    it runs in, expire after ``ttl`` seconds (0 means never), and the least
+    recently used entries are evicted when the total size exceeds ``max_size`` bytes.
+
+    The entries are pickled, so the directory must only be writable by trusted users."""
+
+    DEFAULT_MAX_SIZE: int = 1024 * 1024 * 1024
+
+    _SUFFIX: str = ".pickle"
+
+    def __init__(
+        self, path: str, ttl: float = 0, max_size: int = DEFAULT_MAX_SIZE
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        # Size of the entries in the order of the last access.
+        self._entries: "collections.OrderedDict[str, int]" = collections.OrderedDict()
+        self._size = 0
+        os.makedirs(path, exist_ok=True)
+        files = [
+            f for f in os.scandir(path) if f.is_file() and f.name.endswith(self._SUFFIX)
+        ]
+        for f in sorted(files, key=lambda f: f.stat().st_mtime):
+            size = f.stat().st_size
+            self._entries[f.name[: -len(self._SUFFIX)]] = size
+            self._size += size
+        self._evict()
+
+    @staticmethod
+    def get_key(
+        query: str,
+        catalog_name: Optional[str],
+        schema_name: Optional[str],
+        work_group: Optional[str],
+    ) -> str:
+        key = json.dumps([query, catalog_name, schema_name, work_group])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "size": self._size,
+        }
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.path, key + self._SUFFIX)
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            path = self._get_path(key)
+            try:
+                with open(path, "rb") as f:
+                    created, value = pickle.load(f)
+            except FileNotFoundError:
+                self._discard(key)
+                self.misses += 1
+                return None
+            except Exception:
+                _logger.warning("Failed to read the cache %s.", path, exc_info=True)
+                self._remove(key)
+                self.misses += 1
+                return None
+            if self.ttl > 0 and time.time() - created > self.ttl:
+                self._remove(key)
+                self.misses += 1
+                return None
+            os.utime(path)
+            if key not in self._entries:
+                # Written by another process.
+                self._entries[key] = os.path.getsize(path)
+                self._size += self._entries[key]
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        data = pickle.dumps((time.time(), value), protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            try:
+                fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, self._get_path(key))
+            except Exception:
+                _logger.warning("Failed to write the cache.", exc_info=True)
+                return
+            self._discard(key)
+            self._entries[key] = len(data)
+            self._size += len(data)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._discard(key)
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _discard(self, key: str) -> None:
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
@@ -1,13 +1,20 @@
 # -*- coding: utf-8 -*-
+import codecs
 import collections
+import csv
+import itertools
 import logging
+import queue
+import threading
 from abc import abstractmethod
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Deque,
     Dict,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -20,14 +27,57 @@ from pyathena.common import CursorIterator
 from pyathena.converter import Converter
 from pyathena.error import DataError, OperationalError, ProgrammingError
 from pyathena.model import AthenaQueryExecution
-from pyathena.util import RetryConfig, retry_api_call
+from pyathena.util import RetryConfig, parse_output_location, retry_api_call
 
 if TYPE_CHECKING:
+    from botocore.client import BaseClient
+
     from pyathena.connection import Connection
+    from pyathena.result_cache import ResultCache
 
 _logger = logging.getLogger(__name__)  # type: ignore
 
 
+def _mark_nulls(row: List[str], record: str) -> List[Optional[str]]:
+    """Replace the unquoted empty values of the row parsed from the record with None."""
+    values: List[Optional[str]] = []
+    pos = 0
+    for value in row:
+        if record.startswith('"', pos):
+            # The quotes, the doubled quotes in the value and the delimiter.
+            pos += len(value) + value.count('"') + 3
+            values.append(value)
+        else:
+            pos += len(value) + 1
+            values.append(value if value else None)
+    return values
+
+
+def _read_csv(lines: Iterator[str]) -> Iterator[List[Optional[str]]]:
+    """Parse the rows of the CSV file of the query result.
+
+    Athena quotes all the values except NULL, which is written as the unquoted empty
+    value. The csv module returns both as empty strings before Python 3.12, so only
+    the raw records of the rows with empty values are inspected to tell them apart."""
+    record: List[str] = []
+
+    def _record_lines() -> Iterator[str]:
+        # The csv module reads the lines of one record at a time.
+        for line in lines:
+            record.append(line)
+            yield line
+
+    for row in csv.reader(_record_lines()):
+        if not row:
+            # The empty line is the row of a NULL value.
+            yield [None]
+        elif "" in row:
+            yield _mark_nulls(row, "".join(record))
+        else:
+            yield cast(List[Optional[str]], row)
+        record.clear()
+
+
 class AthenaResultSet(CursorIterator):
     def __init__(
         self,
@@ -36,6 +86,10 @@ class AthenaResultSet(CursorIterator):
         query_execution: AthenaQueryExecution,
         arraysize: int,
         retry_config: RetryConfig,
+        prefetch_pages: int = 0,
+        result_cache: Optional["ResultCache"] = None,
+        cache_key: Optional[str] = None,
+        cached_pages: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
         super(AthenaResultSet, self).__init__(arraysize=arraysize)
         self._connection: Optional["Connection"] = connection
@@ -45,14 +99,28 @@ class AthenaResultSet(CursorIterator):
         self._retry_config = retry_config
 
         self._meta_data: Optional[Tuple[Any, ...]] = None
+        self._decoders: Tuple[
+            Optional[Callable[[Optional[str]], Optional[Any]]], ...
+        ] = ()
         self._rows: Deque[
             Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]
         ] = collections.deque()
         self._next_token: Optional[str] = None
+        self._prefetch_pages = prefetch_pages
+        self._prefetch_queue: Optional["queue.Queue[Any]"] = None
+        self._prefetch_stop = threading.Event()
+        self._prefetch_thread: Optional[threading.Thread] = None
+        self._result_cache = result_cache
+        self._cache_key = cache_key
+        self._cached_pages: Optional[Deque[Dict[str, Any]]] = (
+            collections.deque(cached_pages) if cached_pages is not None else None
+        )
+        self._pages: List[Dict[str, Any]] = []
 
         if self.state == AthenaQueryExecution.STATE_SUCCEEDED:
             self._rownumber = 0
             self._pre_fetch()
+            self._start_prefetch()
 
     @property
     def database(self) -> Optional[str]:
@@ -206,6 +274,8 @@ class AthenaResultSet(CursorIterator):
             raise ProgrammingError("QueryExecutionState is not SUCCEEDED.")
         if self.is_closed:
             raise ProgrammingError("AthenaResultSet is closed.")
+        if self._cached_pages is not None:
+            return self._cached_pages.popleft()
         request = {
             "QueryExecutionId": self.query_id,
             "MaxResults": self._arraysize,
@@ -218,25 +288,93 @@ class AthenaResultSet(CursorIterator):
                 connection.client.get_query_results,
                 config=self._retry_config,
                 logger=_logger,
-                **request
+                **request,
             )
         except Exception as e:
             _logger.exception("Failed to fetch result set.")
             raise OperationalError(*e.args) from e
         else:
+            if self._result_cache and self._cache_key:
+                self._cache_page(response)
             return response
 
+    def _cache_page(self, response: Dict[str, Any]) -> None:
+        self._pages.append(
+            {k: v for k, v in response.items() if k != "ResponseMetadata"}
+        )
+        if not response.get("NextToken", None):
+            # Cache the result once all the pages are fetched.
+            cast("ResultCache", self._result_cache).put(
+                cast(str, self._cache_key),
+                {"query_execution": self._query_execution, "pages": self._pages},
+            )
+            self._pages = []
+
+    def _fetch_page(
+        self, next_token: Optional[str]
+    ) -> Tuple[
+        List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]], Optional[str]
+    ]:
+        response = self.__fetch(next_token)
+        return (
+            self._get_processed_rows(response, first_page=False),
+            response.get("NextToken", None),
+        )
+
     def _fetch(self):
         if not self._next_token:
             raise ProgrammingError("NextToken is none or empty.")
-        response = self.__fetch(self._next_token)
-        self._process_rows(response)
+        if self._prefetch_queue is not None:
+            page = self._prefetch_queue.get()
+            if isinstance(page, Exception):
+                self._stop_prefetch()
+                raise page
+            rows, next_token = page
+        else:
+            rows, next_token = self._fetch_page(self._next_token)
+        self._rows.extend(rows)
+        self._next_token = next_token
 
     def _pre_fetch(self):
         response = self.__fetch()
         self._process_meta_data(response)
         self._process_rows(response)
 
+    def _start_prefetch(self) -> None:
+        if self._prefetch_pages <= 0 or not self._next_token:
+            return
+        # The queue size bounds the number of pages held in memory.
+        self._prefetch_queue = queue.Queue(maxsize=self._prefetch_pages)
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch, args=(self._next_token,), daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _prefetch(self, next_token: Optional[str]) -> None:
+        prefetch_queue = cast("queue.Queue[Any]", self._prefetch_queue)
+        try:
+            while next_token and not self._prefetch_stop.is_set():
+                page = self._fetch_page(next_token)
+                prefetch_queue.put(page)
+                next_token = page[1]
+        except Exception as e:
+            if not self._prefetch_stop.is_set():
+                prefetch_queue.put(e)
+
+    def _stop_prefetch(self) -> None:
+        if not self._prefetch_thread:
+            return
+        self._prefetch_stop.set()
+        prefetch_queue = cast("queue.Queue[Any]", self._prefetch_queue)
+        while self._prefetch_thread.is_alive():
+            # Make room so that a worker blocked on put can finish.
+            try:
+                prefetch_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._prefetch_thread = None
+        self._prefetch_queue = None
+
     def fetchone(self):
         if not self._rows and self._next_token:
             self._fetch()
@@ -251,25 +389,60 @@ class AthenaResultSet(CursorIterator):
     def fetchmany(self, size: Optional[int] = None):
         if not size or size <= 0:
             size = self._arraysize
-        rows = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
+        rows: List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]] = []
+        while len(rows) < size:
+            if not self._rows and self._next_token:
+                self._fetch()
+            if not self._rows:
                 break
+            remaining = size - len(rows)
+            if remaining >= len(self._rows):
+                rows.extend(self._rows)
+                self._rows.clear()
+            else:
+                rows.extend([self._rows.popleft() for _ in range(remaining)])
+        self._add_rownumber(len(rows))
         return rows
 
     def fetchall(self):
-        rows = []
+        rows: List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]] = []
         while True:
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
+            rows.extend(self._rows)
+            self._rows.clear()
+            if not self._next_token:
                 break
+            self._fetch()
+        self._add_rownumber(len(rows))
         return rows
 
+    def _next_rows(
+        self, size: int
+    ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
+        """Take up to ``size`` rows of the current page out of the result set, fetching
+        the next page if there are none. An empty list is returned once all the rows
+        are fetched. The rows are not counted in ``rownumber`` until they are returned
+        with ``_return_rows``, along with the ones not iterated."""
+        while not self._rows and self._next_token:
+            self._fetch()
+        return [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+
+    def _return_rows(
+        self,
+        rows: List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]],
+        count: int,
+    ) -> None:
+        """Count the first ``count`` rows taken by ``_next_rows``, and put the rest of
+        them back to the front of the result set."""
+        self._rows.extendleft(reversed(rows[count:]))
+        self._add_rownumber(count)
+
+    def _add_rownumber(self, count: int) -> None:
+        if not count:
+            return
+        if self._rownumber is None:
+            self._rownumber = 0
+        self._rownumber += count
+
     def _process_meta_data(self, response: Dict[str, Any]) -> None:
         result_set = response.get("ResultSet", None)
         if not result_set:
@@ -281,39 +454,50 @@ class AthenaResultSet(CursorIterator):
         if column_info is None:
             raise DataError("KeyError `ColumnInfo`")
         self._meta_data = tuple(column_info)
+        self._decoders = tuple(
+            self._converter.get_decoder(meta.get("Type", None))
+            for meta in self._meta_data
+        )
 
     def _get_rows(
         self, offset: int, meta_data: Tuple[Any, ...], rows: List[Dict[str, Any]]
     ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
+        decoders = self._decoders
         return [
             tuple(
                 [
-                    self._converter.convert(
-                        meta.get("Type", None), row.get("VarCharValue", None)
+                    value if decoder is None else decoder(value)
+                    for decoder, value in zip(
+                        decoders,
+                        [
+                            data.get("VarCharValue", None)
+                            for data in row.get("Data", [])
+                        ],
                     )
-                    for meta, row in zip(meta_data, rows[i].get("Data", []))
                 ]
             )
-            for i in range(offset, len(rows))
+            for row in itertools.islice(rows, offset, None)
         ]
 
-    def _process_rows(self, response: Dict[str, Any]) -> None:
+    def _get_processed_rows(
+        self, response: Dict[str, Any], first_page: bool
+    ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
         result_set = response.get("ResultSet", None)
         if not result_set:
             raise DataError("KeyError `ResultSet`")
         rows = result_set.get("Rows", None)
         if rows is None:
             raise DataError("KeyError `Rows`")
-        processed_rows = []
-        if len(rows) > 0:
-            offset = (
-                1
-                if not self._next_token and self._is_first_row_column_labels(rows)
-                else 0
-            )
-            meta_data = cast(Tuple[Any, ...], self._meta_data)
-            processed_rows = self._get_rows(offset, meta_data, rows)
-        self._rows.extend(processed_rows)
+        if len(rows) == 0:
+            return []
+        offset = 1 if first_page and self._is_first_row_column_labels(rows) else 0
+        meta_data = cast(Tuple[Any, ...], self._meta_data)
+        return self._get_rows(offset, meta_data, rows)
+
+    def _process_rows(self, response: Dict[str, Any]) -> None:
+        self._rows.extend(
+            self._get_processed_rows(response, first_page=not self._next_token)
+        )
         self._next_token = response.get("NextToken", None)
 
     def _is_first_row_column_labels(self, rows: List[Dict[str, Any]]) -> bool:
@@ -324,17 +508,64 @@ class AthenaResultSet(CursorIterator):
                 return False
         return True
 
+    def _get_unload_locations(
+        self, client: "BaseClient", unload_location: str
+    ) -> List[str]:
+        """Return the locations of the files written by the UNLOAD statement.
+
+        The files are listed in the data manifest, the unload location is listed
+        if the query execution has no data manifest."""
+        try:
+            if self.data_manifest_location:
+                bucket, key = parse_output_location(self.data_manifest_location)
+                response = retry_api_call(
+                    client.get_object,
+                    config=self._retry_config,
+                    logger=_logger,
+                    Bucket=bucket,
+                    Key=key,
+                )
+                manifest = response["Body"].read().decode("utf-8")
+                return [line for line in manifest.splitlines() if line]
+            bucket, prefix = parse_output_location(unload_location)
+            locations: List[str] = []
+            next_token: Optional[str] = None
+            while True:
+                request = {"Bucket": bucket, "Prefix": prefix}
+                if next_token:
+                    request.update({"ContinuationToken": next_token})
+                response = retry_api_call(
+                    client.list_objects_v2,
+                    config=self._retry_config,
+                    logger=_logger,
+                    **request,
+                )
+                locations.extend(
+                    "s3://{0}/{1}".format(bucket, c["Key"])
+                    for c in response.get("Contents", [])
+                    if not c["Key"].endswith("/")
+                )
+                next_token = response.get("NextContinuationToken", None)
+                if not next_token:
+                    break
+            return locations
+        except Exception as e:
+            _logger.exception("Failed to find the unloaded files.")
+            raise OperationalError(*e.args) from e
+
     @property
     def is_closed(self) -> bool:
         return self._connection is None
 
     def close(self) -> None:
+        self._stop_prefetch()
         self._connection = None
         self._query_execution = None
         self._meta_data = None
         self._rows.clear()
         self._next_token = None
         self._rownumber = None
+        self._pages = []
 
     def __enter__(self):
         return self
@@ -351,19 +582,181 @@ class AthenaDictResultSet(AthenaResultSet):
     def _get_rows(
         self, offset: int, meta_data: Tuple[Any, ...], rows: List[Dict[str, Any]]
     ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
+        columns = [
+            (meta.get("Name", None), decoder)
+            for meta, decoder in zip(meta_data, self._decoders)
+        ]
+        return [
+            self.dict_type(
+                [
+                    (
+                        name,
+                        value if decoder is None else decoder(value),
+                    )
+                    for (name, decoder), value in zip(
+                        columns,
+                        [
+                            data.get("VarCharValue", None)
+                            for data in row.get("Data", [])
+                        ],
+                    )
+                ]
+            )
+            for row in itertools.islice(rows, offset, None)
+        ]
+
+
+class AthenaStreamingResultSet(AthenaResultSet):
+    """Result set that reads the CSV file at `output_location` directly from S3.
+
+    Only the first page is retrieved with GetQueryResults to get the metadata,
+    the rows are then parsed incrementally from the S3 object stream.
+    Results that are not CSV files (e.g. DDL output) fall back to GetQueryResults.
+    """
+
+    DEFAULT_BLOCK_SIZE: int = 1024 * 1024 * 8
+
+    def __init__(
+        self,
+        connection: "Connection",
+        converter: Converter,
+        query_execution: AthenaQueryExecution,
+        arraysize: int,
+        retry_config: RetryConfig,
+        prefetch_pages: int = 0,
+        result_cache: Optional["ResultCache"] = None,
+        cache_key: Optional[str] = None,
+        cached_pages: Optional[List[Dict[str, Any]]] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        # The cursor does not use the result cache with the streaming result set,
+        # the arguments are accepted as the cursor passes them to all result sets.
+        # They are not passed to the fetch of the metadata, whose page has only one row.
+        super(AthenaStreamingResultSet, self).__init__(
+            connection=connection,
+            converter=converter,
+            query_execution=query_execution,
+            arraysize=1,  # Fetch one row to retrieve metadata
+            retry_config=retry_config,
+        )
+        self._arraysize = arraysize
+        self._block_size = block_size
+        self._body: Optional[Any] = None
+        self._reader: Optional[Iterator[List[Optional[str]]]] = None
+        if (
+            self.state == AthenaQueryExecution.STATE_SUCCEEDED
+            and self.output_location
+            and self.output_location.endswith(".csv")
+        ):
+            self._rows.clear()
+            self._next_token = None
+            self._open_stream()
+        self._prefetch_pages = prefetch_pages
+        if self.state == AthenaQueryExecution.STATE_SUCCEEDED:
+            self._start_prefetch()
+
+    def _open_stream(self) -> None:
+        bucket, key = parse_output_location(cast(str, self.output_location))
+        connection = cast("Connection", self._connection)
+        client = connection.get_client("s3")
+        try:
+            response = retry_api_call(
+                client.get_object,
+                config=self._retry_config,
+                logger=_logger,
+                Bucket=bucket,
+                Key=key,
+            )
+        except Exception as e:
+            _logger.exception("Failed to download csv.")
+            raise OperationalError(*e.args) from e
+        self._body = response["Body"]
+        if not response["ContentLength"]:  # Allow empty response
+            self._close_stream()
+            return
+        reader = _read_csv(self._iter_lines())
+        next(reader, None)  # Skip the header row
+        self._reader = reader
+        # The remaining pages are read from the S3 object instead of NextToken.
+        self._next_token = self.output_location
+
+    def _iter_lines(self) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        while True:
+            chunk = self._body.read(self._block_size) if self._body else b""
+            text = pending + decoder.decode(chunk, final=not chunk)
+            if not chunk:
+                if text:
+                    yield text
+                break
+            # Only the line feed ends the lines, e.g. the carriage return and
+            # the other line boundaries of str.splitlines can be in the values.
+            lines = text.split("\n")
+            # The last line can be incomplete, keep it until the next chunk.
+            pending = lines.pop()
+            for line in lines:
+                yield line + "\n"
+
+    def _close_stream(self) -> None:
+        self._reader = None
+        if self._body:
+            self._body.close()
+            self._body = None
+
+    def _fetch_page(
+        self, next_token: Optional[str]
+    ) -> Tuple[
+        List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]], Optional[str]
+    ]:
+        if not self._reader:
+            return super(AthenaStreamingResultSet, self)._fetch_page(next_token)
+        rows = list(itertools.islice(self._reader, self._arraysize))
+        if len(rows) < self._arraysize:
+            self._close_stream()
+            next_token = None
+        meta_data = cast(Tuple[Any, ...], self._meta_data)
+        return self._get_csv_rows(meta_data, rows), next_token
+
+    def _get_csv_rows(
+        self, meta_data: Tuple[Any, ...], rows: List[List[Optional[str]]]
+    ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
+        decoders = self._decoders
+        return [
+            tuple(
+                [
+                    value if decoder is None else decoder(value)
+                    for decoder, value in zip(decoders, row)
+                ]
+            )
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        self._stop_prefetch()
+        self._close_stream()
+        super(AthenaStreamingResultSet, self).close()
+
+
+class AthenaStreamingDictResultSet(AthenaStreamingResultSet, AthenaDictResultSet):
+    def _get_csv_rows(
+        self, meta_data: Tuple[Any, ...], rows: List[List[Optional[str]]]
+    ) -> List[Union[Tuple[Optional[Any], ...], Dict[Any, Optional[Any]]]]:
+        columns = [
+            (meta.get("Name", None), decoder)
+            for meta, decoder in zip(meta_data, self._decoders)
+        ]
         return [
             self.dict_type(
                 [
                     (
-                        meta.get("Name"),
-                        self._converter.convert(
-                            meta.get("Type", None), row.get("VarCharValue", None)
-                        ),
+                        name,
+                        value if decoder is None else decoder(value),
                     )
-                    for meta, row in zip(meta_data, rows[i].get("Data", []))
+                    for (name, decoder), value in zip(columns, row)
                 ]
             )
-            for i in range(offset, len(rows))
+            for row in rows
         ]
 
 
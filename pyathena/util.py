@@ -1,14 +1,28 @@
 # -*- coding: utf-8 -*-
+import collections
 import functools
+import io
 import logging
 import re
 import threading
-from typing import Any, Callable, Iterable, Pattern, Tuple
+from concurrent.futures import Future
+from concurrent.futures.thread import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Pattern,
+    Tuple,
+)
 
-import tenacity
-from tenacity import after_log, retry_if_exception, stop_after_attempt, wait_exponential
+from pyathena import DataError, OperationalError
 
-from pyathena import DataError
+if TYPE_CHECKING:
+    from botocore.client import BaseClient
 
 _logger = logging.getLogger(__name__)  # type: ignore
 
@@ -28,13 +42,19 @@ def parse_output_location(output_location: str) -> Tuple[str, str]:
 def synchronized(wrapped: Callable[..., Any]) -> Any:
     """The missing @synchronized decorator
 
-    https://git.io/vydTA"""
-    _lock = threading.RLock()
+    https://git.io/vydTA
+
+    The decorated methods of an instance share a re-entrant lock of the instance,
+    so the methods of different instances can be called at the same time."""
 
     @functools.wraps(wrapped)
-    def _wrapper(*args, **kwargs):
-        with _lock:
-            return wrapped(*args, **kwargs)
+    def _wrapper(self, *args, **kwargs):
+        lock = self.__dict__.get("_synchronized_lock", None)
+        if lock is None:
+            # setdefault is atomic, so every thread gets the same lock.
+            lock = self.__dict__.setdefault("_synchronized_lock", threading.RLock())
+        with lock:
+            return wrapped(self, *args, **kwargs)
 
     return _wrapper
 
@@ -61,10 +81,19 @@ class RetryConfig(object):
 def retry_api_call(
     func: Callable[..., Any],
     config: RetryConfig,
-    logger: logging.Logger = None,
+    logger: Optional[logging.Logger] = None,
     *args,
-    **kwargs
+    **kwargs,
 ) -> Any:
+    # tenacity is imported on the first call of the API, not with pyathena.
+    import tenacity
+    from tenacity import (
+        after_log,
+        retry_if_exception,
+        stop_after_attempt,
+        wait_exponential,
+    )
+
     retry = tenacity.Retrying(
         retry=retry_if_exception(
             lambda e: getattr(e, "response", {}).get("Error", {}).get("Code", None)
@@ -82,3 +111,136 @@ def retry_api_call(
         reraise=True,
     )
     return retry(func, *args, **kwargs)
+
+
+class _RangedObjectReader(io.RawIOBase):
+    """Raw reader of the parts of an object downloaded by the executor.
+
+    At most ``max_parts`` parts are downloaded ahead of the part being read,
+    so the memory used does not depend on the size of the object."""
+
+    def __init__(
+        self,
+        get_range: Callable[[int, int], bytes],
+        ranges: Iterator[Tuple[int, int]],
+        max_parts: int,
+    ) -> None:
+        super(_RangedObjectReader, self).__init__()
+        self._get_range = get_range
+        self._ranges = ranges
+        self._max_parts = max_parts
+        self._executor = ThreadPoolExecutor(max_workers=max_parts)
+        self._parts: Deque["Future[bytes]"] = collections.deque()
+        self._buffer = memoryview(b"")
+        self._submit()
+
+    def _submit(self) -> None:
+        while len(self._parts) < self._max_parts:
+            range_ = next(self._ranges, None)
+            if range_ is None:
+                break
+            self._parts.append(self._executor.submit(self._get_range, *range_))
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        while not self._buffer:
+            if not self._parts:
+                return 0
+            # Parts are consumed in order while the later ones are still downloading.
+            part = self._parts.popleft()
+            self._submit()
+            try:
+                self._buffer = memoryview(part.result())
+            except Exception as e:
+                _logger.exception("Failed to download the part of the object.")
+                raise OperationalError(*e.args) from e
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.cancel()
+        self._parts.clear()
+        self._buffer = memoryview(b"")
+        self._executor.shutdown(wait=False)
+        super(_RangedObjectReader, self).close()
+
+
+def get_object_ranges(
+    client: "BaseClient",
+    bucket: str,
+    key: str,
+    length: int,
+    part_size: int,
+    max_workers: int,
+    config: RetryConfig,
+    logger: Optional[logging.Logger] = None,
+) -> io.BufferedReader:
+    """Download the S3 object with concurrent ranged GET requests.
+
+    Returns a file-like object that reads the parts in order.
+    The errors of the requests are raised from the reads as OperationalError."""
+
+    def _get_range(start: int, end: int) -> bytes:
+        response = retry_api_call(
+            client.get_object,
+            config=config,
+            logger=logger,
+            Bucket=bucket,
+            Key=key,
+            Range=f"bytes={start}-{end}",
+        )
+        body: bytes = response["Body"].read()
+        return body
+
+    ranges = (
+        (start, min(start + part_size, length) - 1)
+        for start in range(0, length, part_size)
+    )
+    return io.BufferedReader(_RangedObjectReader(_get_range, ranges, max_workers))
+
+
+def get_object(
+    client: "BaseClient",
+    bucket: str,
+    key: str,
+    max_workers: int,
+    part_size: int,
+    config: RetryConfig,
+    logger: Optional[logging.Logger] = None,
+) -> Tuple[int, Any]:
+    """Download the S3 object, with concurrent ranged GET requests
+    if max_workers is more than one.
+
+    Returns the length and a file-like object of the body."""
+    if max_workers > 1:
+        response = retry_api_call(
+            client.head_object,
+            config=config,
+            logger=logger,
+            Bucket=bucket,
+            Key=key,
+        )
+        length = response["ContentLength"]
+        return length, get_object_ranges(
+            client,
+            bucket,
+            key,
+            length,
+            part_size=part_size,
+            max_workers=max_workers,
+            config=config,
+            logger=logger,
+        )
+    response = retry_api_call(
+        client.get_object,
+        config=config,
+        logger=logger,
+        Bucket=bucket,
+        Key=key,
+    )
+    return response["ContentLength"], response["Body"]
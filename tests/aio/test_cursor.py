@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+
+from pyathena.aio.connection import AioConnection
+from pyathena.aio.cursor import AioCursor
+from pyathena.error import OperationalError, ProgrammingError, QueryTimeoutError
+from pyathena.model import AthenaQueryExecution
+from tests import SCHEMA, WithConnect
+from tests.util import with_cursor
+
+
+class TestAioCursor(unittest.TestCase, WithConnect):
+    def connect(self, **opts):
+        return AioConnection(schema_name=SCHEMA, **opts)
+
+    @with_cursor()
+    async def test_fetchone(self, cursor):
+        self.assertIsInstance(cursor, AioCursor)
+        await cursor.execute("SELECT * FROM one_row")
+        self.assertEqual(cursor.rownumber, 0)
+        self.assertEqual(await cursor.fetchone(), (1,))
+        self.assertEqual(cursor.rownumber, 1)
+        self.assertIsNone(await cursor.fetchone())
+        self.assertEqual(cursor.state, AthenaQueryExecution.STATE_SUCCEEDED)
+
+    @with_cursor()
+    async def test_fetchmany(self, cursor):
+        await cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        self.assertEqual(len(await cursor.fetchmany(10)), 10)
+        self.assertEqual(len(await cursor.fetchmany(10)), 5)
+
+    @with_cursor()
+    async def test_fetchall(self, cursor):
+        await cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        self.assertEqual(await cursor.fetchall(), [(i,) for i in range(10000)])
+
+    @with_cursor()
+    async def test_async_iterator(self, cursor):
+        await cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        self.assertEqual([row async for row in cursor], [(i,) for i in range(10000)])
+
+    @with_cursor()
+    async def test_concurrent_execute(self, cursor):
+        async def _execute(i):
+            async with cursor.connection.cursor() as c:
+                await c.execute("SELECT %(i)d AS i", {"i": i})
+                return await c.fetchall()
+
+        self.assertEqual(
+            await asyncio.gather(*[_execute(i) for i in range(20)]),
+            [[(i,)] for i in range(20)],
+        )
+
+    @with_cursor()
+    async def test_bad_query(self, cursor):
+        with self.assertRaises(OperationalError):
+            await cursor.execute(
+                "SELECT does_not_exist FROM this_really_does_not_exist"
+            )
+
+    @with_cursor()
+    async def test_no_result_set(self, cursor):
+        with self.assertRaises(ProgrammingError):
+            await cursor.fetchone()
+
+    @with_cursor()
+    async def test_cancel(self, cursor):
+        task = asyncio.ensure_future(
+            cursor.execute(
+                """
+                SELECT a.a * rand(), b.a * rand()
+                FROM many_rows a
+                CROSS JOIN many_rows b
+                """
+            )
+        )
+        await asyncio.sleep(3)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        query_execution = await cursor.connection.run_in_executor(
+            cursor._poll, cursor.query_id
+        )
+        self.assertEqual(query_execution.state, AthenaQueryExecution.STATE_CANCELLED)
+
+    @with_cursor()
+    async def test_timeout(self, cursor):
+        with self.assertRaises(QueryTimeoutError):
+            await cursor.execute(
+                """
+                SELECT a.a * rand(), b.a * rand()
+                FROM many_rows a
+                CROSS JOIN many_rows b
+                """,
+                timeout=3,
+            )
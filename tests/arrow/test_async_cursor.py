@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import unittest
+
+from pyathena.arrow.async_cursor import AsyncArrowCursor
+from pyathena.arrow.result_set import AthenaArrowResultSet
+from pyathena.model import AthenaQueryExecution
+from tests import WithConnect
+from tests.util import with_cursor
+
+
+class TestAsyncArrowCursor(unittest.TestCase, WithConnect):
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_fetchone(self, cursor):
+        query_id, future = cursor.execute("SELECT * FROM one_row")
+        result_set = future.result()
+        self.assertIsInstance(result_set, AthenaArrowResultSet)
+        self.assertEqual(result_set.state, AthenaQueryExecution.STATE_SUCCEEDED)
+        self.assertEqual(result_set.rownumber, 0)
+        self.assertEqual(result_set.fetchone(), (1,))
+        self.assertEqual(result_set.rownumber, 1)
+        self.assertIsNone(result_set.fetchone())
+
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_fetchmany(self, cursor):
+        query_id, future = cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        result_set = future.result()
+        self.assertEqual(len(result_set.fetchmany(10)), 10)
+        self.assertEqual(len(result_set.fetchmany(10)), 5)
+
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_fetchall(self, cursor):
+        query_id, future = cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        result_set = future.result()
+        self.assertEqual(result_set.fetchall(), [(i,) for i in range(10000)])
+
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_as_arrow(self, cursor):
+        query_id, future = cursor.execute("SELECT * FROM many_rows")
+        table = future.result().as_arrow()
+        self.assertEqual(table.shape, (10000, 1))
+
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_as_pandas(self, cursor):
+        query_id, future = cursor.execute("SELECT * FROM many_rows")
+        df = future.result().as_pandas()
+        self.assertEqual(df.shape, (10000, 1))
+
+    @with_cursor(cursor_class=AsyncArrowCursor)
+    def test_executemany(self, cursor):
+        future = cursor.executemany(
+            "SELECT %(x)d FROM one_row", [{"x": i} for i in range(1, 3)]
+        )
+        self.assertIsNone(future.result())
+
+    def test_open_close(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(AsyncArrowCursor):
+                pass
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import random
+import string
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+import pyarrow as pa
+
+from pyathena.arrow.cursor import ArrowCursor
+from pyathena.arrow.result_set import AthenaArrowResultSet
+from pyathena.error import ProgrammingError
+from pyathena.model import AthenaQueryExecution
+from tests import ENV, S3_PREFIX, SCHEMA, WithConnect
+from tests.util import with_cursor
+
+
+class TestArrowCursor(unittest.TestCase, WithConnect):
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_fetchone(self, cursor):
+        cursor.execute("SELECT * FROM one_row")
+        self.assertEqual(cursor.rownumber, 0)
+        self.assertEqual(cursor.fetchone(), (1,))
+        self.assertEqual(cursor.rownumber, 1)
+        self.assertIsNone(cursor.fetchone())
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_fetchmany(self, cursor):
+        cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        self.assertEqual(len(cursor.fetchmany(10)), 10)
+        self.assertEqual(len(cursor.fetchmany(10)), 5)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_fetchall(self, cursor):
+        cursor.execute("SELECT * FROM one_row")
+        self.assertEqual(cursor.fetchall(), [(1,)])
+        cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_iterator(self, cursor):
+        cursor.execute("SELECT * FROM one_row")
+        self.assertEqual(list(cursor), [(1,)])
+        self.assertRaises(StopIteration, cursor.__next__)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_arraysize(self, cursor):
+        cursor.arraysize = 5
+        cursor.execute("SELECT * FROM many_rows LIMIT 20")
+        self.assertEqual(len(cursor.fetchmany()), 5)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_arraysize_default(self, cursor):
+        self.assertEqual(cursor.arraysize, AthenaArrowResultSet.DEFAULT_FETCH_SIZE)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_complex(self, cursor):
+        cursor.execute(
+            """
+            SELECT
+              col_boolean
+              ,col_tinyint
+              ,col_smallint
+              ,col_int
+              ,col_bigint
+              ,col_float
+              ,col_double
+              ,col_string
+              ,col_timestamp
+              ,CAST(col_timestamp AS time) AS col_time
+              ,col_date
+              ,col_binary
+              ,col_array
+              ,CAST(col_array AS json) AS col_array_json
+              ,col_map
+              ,CAST(col_map AS json) AS col_map_json
+              ,col_struct
+              ,col_decimal
+            FROM one_row_complex
+            """
+        )
+        self.assertEqual(
+            cursor.fetchall(),
+            [
+                (
+                    True,
+                    127,
+                    32767,
+                    2147483647,
+                    9223372036854775807,
+                    0.5,
+                    0.25,
+                    "a string",
+                    datetime(2017, 1, 1, 0, 0, 0),
+                    datetime(2017, 1, 1, 0, 0, 0).time(),
+                    date(2017, 1, 2),
+                    b"123",
+                    "[1, 2]",
+                    [1, 2],
+                    "{1=2, 3=4}",
+                    {"1": 2, "3": 4},
+                    "{a=1, b=2}",
+                    Decimal("0.1"),
+                )
+            ],
+        )
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_fetch_no_data(self, cursor):
+        self.assertRaises(ProgrammingError, cursor.fetchone)
+        self.assertRaises(ProgrammingError, cursor.fetchmany)
+        self.assertRaises(ProgrammingError, cursor.fetchall)
+        self.assertRaises(ProgrammingError, cursor.as_arrow)
+        self.assertRaises(ProgrammingError, cursor.as_pandas)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_as_arrow(self, cursor):
+        table = cursor.execute("SELECT * FROM one_row").as_arrow()
+        self.assertEqual(table.shape, (1, 1))
+        self.assertEqual(table.schema.field("number_of_rows").type, pa.int32())
+        self.assertEqual(table.to_pydict(), {"number_of_rows": [1]})
+        self.assertEqual(cursor.state, AthenaQueryExecution.STATE_SUCCEEDED)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_many_as_arrow(self, cursor):
+        table = cursor.execute("SELECT * FROM many_rows").as_arrow()
+        self.assertEqual(table.shape, (10000, 1))
+        self.assertEqual(sorted(table.column("a").to_pylist()), list(range(10000)))
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_as_pandas(self, cursor):
+        df = cursor.execute("SELECT * FROM many_rows").as_pandas()
+        self.assertEqual(df.shape, (10000, 1))
+        self.assertEqual(sorted(df["a"].tolist()), list(range(10000)))
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_null_values(self, cursor):
+        cursor.execute(
+            """
+            SELECT * FROM (VALUES (1, '', 0.5), (NULL, 'a', NULL), (NULL, NULL, NULL))
+            """
+        )
+        self.assertEqual(
+            cursor.fetchall(),
+            [(1, "", 0.5), (None, "a", None), (None, None, None)],
+        )
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_not_skip_blank_lines(self, cursor):
+        cursor.execute(
+            """
+            SELECT * FROM (VALUES (1), (NULL))
+            """
+        )
+        self.assertEqual(len(cursor.fetchall()), 2)
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_show_columns(self, cursor):
+        cursor.execute("SHOW COLUMNS IN one_row")
+        self.assertEqual(cursor.fetchall(), [("number_of_rows      ",)])
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_empty_result(self, cursor):
+        table = "test_arrow_cursor_empty_result_" + "".join(
+            [random.choice(string.ascii_lowercase + string.digits) for _ in range(10)]
+        )
+        location = "{0}{1}/{2}/".format(ENV.s3_staging_dir, S3_PREFIX, table)
+        result = cursor.execute(
+            """
+            CREATE EXTERNAL TABLE IF NOT EXISTS
+            {schema}.{table} (number_of_rows INT)
+            ROW FORMAT DELIMITED FIELDS TERMINATED BY '\t'
+            LINES TERMINATED BY '\n' STORED AS TEXTFILE
+            LOCATION '{location}'
+            """.format(
+                schema=SCHEMA, table=table, location=location
+            )
+        ).as_arrow()
+        self.assertEqual(result.shape, (0, 0))
+
+    @with_cursor(cursor_class=ArrowCursor)
+    def test_null_decimal_value(self, cursor):
+        cursor.execute("SELECT CAST(null AS DECIMAL)")
+        self.assertEqual(cursor.fetchall(), [(None,)])
+
+    def test_open_close(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(ArrowCursor):
+                pass
+
+    def test_no_ops(self):
+        conn = self.connect()
+        cursor = conn.cursor(ArrowCursor)
+        cursor.close()
+        conn.close()
+
+    def test_unload(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(ArrowCursor, unload=True) as cursor:
+                table = cursor.execute("SELECT * FROM many_rows").as_arrow()
+                self.assertEqual(table.shape, (10000, 1))
+                self.assertEqual(table.schema.field("a").type, pa.int32())
+                self.assertEqual(
+                    sorted(table.column("a").to_pylist()), list(range(10000))
+                )
+                self.assertEqual(
+                    cursor.description,
+                    [("a", "integer", None, None, 0, 0, "NULLABLE")],
+                )
+                cursor.execute("SELECT col_decimal, col_date FROM one_row_complex")
+                self.assertEqual(
+                    cursor.fetchall(), [(Decimal("0.1"), date(2017, 1, 2))]
+                )
+                # Statements other than SELECT are executed as is.
+                cursor.execute("SHOW COLUMNS IN one_row")
+                self.assertEqual(cursor.fetchall(), [("number_of_rows      ",)])
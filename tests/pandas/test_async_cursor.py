@@ -8,7 +8,7 @@ from datetime import datetime
 from random import randint
 
 from pyathena.async_cursor import AsyncCursor
-from pyathena.error import NotSupportedError, ProgrammingError
+from pyathena.error import ProgrammingError
 from pyathena.model import AthenaQueryExecution
 from pyathena.pandas.async_cursor import AsyncPandasCursor
 from pyathena.result_set import AthenaResultSet
@@ -232,14 +232,12 @@ class TestAsyncPandasCursor(unittest.TestCase, WithConnect):
             with conn.cursor(AsyncCursor):
                 pass
 
-    def test_no_ops(self):
-        conn = self.connect()
-        cursor = conn.cursor(AsyncCursor)
-        self.assertRaises(
-            NotSupportedError, lambda: cursor.executemany("SELECT * FROM one_row", [])
+    @with_cursor(cursor_class=AsyncPandasCursor)
+    def test_executemany(self, cursor):
+        future = cursor.executemany(
+            "SELECT %(x)d FROM one_row", [{"x": i} for i in range(1, 3)]
         )
-        cursor.close()
-        conn.close()
+        self.assertIsNone(future.result())
 
     @with_cursor(cursor_class=AsyncPandasCursor)
     def test_empty_result(self, cursor):
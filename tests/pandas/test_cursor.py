@@ -34,6 +34,15 @@ class TestPandasCursor(unittest.TestCase, WithConnect):
         self.assertEqual(len(cursor.fetchmany(10)), 10)
         self.assertEqual(len(cursor.fetchmany(10)), 5)
 
+    @with_cursor(cursor_class=PandasCursor)
+    def test_positional_arguments(self, cursor):
+        # keep_default_na, na_values and quoting follow cache_expiration_time.
+        df = cursor.execute(
+            "SELECT 'NA' AS a, '' AS b", None, None, None, 0, 0, False, [""], 1
+        ).as_pandas()
+        self.assertEqual(df["a"][0], "NA")
+        self.assertTrue(pd.isna(df["b"][0]))
+
     @with_cursor(cursor_class=PandasCursor)
     def test_fetchall(self, cursor):
         cursor.execute("SELECT * FROM one_row")
@@ -41,6 +50,16 @@ class TestPandasCursor(unittest.TestCase, WithConnect):
         cursor.execute("SELECT a FROM many_rows ORDER BY a")
         self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
 
+    @with_cursor(cursor_class=PandasCursor)
+    def test_fetch_column_types(self, cursor):
+        # The values of a row keep the dtype of each column.
+        cursor.execute("SELECT 1 AS a, 0.5 AS b")
+        row = cursor.fetchone()
+        self.assertEqual(row, (1, 0.5))
+        self.assertNotIsInstance(row[0], float)
+        self.assertEqual(cursor.fetchall(), [])
+        self.assertEqual(cursor.rownumber, 1)
+
     @with_cursor(cursor_class=PandasCursor)
     def test_iterator(self, cursor):
         cursor.execute("SELECT * FROM one_row")
@@ -179,6 +198,59 @@ class TestPandasCursor(unittest.TestCase, WithConnect):
             [(row["a"],) for _, row in df.iterrows()], [(i,) for i in range(10000)]
         )
 
+    @with_cursor(cursor_class=PandasCursor)
+    def test_chunksize_as_pandas(self, cursor):
+        chunks = cursor.execute(
+            "SELECT * FROM many_rows ORDER BY a", chunksize=1000
+        ).as_pandas()
+        shapes = []
+        values = []
+        for df in chunks:
+            shapes.append(df.shape)
+            values.extend(df["a"])
+        self.assertEqual(shapes, [(1000, 1)] * 10)
+        self.assertEqual(values, list(range(10000)))
+
+        cursor.execute("SELECT * FROM many_rows ORDER BY a", chunksize=1000)
+        self.assertEqual(cursor.fetchmany(1500), [(i,) for i in range(1500)])
+        self.assertEqual(cursor.fetchall(), [(i,) for i in range(1500, 10000)])
+        self.assertEqual(cursor.rownumber, 10000)
+
+        cursor.execute("SELECT * FROM one_row LIMIT 0", chunksize=1000)
+        self.assertEqual(list(cursor.as_pandas()), [])
+
+    def test_parallel_download_as_pandas(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(
+                PandasCursor, download_max_workers=4, download_part_size=1024
+            ) as cursor:
+                df = cursor.execute("SELECT * FROM many_rows ORDER BY a").as_pandas()
+                self.assertEqual(df.shape[0], 10000)
+                self.assertEqual(list(df["a"]), list(range(10000)))
+                df = cursor.execute("SELECT * FROM one_row LIMIT 0").as_pandas()
+                self.assertEqual(df.shape[0], 0)
+                chunks = cursor.execute(
+                    "SELECT * FROM many_rows ORDER BY a", chunksize=1000
+                ).as_pandas()
+                self.assertEqual(
+                    [v for df in chunks for v in df["a"]], list(range(10000))
+                )
+
+    def test_unload_as_pandas(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(PandasCursor, unload=True) as cursor:
+                df = cursor.execute("SELECT * FROM many_rows").as_pandas()
+                self.assertEqual(df.shape, (10000, 1))
+                self.assertEqual(sorted(df["a"]), list(range(10000)))
+                df = cursor.execute("SELECT * FROM integer_na_values").as_pandas()
+                self.assertEqual(df["a"].dtype, pd.Int64Dtype())
+                chunks = cursor.execute(
+                    "SELECT * FROM many_rows", chunksize=3000
+                ).as_pandas()
+                self.assertEqual([c.shape[0] for c in chunks], [3000, 3000, 3000, 1000])
+                cursor.execute("SELECT * FROM one_row")
+                self.assertEqual(cursor.fetchall(), [(1,)])
+
     @with_cursor(cursor_class=PandasCursor)
     def test_complex_as_pandas(self, cursor):
         df = cursor.execute(
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+import unittest
+
+from pyathena.admission import AdmissionController
+from pyathena.async_cursor import AsyncCursor
+from pyathena.connection import Connection
+from pyathena.error import OperationalError, ProgrammingError
+from pyathena.poller import BatchPoller
+
+
+class _Client(object):
+    def __init__(self):
+        self.started = []
+
+    def start_query_execution(self, **kwargs):
+        self.started.append(kwargs["QueryString"])
+        return {"QueryExecutionId": str(len(self.started))}
+
+
+class TestAdmissionController(unittest.TestCase):
+    def test_limit(self):
+        controller = AdmissionController(initial_limit=2)
+        controller.acquire("wg")
+        controller.acquire("wg")
+        self.assertRaises(
+            OperationalError, lambda: controller.acquire("wg", timeout=0.1)
+        )
+        # The limit is kept for each work group.
+        controller.acquire(None)
+        controller.release("wg")
+        controller.acquire("wg", timeout=0.1)
+        stats = controller.stats
+        self.assertEqual(stats["wg"]["in_flight"], 2)
+        self.assertEqual(stats["wg"]["queued"], 0)
+        self.assertEqual(stats["wg"]["admitted"], 3)
+        self.assertEqual(stats["primary"]["in_flight"], 1)
+
+    def test_queue(self):
+        controller = AdmissionController(initial_limit=1, priority=True)
+        controller.acquire("wg")
+        admitted = []
+
+        def _acquire(name, priority):
+            controller.acquire("wg", priority=priority)
+            admitted.append(name)
+
+        threads = []
+        for name, priority in [("low", 0), ("high", 10), ("middle", 5)]:
+            thread = threading.Thread(target=_acquire, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            # Wait for the thread to be queued.
+            while controller.stats["wg"]["queued"] < len(threads):
+                time.sleep(0.01)
+        for _ in threads:
+            controller.release("wg")
+            while controller.stats["wg"]["in_flight"] == 0:
+                time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(admitted, ["high", "middle", "low"])
+        self.assertGreater(controller.stats["wg"]["max_wait"], 0)
+
+    def test_aimd(self):
+        controller = AdmissionController(initial_limit=4, min_limit=1, max_limit=5)
+        for _ in range(5):
+            controller.record_success("wg")
+        self.assertEqual(controller.stats["wg"]["limit"], 5)
+        for _ in range(10):
+            controller.record_success("wg")
+        self.assertEqual(controller.stats["wg"]["limit"], 5)
+        controller.record_throttle("wg")
+        self.assertEqual(controller.stats["wg"]["limit"], 2)
+        controller.record_throttle("wg")
+        controller.record_throttle("wg")
+        self.assertEqual(controller.stats["wg"]["limit"], 1)
+        self.assertEqual(controller.stats["wg"]["throttled"], 3)
+
+    def test_cursor_priority(self):
+        # StartQueryExecution is called in the thread of execute, so the queries are
+        # started in the order of the priority only by the admission controller.
+        controller = AdmissionController(initial_limit=1, max_limit=1, priority=True)
+        conn = Connection(
+            s3_staging_dir="s3://bucket/path/",
+            region_name="us-west-2",
+            admission_controller=controller,
+        )
+        cursor = conn.cursor()
+        client = _Client()
+        conn._client = client
+        query_id = cursor._execute("SELECT 0")
+        threads = []
+        for name, priority in [("low", 0), ("high", 10), ("middle", 5)]:
+            thread = threading.Thread(
+                target=cursor._execute,
+                args=("SELECT '{0}'".format(name),),
+                kwargs={"priority": priority},
+            )
+            thread.start()
+            threads.append(thread)
+            while controller.stats["primary"]["queued"] < len(threads):
+                time.sleep(0.01)
+        cursor._release_admission(query_id)
+        for _ in threads:
+            while controller.stats["primary"]["in_flight"] == 0:
+                time.sleep(0.01)
+            controller.release("primary")
+        for thread in threads:
+            thread.join()
+        self.assertEqual(
+            client.started,
+            ["SELECT 0", "SELECT 'high'", "SELECT 'middle'", "SELECT 'low'"],
+        )
+
+    def test_cursor_submit_failure(self):
+        controller = AdmissionController(initial_limit=1)
+        conn = Connection(
+            s3_staging_dir="s3://bucket/path/",
+            region_name="us-west-2",
+            admission_controller=controller,
+        )
+        with conn.cursor(AsyncCursor) as cursor:
+            client = _Client()
+            conn._client = client
+            # The query is started, but the poller fails to accept it.
+            poller = BatchPoller(client, conn.retry_config)
+            poller.close()
+            conn._poller = poller
+            self.assertRaises(ProgrammingError, lambda: cursor.execute("SELECT 1"))
+            self.assertEqual(client.started, ["SELECT 1"])
+            self.assertEqual(controller.stats["primary"]["in_flight"], 0)
+            self.assertEqual(cursor._admitted_query_ids, {})
@@ -6,7 +6,7 @@ from datetime import datetime
 from random import randint
 
 from pyathena.async_cursor import AsyncCursor, AsyncDictCursor
-from pyathena.error import NotSupportedError, ProgrammingError
+from pyathena.error import OperationalError, ProgrammingError, QueryTimeoutError
 from pyathena.model import AthenaQueryExecution
 from pyathena.result_set import AthenaResultSet
 from tests import WithConnect
@@ -222,19 +222,76 @@ class TestAsyncCursor(unittest.TestCase, WithConnect):
         self.assertEqual(result_set.fetchmany(), [])
         self.assertEqual(result_set.fetchall(), [])
 
+    @with_cursor(cursor_class=AsyncCursor)
+    def test_timeout(self, cursor):
+        query_id, future = cursor.execute(
+            """
+            SELECT a.a * rand(), b.a * rand()
+            FROM many_rows a
+            CROSS JOIN many_rows b
+            """,
+            timeout=3,
+        )
+        self.assertRaises(QueryTimeoutError, future.result)
+        query_execution = cursor.poll(query_id).result()
+        self.assertEqual(query_execution.state, AthenaQueryExecution.STATE_CANCELLED)
+
+    @with_cursor(cursor_class=AsyncCursor)
+    def test_cancel_future(self, cursor):
+        query_id, future = cursor.execute(
+            """
+            SELECT a.a * rand(), b.a * rand()
+            FROM many_rows a
+            CROSS JOIN many_rows b
+            """
+        )
+        time.sleep(3)
+        self.assertTrue(future.cancel())
+        query_execution = cursor.poll(query_id).result()
+        self.assertEqual(query_execution.state, AthenaQueryExecution.STATE_CANCELLED)
+
+    def test_batch_poller(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(AsyncCursor, max_workers=2) as cursor:
+                futures = [
+                    cursor.execute("SELECT %(i)d AS i", {"i": i})[1] for i in range(60)
+                ]
+                self.assertEqual(
+                    [f.result().fetchall() for f in futures],
+                    [[(i,)] for i in range(60)],
+                )
+                self.assertEqual(conn.poller.pending, 0)
+
+    @with_cursor(cursor_class=AsyncCursor, max_workers=1)
+    def test_priority(self, cursor):
+        futures = [
+            cursor.execute("SELECT %(i)d AS i", {"i": i}, priority=i % 3)[1]
+            for i in range(6)
+        ]
+        self.assertEqual(
+            [f.result().fetchall() for f in futures], [[(i,)] for i in range(6)]
+        )
+
     def test_open_close(self):
         with contextlib.closing(self.connect()) as conn:
             with conn.cursor(AsyncCursor):
                 pass
 
-    def test_no_ops(self):
-        conn = self.connect()
-        cursor = conn.cursor(AsyncCursor)
-        self.assertRaises(
-            NotSupportedError, lambda: cursor.executemany("SELECT * FROM one_row", [])
+    @with_cursor(cursor_class=AsyncCursor)
+    def test_executemany(self, cursor):
+        future = cursor.executemany(
+            "SELECT %(x)d FROM one_row", [{"x": i} for i in range(10)], concurrency=3
+        )
+        self.assertIsNone(future.result())
+        self.assertEqual(cursor.connection.poller.pending, 0)
+
+    @with_cursor(cursor_class=AsyncCursor)
+    def test_executemany_failure(self, cursor):
+        future = cursor.executemany(
+            "SELECT 1 / %(x)d FROM one_row", [{"x": 1}, {"x": 0}, {"x": 2}]
         )
-        cursor.close()
-        conn.close()
+        with self.assertRaisesRegex(OperationalError, "Failed to execute 1 of 3"):
+            future.result()
 
 
 class TestAsyncDictCursor(unittest.TestCase, WithConnect):
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import gc
+import unittest
+from unittest.mock import patch
+
+from boto3.session import Session
+from botocore.config import Config
+
+from pyathena.client_cache import ClientCache
+from tests import ENV, WithConnect
+
+
+class TestClientCache(unittest.TestCase, WithConnect):
+    def setUp(self):
+        self.cache = ClientCache()
+        self.session = {"aws_access_key_id": "key", "aws_secret_access_key": "secret"}
+
+    def test_get_client_session(self):
+        client = self.cache.get_client(self.session, "s3", region_name="us-west-2")
+        self.assertIs(
+            client,
+            self.cache.get_client(
+                {"aws_access_key_id": "key", "aws_secret_access_key": "secret"},
+                "s3",
+                region_name="us-west-2",
+            ),
+        )
+        self.assertIsNot(
+            client,
+            self.cache.get_client(
+                {"aws_access_key_id": "other", "aws_secret_access_key": "secret"},
+                "s3",
+                region_name="us-west-2",
+            ),
+        )
+        self.assertEqual(self.cache.stats["sessions"], 2)
+
+        session = Session(**self.session)
+        client = self.cache.get_client(session, "s3", region_name="us-west-2")
+        self.assertIs(
+            client, self.cache.get_client(session, "s3", region_name="us-west-2")
+        )
+        self.assertIsNot(
+            client,
+            self.cache.get_client(
+                Session(**self.session), "s3", region_name="us-west-2"
+            ),
+        )
+        self.assertEqual(self.cache.stats["sessions"], 2)
+
+    def test_get_client_session_key(self):
+        client = self.cache.get_client(
+            Session(**self.session), "s3", region_name="us-west-2", session_key="key"
+        )
+        self.assertIs(
+            client,
+            self.cache.get_client(
+                Session(**self.session),
+                "s3",
+                region_name="us-west-2",
+                session_key="key",
+            ),
+        )
+        self.assertIsNot(
+            client,
+            self.cache.get_client(
+                Session(**self.session),
+                "s3",
+                region_name="us-west-2",
+                session_key="other",
+            ),
+        )
+
+    def test_get_client_garbage_collected(self):
+        session = Session(**self.session)
+        client = self.cache.get_client(session, "s3", region_name="us-west-2")
+        session_id = id(session)
+        del session
+        gc.collect()
+        # The new session can have the same id as the garbage collected one.
+        session = Session(**self.session)
+        with patch("pyathena.client_cache.id", return_value=session_id, create=True):
+            self.assertIsNot(
+                client, self.cache.get_client(session, "s3", region_name="us-west-2")
+            )
+
+    def test_get_client(self):
+        client = self.cache.get_client(self.session, "s3", region_name="us-west-2")
+        self.assertIs(
+            client, self.cache.get_client(self.session, "s3", region_name="us-west-2")
+        )
+        self.assertIsNot(
+            client, self.cache.get_client(self.session, "s3", region_name="us-east-1")
+        )
+        self.assertIsNot(
+            client,
+            self.cache.get_client(self.session, "athena", region_name="us-west-2"),
+        )
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_get_client_config(self):
+        client = self.cache.get_client(
+            self.session,
+            "s3",
+            region_name="us-west-2",
+            config=Config(retries={"max_attempts": 10}),
+        )
+        self.assertIs(
+            client,
+            self.cache.get_client(
+                self.session,
+                "s3",
+                region_name="us-west-2",
+                config=Config(retries={"max_attempts": 10}),
+            ),
+        )
+        self.assertIsNot(
+            client,
+            self.cache.get_client(
+                self.session,
+                "s3",
+                region_name="us-west-2",
+                config=Config(retries={"max_attempts": 5}),
+            ),
+        )
+
+    def test_max_pool_connections(self):
+        client = self.cache.get_client(self.session, "s3", region_name="us-west-2")
+        self.assertIs(
+            client,
+            self.cache.get_client(
+                self.session, "s3", region_name="us-west-2", max_pool_connections=5
+            ),
+        )
+        client = self.cache.get_client(
+            self.session, "s3", region_name="us-west-2", max_pool_connections=50
+        )
+        self.assertEqual(client.meta.config.max_pool_connections, 50)
+        client = self.cache.get_client(
+            self.session,
+            "s3",
+            region_name="us-west-2",
+            max_pool_connections=50,
+            config=Config(max_pool_connections=100),
+        )
+        self.assertEqual(client.meta.config.max_pool_connections, 100)
+
+    def test_evict(self):
+        cache = ClientCache(max_size=1)
+        client = cache.get_client(self.session, "s3", region_name="us-west-2")
+        cache.get_client(self.session, "athena", region_name="us-west-2")
+        self.assertIsNot(
+            client, cache.get_client(self.session, "s3", region_name="us-west-2")
+        )
+        self.assertEqual(cache.stats["clients"], 1)
+
+    def test_connection(self):
+        with contextlib.closing(self.connect()) as conn1:
+            with contextlib.closing(self.connect()) as conn2:
+                self.assertIsNot(conn1.session, conn2.session)
+                self.assertIs(conn1.client, conn2.client)
+                self.assertIs(conn1.get_client("s3"), conn2.get_client("s3"))
+        with contextlib.closing(self.connect(client_cache=self.cache)) as conn:
+            poller = conn.poller
+            conn._ensure_max_pool_connections(50)
+            self.assertEqual(conn.client.meta.config.max_pool_connections, 50)
+            # The poller created before uses the new client.
+            self.assertIs(poller.client, conn.client)
+            self.assertEqual(conn.client.meta.region_name, ENV.region_name)
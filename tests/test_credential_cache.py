@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+import os
+import stat
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from pyathena.client_cache import ClientCache
+from pyathena.connection import Connection
+from pyathena.credential_cache import CredentialCache
+
+
+def _credentials(seconds, access_key_id="ACCESS_KEY_ID"):
+    return {
+        "AccessKeyId": access_key_id,
+        "SecretAccessKey": "SECRET_ACCESS_KEY",
+        "SessionToken": "SESSION_TOKEN",
+        "Expiration": datetime.now(timezone.utc) + timedelta(seconds=seconds),
+    }
+
+
+class TestCredentialCache(unittest.TestCase):
+    def test_get_key(self):
+        args = ("arn:aws:iam::123:role/a", None, None, None, "session", 3600)
+        key = CredentialCache.get_key(*args)
+        self.assertEqual(key, CredentialCache.get_key(*args))
+        for i, value in enumerate(
+            ["arn:aws:iam::123:role/b", "serial", "profile", "key", "other", 900]
+        ):
+            other = list(args)
+            other[i] = value
+            self.assertNotEqual(key, CredentialCache.get_key(*other))
+
+    def test_get_put(self):
+        cache = CredentialCache()
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", dict(_credentials(3600), AssumedRoleUser={}))
+        credentials = cache.get("key")
+        self.assertEqual(credentials["AccessKeyId"], "ACCESS_KEY_ID")
+        self.assertNotIn("AssumedRoleUser", credentials)
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 1, "entries": 1})
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+
+    def test_expired(self):
+        cache = CredentialCache(refresh_margin=60)
+        cache.put("key", _credentials(30))
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", _credentials(90))
+        self.assertIsNotNone(cache.get("key"))
+
+    def test_get_credentials(self):
+        cache = CredentialCache()
+        fetched = []
+
+        def fetch():
+            fetched.append(1)
+            return _credentials(3600)
+
+        first = cache.get_credentials("key", fetch)
+        second = cache.get_credentials("key", fetch)
+        self.assertEqual(first, second)
+        self.assertEqual(len(fetched), 1)
+
+    def test_get_session(self):
+        cache = CredentialCache()
+        fetched = []
+
+        def fetch():
+            fetched.append(1)
+            # The first credentials expire before they are used.
+            return _credentials(30 if len(fetched) == 1 else 3600, str(len(fetched)))
+
+        session = cache.get_session("key", fetch, region_name="us-west-2")
+        other = cache.get_session("key", fetch, region_name="us-west-2")
+        self.assertIsNot(session, other)
+        self.assertIs(session.get_credentials(), other.get_credentials())
+        self.assertEqual(session.region_name, "us-west-2")
+        self.assertEqual(len(fetched), 1)
+
+        # botocore refreshes the expiring credentials through the cache.
+        frozen = session.get_credentials().get_frozen_credentials()
+        self.assertEqual(frozen.access_key, "2")
+        self.assertEqual(len(fetched), 2)
+        frozen = other.get_credentials().get_frozen_credentials()
+        self.assertEqual(frozen.access_key, "2")
+        self.assertEqual(len(fetched), 2)
+
+    def test_connection(self):
+        cache = CredentialCache()
+        kwargs = {
+            "s3_staging_dir": "s3://bucket/path/",
+            "region_name": "us-west-2",
+            "role_arn": "arn:aws:iam::123:role/a",
+            "role_session_name": "session",
+            "client_cache": ClientCache(),
+            "credential_cache": cache,
+        }
+        with patch.object(
+            Connection, "_assume_role", return_value=_credentials(3600)
+        ) as assume_role:
+            conn = Connection(**kwargs)
+            other = Connection(**kwargs)
+            self.assertEqual(assume_role.call_count, 1)
+            self.assertIsNot(conn.session, other.session)
+            self.assertIs(
+                conn.session.get_credentials(), other.session.get_credentials()
+            )
+            self.assertIsNotNone(conn._credential_cache_key)
+            # The sessions of the same credentials share the clients.
+            self.assertIs(conn.client, other.client)
+            frozen = conn.session.get_credentials().get_frozen_credentials()
+            self.assertEqual(frozen.access_key, "ACCESS_KEY_ID")
+
+            conn = Connection(**dict(kwargs, role_session_name="other"))
+            self.assertEqual(assume_role.call_count, 2)
+
+            # The credentials of MFA are cached, but not refreshed.
+            conn = Connection(**dict(kwargs, serial_number="serial"))
+            other = Connection(**dict(kwargs, serial_number="serial"))
+            self.assertEqual(assume_role.call_count, 3)
+            self.assertIsNone(conn._credential_cache_key)
+            self.assertEqual(conn.session.get_credentials().access_key, "ACCESS_KEY_ID")
+            self.assertEqual(conn._client_session, other._client_session)
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "credentials.json")
+            cache = CredentialCache(path)
+            cache.put("key", _credentials(3600))
+            cache.put("expired", _credentials(0))
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+            # e.g. the cache of another process.
+            other = CredentialCache(path)
+            self.assertEqual(other.get("key"), cache.get("key"))
+            self.assertIsNone(other.get("expired"))
+            self.assertIsNone(other.get("other"))
+
+            # The credentials fetched at the same time by another process are used.
+            def fetch():
+                other.put("fetched", _credentials(3600, "OTHER_ACCESS_KEY_ID"))
+                return _credentials(3600)
+
+            credentials = cache.get_credentials("fetched", fetch)
+            self.assertEqual(credentials["AccessKeyId"], "OTHER_ACCESS_KEY_ID")
+
+            # Only the credentials of the cache are removed from the file.
+            other.put("other", _credentials(3600))
+            cache.clear()
+            self.assertIsNone(CredentialCache(path).get("key"))
+            self.assertIsNone(CredentialCache(path).get("fetched"))
+            self.assertIsNotNone(CredentialCache(path).get("other"))
+
+    def test_broken_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "credentials.json")
+            with open(path, "w") as f:
+                f.write("{")
+            cache = CredentialCache(path)
+            self.assertIsNone(cache.get("key"))
+            cache.put("key", _credentials(3600))
+            self.assertIsNotNone(CredentialCache(path).get("key"))
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import contextlib
 import re
+import tempfile
 import time
 import unittest
 from concurrent import futures
@@ -20,9 +21,18 @@ from pyathena import (
     TIME,
     connect,
 )
+from pyathena.converter import DefaultTypeConverter
 from pyathena.cursor import Cursor, DictCursor
-from pyathena.error import DatabaseError, NotSupportedError, ProgrammingError
+from pyathena.error import (
+    DatabaseError,
+    NotSupportedError,
+    OperationalError,
+    ProgrammingError,
+    QueryTimeoutError,
+)
 from pyathena.model import AthenaQueryExecution
+from pyathena.query_history import QueryHistory
+from pyathena.result_cache import ResultCache
 from tests import ENV, S3_PREFIX, SCHEMA, WORK_GROUP, WithConnect
 from tests.util import with_cursor
 
@@ -66,6 +76,9 @@ class TestCursor(unittest.TestCase, WithConnect):
         actual2 = cursor.fetchmany(10)
         self.assertEqual(len(actual2), 5)
         self.assertEqual(actual2, [(i,) for i in range(10, 15)])
+        self.assertEqual(cursor.rownumber, 15)
+        self.assertEqual(cursor.fetchmany(10), [])
+        self.assertEqual(cursor.rownumber, 15)
 
     @with_cursor()
     def test_fetchall(self, cursor):
@@ -73,6 +86,11 @@ class TestCursor(unittest.TestCase, WithConnect):
         self.assertEqual(cursor.fetchall(), [(1,)])
         cursor.execute("SELECT a FROM many_rows ORDER BY a")
         self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+        self.assertEqual(cursor.rownumber, 10000)
+        cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        self.assertEqual(cursor.fetchmany(1500), [(i,) for i in range(1500)])
+        self.assertEqual(cursor.fetchall(), [(i,) for i in range(1500, 10000)])
+        self.assertEqual(cursor.rownumber, 10000)
 
     @with_cursor()
     def test_iterator(self, cursor):
@@ -80,6 +98,30 @@ class TestCursor(unittest.TestCase, WithConnect):
         self.assertEqual(list(cursor), [(1,)])
         self.assertRaises(StopIteration, cursor.__next__)
 
+    @with_cursor()
+    def test_iterator_pages(self, cursor):
+        cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        self.assertEqual(cursor.fetchone(), (0,))
+        self.assertEqual(cursor.fetchmany(10), [(i,) for i in range(1, 11)])
+        self.assertEqual(list(cursor), [(i,) for i in range(11, 10000)])
+        self.assertEqual(cursor.rownumber, 10000)
+        self.assertEqual(list(cursor), [])
+
+    @with_cursor()
+    def test_iterator_break(self, cursor):
+        cursor.execute("SELECT a FROM many_rows ORDER BY a")
+        for row in cursor:
+            if row == (150,):
+                break
+        self.assertEqual(cursor.rownumber, 151)
+        self.assertEqual(cursor.fetchone(), (151,))
+        for row in cursor:
+            if row == (1500,):
+                break
+        self.assertEqual(cursor.rownumber, 1501)
+        self.assertEqual(cursor.fetchall(), [(i,) for i in range(1501, 10000)])
+        self.assertEqual(cursor.rownumber, 10000)
+
     @with_cursor()
     def test_cache_size(self, cursor):
         # To test caching, we need to make sure the query is unique, otherwise
@@ -378,6 +420,32 @@ class TestCursor(unittest.TestCase, WithConnect):
             cursor.fetchall(), [(None if a % 11 == 0 else a,) for a in range(10000)]
         )
 
+    def test_custom_converter(self):
+        class CustomTypeConverter(DefaultTypeConverter):
+            def convert(self, type_, value):
+                if type_ == "integer" and value is not None:
+                    return str(value)
+                return super(CustomTypeConverter, self).convert(type_, value)
+
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(converter=CustomTypeConverter()) as cursor:
+                cursor.execute("SELECT * FROM one_row")
+                self.assertEqual(cursor.fetchall(), [("1",)])
+                cursor.execute("SELECT CAST(null AS INTEGER), 'a', CAST(1.5 AS DOUBLE)")
+                self.assertEqual(cursor.fetchall(), [(None, "a", 1.5)])
+
+    def test_custom_converter_null(self):
+        converter = DefaultTypeConverter()
+        converter.set("integer", lambda v: -1 if v is None else int(v))
+        converter.set("varchar", lambda v: "" if v is None else v)
+        for streaming in [False, True]:
+            with contextlib.closing(self.connect()) as conn:
+                with conn.cursor(converter=converter, streaming=streaming) as cursor:
+                    cursor.execute(
+                        "SELECT CAST(null AS INTEGER), 1, CAST(null AS VARCHAR)"
+                    )
+                    self.assertEqual(cursor.fetchall(), [(-1, 1, "")])
+
     @with_cursor()
     def test_query_id(self, cursor):
         self.assertIsNone(cursor.query_id)
@@ -538,6 +606,36 @@ class TestCursor(unittest.TestCase, WithConnect):
                 ),
             )
 
+    @with_cursor()
+    def test_timeout(self, cursor):
+        with self.assertRaises(QueryTimeoutError):
+            cursor.execute(
+                """
+                SELECT a.a * rand(), b.a * rand()
+                FROM many_rows a
+                CROSS JOIN many_rows b
+                """,
+                timeout=3,
+            )
+        query_execution = cursor._poll(cursor.query_id)
+        self.assertEqual(query_execution.state, AthenaQueryExecution.STATE_CANCELLED)
+
+    @with_cursor()
+    def test_deadline(self, cursor):
+        cursor.execute("SELECT * FROM one_row", deadline=time.time() + 60)
+        self.assertEqual(cursor.fetchall(), [(1,)])
+        self.assertRaises(
+            QueryTimeoutError,
+            lambda: cursor.execute(
+                """
+                SELECT a.a * rand(), b.a * rand()
+                FROM many_rows a
+                CROSS JOIN many_rows b
+                """,
+                deadline=time.time() + 3,
+            ),
+        )
+
     @with_cursor()
     def test_cancel_initial(self, cursor):
         self.assertRaises(ProgrammingError, cursor.cancel)
@@ -554,6 +652,29 @@ class TestCursor(unittest.TestCase, WithConnect):
             for f in futures.as_completed(fs):
                 self.assertEqual(f.result(), [(1,)])
 
+    def test_multiple_cursor(self):
+        query = """
+                SELECT count(*) FROM many_rows a
+                CROSS JOIN many_rows b
+                WHERE a.a = b.a
+                """
+        with contextlib.closing(self.connect()) as conn:
+            cursors = [conn.cursor(), conn.cursor()]
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fs = [executor.submit(c.execute, query) for c in cursors]
+                for f in fs:
+                    self.assertEqual(f.result().fetchall(), [(10000,)])
+            executions = [c._get_query_execution(c.query_id) for c in cursors]
+            # Each query is submitted before the other one completes.
+            self.assertLess(
+                executions[0].submission_date_time,
+                executions[1].completion_date_time,
+            )
+            self.assertLess(
+                executions[1].submission_date_time,
+                executions[0].completion_date_time,
+            )
+
     def test_no_ops(self):
         conn = self.connect()
         cursor = conn.cursor()
@@ -603,6 +724,17 @@ class TestCursor(unittest.TestCase, WithConnect):
         cursor.execute("SELECT * FROM execute_many")
         self.assertEqual(sorted(cursor.fetchall()), [(i,) for i in range(1, 3)])
 
+    @with_cursor()
+    def test_executemany_failure(self, cursor):
+        with self.assertRaises(OperationalError) as cm:
+            cursor.executemany(
+                "SELECT 1 / %(x)d FROM one_row",
+                [{"x": 1}, {"x": 0}, {"x": 2}],
+                concurrency=2,
+            )
+        self.assertIn("Failed to execute 1 of 3 statements", str(cm.exception))
+        self.assertIn("#1 ", str(cm.exception))
+
     @with_cursor()
     def test_executemany_fetch(self, cursor):
         cursor.executemany("SELECT %(x)d FROM one_row", [{"x": i} for i in range(1, 2)])
@@ -611,6 +743,118 @@ class TestCursor(unittest.TestCase, WithConnect):
         self.assertRaises(ProgrammingError, cursor.fetchmany)
         self.assertRaises(ProgrammingError, cursor.fetchone)
 
+    def test_streaming(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(streaming=True) as cursor:
+                cursor.execute("SELECT * FROM one_row")
+                self.assertEqual(cursor.rownumber, 0)
+                self.assertEqual(cursor.fetchone(), (1,))
+                self.assertEqual(cursor.rownumber, 1)
+                self.assertIsNone(cursor.fetchone())
+                cursor.execute("SELECT * FROM many_rows LIMIT 15")
+                self.assertEqual(cursor.fetchmany(10), [(i,) for i in range(10)])
+                self.assertEqual(cursor.fetchmany(10), [(i,) for i in range(10, 15)])
+                cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+                cursor.execute("SELECT IF(a % 11 = 0, null, a) FROM many_rows")
+                self.assertEqual(
+                    cursor.fetchall(),
+                    [(None if a % 11 == 0 else a,) for a in range(10000)],
+                )
+                cursor.execute("SELECT %(param)s FROM one_row", {"param": 'a\nb,"c'})
+                self.assertEqual(cursor.fetchall(), [('a\nb,"c',)])
+                cursor.execute("SELECT '', CAST(NULL AS VARCHAR) FROM one_row")
+                self.assertEqual(cursor.fetchall(), [("", None)])
+
+    def test_prefetch(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(prefetch_pages=2) as cursor:
+                cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                self.assertEqual(cursor.fetchmany(10), [(i,) for i in range(10)])
+                self.assertEqual(cursor.fetchall(), [(i,) for i in range(10, 10000)])
+                # Close the result set while the pages are being prefetched.
+                cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                self.assertEqual(cursor.fetchone(), (0,))
+
+    def test_streaming_no_data(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(streaming=True) as cursor:
+                cursor.execute("SELECT * FROM one_row LIMIT 0")
+                self.assertIsNone(cursor.fetchone())
+                self.assertEqual(cursor.fetchall(), [])
+                cursor.execute("SHOW TABLES")
+                self.assertTrue(cursor.fetchall())
+
+    def test_result_cache(self):
+        with tempfile.TemporaryDirectory() as path:
+            result_cache = ResultCache(path, ttl=3600)
+            with contextlib.closing(self.connect(result_cache=result_cache)) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                    query_id = cursor.query_id
+                    self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+                    self.assertEqual(result_cache.misses, 1)
+
+                    cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                    self.assertEqual(cursor.query_id, query_id)
+                    self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+                    self.assertEqual(result_cache.hits, 1)
+
+                    # Other statements are not cached.
+                    cursor.execute("SHOW TABLES")
+                    self.assertEqual(result_cache.stats["entries"], 1)
+
+                with conn.cursor(DictCursor) as cursor:
+                    cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                    self.assertEqual(cursor.query_id, query_id)
+                    self.assertEqual(cursor.fetchone(), {"a": 0})
+
+                # The streaming result set does not use the result cache.
+                with conn.cursor(streaming=True) as cursor:
+                    cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                    self.assertNotEqual(cursor.query_id, query_id)
+                    self.assertEqual(cursor.fetchall(), [(i,) for i in range(10000)])
+
+    def test_prepare(self):
+        query = """
+                SELECT col_int, col_string FROM one_row_complex
+                WHERE col_string = %(param)s AND col_int > %(col_int)d
+                """
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query, {"param": "a string", "col_int": 0}, prepare=True)
+                self.assertEqual(cursor.fetchall(), [(2147483647, "a string")])
+                query_execution = cursor._get_query_execution(cursor.query_id)
+                self.assertTrue(query_execution.query.startswith("EXECUTE pyathena_"))
+                self.assertEqual(conn.prepared_statement_cache.misses, 1)
+
+                cursor.execute(query, {"param": "a string", "col_int": 0}, prepare=True)
+                self.assertEqual(cursor.fetchall(), [(2147483647, "a string")])
+                self.assertEqual(
+                    cursor._get_query_execution(cursor.query_id).query,
+                    query_execution.query,
+                )
+                self.assertEqual(conn.prepared_statement_cache.hits, 1)
+
+                cursor.execute(query, {"param": "other", "col_int": 0}, prepare=True)
+                self.assertEqual(cursor.fetchall(), [])
+                self.assertEqual(conn.prepared_statement_cache.stats["entries"], 1)
+
+    def test_query_history(self):
+        query = "SELECT * FROM one_row -- {0}".format(str(datetime.utcnow()))
+        query_history = QueryHistory(sync_interval=3600)
+        with contextlib.closing(self.connect(query_history=query_history)) as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(query)
+                query_id = cursor.query_id
+                self.assertEqual(query_history.get(query), query_id)
+
+                cursor.execute(query, cache_size=100)
+                self.assertEqual(cursor.query_id, query_id)
+                cursor.execute(query, cache_size=100, cache_expiration_time=3600)
+                self.assertEqual(cursor.query_id, query_id)
+                self.assertIsNotNone(query_history.get_marker())
+
 
 class TestDictCursor(unittest.TestCase, WithConnect):
     @with_cursor(cursor_class=DictCursor)
@@ -634,3 +878,11 @@ class TestDictCursor(unittest.TestCase, WithConnect):
         self.assertEqual(cursor.fetchall(), [{"number_of_rows": 1}])
         cursor.execute("SELECT a FROM many_rows ORDER BY a")
         self.assertEqual(cursor.fetchall(), [{"a": i} for i in range(10000)])
+
+    def test_streaming(self):
+        with contextlib.closing(self.connect()) as conn:
+            with conn.cursor(DictCursor, streaming=True) as cursor:
+                cursor.execute("SELECT * FROM one_row")
+                self.assertEqual(cursor.fetchall(), [{"number_of_rows": 1}])
+                cursor.execute("SELECT a FROM many_rows ORDER BY a")
+                self.assertEqual(cursor.fetchall(), [{"a": i} for i in range(10000)])
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import unittest
+
+from pyathena.executor import PriorityThreadPoolExecutor
+
+
+class TestPriorityThreadPoolExecutor(unittest.TestCase):
+    def _run(self, executor, tasks):
+        event = threading.Event()
+        executor.submit(event.wait)
+        results = []
+        futures = [
+            executor.submit_with_priority(priority, results.append, name)
+            for priority, name in tasks
+        ]
+        event.set()
+        for f in futures:
+            f.result()
+        return results
+
+    def test_priority(self):
+        executor = PriorityThreadPoolExecutor(max_workers=1)
+        self.assertEqual(
+            self._run(executor, [(0, "low"), (10, "high"), (5, "middle"), (0, "low2")]),
+            ["high", "middle", "low", "low2"],
+        )
+        executor.shutdown()
+
+    def test_aging(self):
+        executor = PriorityThreadPoolExecutor(max_workers=1, aging_interval=0.01)
+        event = threading.Event()
+        executor.submit(event.wait)
+        results = []
+        low = executor.submit_with_priority(0, results.append, "low")
+        time.sleep(0.1)
+        # The low priority function waited longer than 0.01 * 5 seconds.
+        high = executor.submit_with_priority(5, results.append, "high")
+        event.set()
+        low.result()
+        high.result()
+        self.assertEqual(results, ["low", "high"])
+        executor.shutdown()
+
+    def test_max_workers(self):
+        executor = PriorityThreadPoolExecutor(max_workers=3)
+        barrier = threading.Barrier(3, timeout=5)
+        futures = [executor.submit(barrier.wait) for _ in range(3)]
+        self.assertEqual(sorted(f.result() for f in futures), [0, 1, 2])
+        self.assertLessEqual(len(executor._threads), 3)
+        executor.shutdown()
+
+    def test_shutdown(self):
+        executor = PriorityThreadPoolExecutor(max_workers=1)
+        event = threading.Event()
+        executor.submit(event.wait)
+        future = executor.submit(lambda: 1)
+        executor.shutdown(wait=False, cancel_futures=True)
+        event.set()
+        self.assertTrue(future.cancelled())
+        self.assertRaises(RuntimeError, lambda: executor.submit(lambda: 1))
+        executor.shutdown()
+
+    def test_exit(self):
+        # The functions submitted are run before the interpreter exits.
+        proc = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                textwrap.dedent(
+                    """
+                    import time
+                    from pyathena.executor import PriorityThreadPoolExecutor
+
+                    executor = PriorityThreadPoolExecutor(max_workers=1)
+                    for i in range(3):
+                        executor.submit(lambda i: time.sleep(0.1) or print(i), i)
+                    """
+                ),
+            ],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            timeout=30,
+            check=True,
+        )
+        self.assertEqual(proc.stdout.split(), ["0", "1", "2"])
@@ -226,6 +226,29 @@ class TestDefaultParameterFormatter(unittest.TestCase):
         )
         self.assertEqual(actual, expected)
 
+    def test_format_str_unload(self):
+        expected = textwrap.dedent(
+            """
+            UNLOAD (
+            SELECT * FROM test_table WHERE col_string = 'O''Brien'
+            )
+            TO 's3://bucket/path/'
+            """
+        ).strip()
+
+        actual = self.format(
+            textwrap.dedent(
+                """
+                UNLOAD (
+                SELECT * FROM test_table WHERE col_string = %(param)s
+                )
+                TO 's3://bucket/path/'
+                """
+            ).strip(),
+            {"param": "O'Brien"},
+        )
+        self.assertEqual(actual, expected)
+
     def test_format_unicode(self):
         expected = textwrap.dedent(
             """
@@ -475,3 +498,105 @@ class TestDefaultParameterFormatter(unittest.TestCase):
                 ["a string"],
             ),
         )
+
+    def test_format_many(self):
+        actual = self.formatter.format_many(
+            textwrap.dedent(
+                """
+                INSERT INTO test_table (col_int, col_string)
+                VALUES (%(col_int)d, %(col_string)s)
+                """
+            ).strip(),
+            [{"col_int": i, "col_string": "a ({0})".format(i)} for i in range(3)],
+        )
+        self.assertEqual(
+            actual,
+            [
+                (
+                    0,
+                    3,
+                    "INSERT INTO test_table (col_int, col_string)\nVALUES "
+                    "(0, 'a (0)'), (1, 'a (1)'), (2, 'a (2)')",
+                )
+            ],
+        )
+
+    def test_format_many_max_query_length(self):
+        formatter = DefaultParameterFormatter(max_query_length=40)
+        actual = formatter.format_many(
+            "INSERT INTO test_table VALUES (%(col_int)d)",
+            [{"col_int": i} for i in range(5)],
+        )
+        self.assertEqual(
+            actual,
+            [
+                (0, 2, "INSERT INTO test_table VALUES (0), (1)"),
+                (2, 4, "INSERT INTO test_table VALUES (2), (3)"),
+                (4, 5, "INSERT INTO test_table VALUES (4)"),
+            ],
+        )
+        for _, _, query in actual:
+            self.assertLessEqual(len(query.encode("utf-8")), 40)
+
+    def test_format_many_not_combined(self):
+        self.assertIsNone(
+            self.formatter.format_many(
+                "INSERT INTO test_table SELECT %(col_int)d", [{"col_int": 1}]
+            )
+        )
+        self.assertIsNone(
+            self.formatter.format_many(
+                "INSERT INTO test_table VALUES (1), (%(col_int)d)", [{"col_int": 1}]
+            )
+        )
+        self.assertIsNone(
+            self.formatter.format_many(
+                "SELECT * FROM test_table WHERE col_int = %(col_int)d", [{"col_int": 1}]
+            )
+        )
+
+    def test_prepare(self):
+        actual = self.formatter.prepare(
+            textwrap.dedent(
+                """
+                SELECT * FROM test_table
+                WHERE col_int = %(col_int)d AND col_string LIKE 'a%%'
+                AND col_string = %(param)s OR col_int > %(col_int)d;
+                """
+            )
+        )
+        self.assertEqual(
+            actual,
+            (
+                textwrap.dedent(
+                    """
+                    SELECT * FROM test_table
+                    WHERE col_int = ? AND col_string LIKE 'a%'
+                    AND col_string = ? OR col_int > ?
+                    """
+                ).strip(),
+                ["col_int", "param", "col_int"],
+            ),
+        )
+        self.assertRaises(ProgrammingError, lambda: self.formatter.prepare("  "))
+
+    def test_format_arguments(self):
+        actual = self.formatter.format_arguments(
+            ["col_int", "col_string", "col_date", "col_decimal", "col_null"],
+            {
+                "col_int": 1,
+                "col_string": "a'b",
+                "col_date": date(2017, 1, 1),
+                "col_decimal": Decimal("0.1"),
+                "col_null": None,
+            },
+        )
+        self.assertEqual(actual, "1, 'a''b', DATE '2017-01-01', DECIMAL '0.1', null")
+        self.assertRaises(
+            ProgrammingError,
+            lambda: self.formatter.format_arguments(["col_int"], {"other": 1}),
+        )
+        self.assertRaises(
+            ProgrammingError,
+            lambda: self.formatter.format_arguments(["col_list"], {"col_list": [1, 2]}),
+        )
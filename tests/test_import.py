@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+
+class TestImport(unittest.TestCase):
+
+    # The packages that are imported on the first use.
+    LAZY_PACKAGES = ["boto3", "botocore", "tenacity", "pandas", "pyarrow", "sqlalchemy"]
+
+    @staticmethod
+    def importtime(code: str) -> Dict[str, int]:
+        """Run the code with ``python -X importtime``, and return the cumulative
+        microseconds spent importing each module."""
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        modules = dict()
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line.split("|")
+            modules[name.strip()] = int(cumulative)
+        return modules
+
+    def assertNotImported(self, modules: Dict[str, int], packages):
+        imported = sorted({m.split(".")[0] for m in modules} & set(packages))
+        self.assertEqual(imported, [], "Imported on startup: {0}".format(imported))
+
+    def test_import(self):
+        modules = self.importtime("import pyathena")
+        self.assertIn("pyathena", modules)
+        self.assertNotImported(modules, self.LAZY_PACKAGES)
+
+    def test_import_connection(self):
+        modules = self.importtime(
+            "from pyathena import connect\nimport pyathena.connection"
+        )
+        self.assertIn("pyathena.connection", modules)
+        self.assertNotImported(modules, self.LAZY_PACKAGES)
+
+    def test_connect(self):
+        modules = self.importtime(
+            "from pyathena import connect\n"
+            "connect(s3_staging_dir='s3://bucket/path/', region_name='us-west-2')"
+        )
+        self.assertIn("boto3", modules)
+        self.assertNotImported(
+            modules, [p for p in self.LAZY_PACKAGES if p not in ("boto3", "botocore")]
+        )
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pyathena.error import OperationalError
+from pyathena.model import AthenaQueryExecution
+from pyathena.poller import BatchPoller
+from pyathena.polling import FixedPollingStrategy, PollingStrategy
+from pyathena.util import RetryConfig
+
+
+class _Client(object):
+    def __init__(self, state=AthenaQueryExecution.STATE_SUCCEEDED):
+        self.state = state
+        self.broken = False
+
+    def batch_get_query_execution(self, QueryExecutionIds):
+        if self.broken:
+            return {"QueryExecutions": [None]}
+        return {
+            "QueryExecutions": [
+                {
+                    "QueryExecutionId": q,
+                    "Query": "SELECT 1",
+                    "Status": {"State": self.state},
+                }
+                for q in QueryExecutionIds
+            ]
+        }
+
+
+class _BrokenPollingStrategy(PollingStrategy):
+    def get_interval(self, attempt, elapsed, query_execution):
+        raise ValueError("Broken")
+
+
+class TestBatchPoller(unittest.TestCase):
+    def test_submit(self):
+        poller = BatchPoller(_Client(), RetryConfig())
+        futures = [poller.submit(str(i), FixedPollingStrategy()) for i in range(60)]
+        self.assertEqual(
+            [f.result(timeout=10).query_id for f in futures],
+            [str(i) for i in range(60)],
+        )
+        self.assertEqual(poller.pending, 0)
+        poller.close()
+
+    def test_polling_strategy_error(self):
+        poller = BatchPoller(_Client(AthenaQueryExecution.STATE_RUNNING), RetryConfig())
+        future = poller.submit("1", _BrokenPollingStrategy())
+        self.assertRaises(OperationalError, future.result, timeout=10)
+        self.assertEqual(poller.pending, 0)
+        poller.close()
+
+    def test_thread_error(self):
+        client = _Client()
+        client.broken = True
+        poller = BatchPoller(client, RetryConfig())
+        future = poller.submit("1", FixedPollingStrategy())
+        self.assertRaises(OperationalError, future.result, timeout=10)
+        # The next submission is polled by a new thread.
+        client.broken = False
+        future = poller.submit("2", FixedPollingStrategy())
+        self.assertEqual(future.result(timeout=10).query_id, "2")
+        poller.close()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pyathena.model import AthenaQueryExecution
+from pyathena.polling import (
+    BackoffPollingStrategy,
+    FixedPollingStrategy,
+    PredictivePollingStrategy,
+)
+
+
+def _query_execution(
+    query="SELECT 1",
+    state=AthenaQueryExecution.STATE_RUNNING,
+    engine_execution_time_in_millis=None,
+    query_queue_time_in_millis=None,
+):
+    statistics = {}
+    if engine_execution_time_in_millis is not None:
+        statistics["EngineExecutionTimeInMillis"] = engine_execution_time_in_millis
+    if query_queue_time_in_millis is not None:
+        statistics["QueryQueueTimeInMillis"] = query_queue_time_in_millis
+    return AthenaQueryExecution(
+        {
+            "QueryExecution": {
+                "QueryExecutionId": "query_id",
+                "Query": query,
+                "WorkGroup": "primary",
+                "Status": {"State": state},
+                "Statistics": statistics,
+            }
+        }
+    )
+
+
+class TestPollingStrategy(unittest.TestCase):
+    def test_fixed(self):
+        strategy = FixedPollingStrategy(interval=2)
+        self.assertEqual(strategy.get_interval(0, 0, _query_execution()), 2)
+        self.assertEqual(strategy.get_interval(10, 30, _query_execution()), 2)
+
+    def test_backoff(self):
+        strategy = BackoffPollingStrategy(
+            initial_interval=0.1, max_interval=1, multiplier=2, jitter=0
+        )
+        self.assertEqual(
+            [strategy.get_interval(i, 0, _query_execution()) for i in range(6)],
+            [0.1, 0.2, 0.4, 0.8, 1, 1],
+        )
+
+    def test_backoff_jitter(self):
+        strategy = BackoffPollingStrategy(
+            initial_interval=1, max_interval=1, multiplier=2, jitter=0.5
+        )
+        for _ in range(100):
+            interval = strategy.get_interval(0, 0, _query_execution())
+            self.assertGreaterEqual(interval, 0.5)
+            self.assertLessEqual(interval, 1)
+
+    def test_predictive(self):
+        strategy = PredictivePollingStrategy(
+            initial_interval=0.1, max_interval=1, jitter=0, max_wait=5, smoothing=0.5
+        )
+        self.assertIsNone(strategy.predict(_query_execution()))
+        self.assertEqual(strategy.get_interval(0, 0, _query_execution()), 0.1)
+
+        strategy.record(
+            _query_execution(
+                state=AthenaQueryExecution.STATE_SUCCEEDED,
+                engine_execution_time_in_millis=2000,
+                query_queue_time_in_millis=1000,
+            )
+        )
+        self.assertEqual(strategy.predict(_query_execution()), 3)
+        strategy.record(
+            _query_execution(
+                state=AthenaQueryExecution.STATE_SUCCEEDED,
+                engine_execution_time_in_millis=20000,
+                query_queue_time_in_millis=1000,
+            )
+        )
+        self.assertEqual(strategy.predict(_query_execution()), 12)
+        # Failed queries are not recorded.
+        strategy.record(
+            _query_execution(
+                state=AthenaQueryExecution.STATE_FAILED,
+                engine_execution_time_in_millis=100,
+            )
+        )
+        self.assertEqual(strategy.predict(_query_execution()), 12)
+
+        self.assertEqual(strategy.get_interval(0, 0, _query_execution()), 5)
+        self.assertEqual(strategy.get_interval(1, 10, _query_execution()), 2)
+        self.assertEqual(strategy.get_interval(2, 12, _query_execution()), 0.4)
+        self.assertEqual(
+            strategy.get_interval(0, 0, _query_execution(query="SELECT 2")), 0.1
+        )
+
+    def test_predictive_max_entries(self):
+        strategy = PredictivePollingStrategy(max_entries=2)
+        for i in range(3):
+            strategy.record(
+                _query_execution(
+                    query="SELECT {0}".format(i),
+                    state=AthenaQueryExecution.STATE_SUCCEEDED,
+                    engine_execution_time_in_millis=1000,
+                )
+            )
+        self.assertIsNone(strategy.predict(_query_execution(query="SELECT 0")))
+        self.assertEqual(strategy.predict(_query_execution(query="SELECT 2")), 1)
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from pyathena.prepared_statement import PreparedStatementCache
+
+
+class TestPreparedStatementCache(unittest.TestCase):
+    def test_get_name(self):
+        name = PreparedStatementCache.get_name("SELECT * FROM one_row WHERE a = ?")
+        self.assertEqual(
+            name, PreparedStatementCache.get_name("SELECT * FROM one_row WHERE a = ?")
+        )
+        self.assertNotEqual(
+            name, PreparedStatementCache.get_name("SELECT * FROM one_row WHERE b = ?")
+        )
+        self.assertRegex(name, r"^pyathena_[0-9a-f]+$")
+
+    def test_get_put(self):
+        cache = PreparedStatementCache()
+        self.assertIsNone(cache.get("wg", "SELECT %(a)s"))
+        cache.put("wg", "SELECT %(a)s", "pyathena_0", ["a"])
+        self.assertEqual(cache.get("wg", "SELECT %(a)s"), ("pyathena_0", ["a"]))
+        self.assertIsNone(cache.get("other", "SELECT %(a)s"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+        cache.clear()
+        self.assertIsNone(cache.get("wg", "SELECT %(a)s"))
+
+    def test_evict(self):
+        cache = PreparedStatementCache(max_size=2)
+        cache.put(None, "SELECT 1", "pyathena_1", [])
+        cache.put(None, "SELECT 2", "pyathena_2", [])
+        cache.get(None, "SELECT 1")
+        cache.put(None, "SELECT 3", "pyathena_3", [])
+        self.assertIsNone(cache.get(None, "SELECT 2"))
+        self.assertEqual(cache.get(None, "SELECT 1"), ("pyathena_1", []))
+        self.assertEqual(cache.get(None, "SELECT 3"), ("pyathena_3", []))
+        self.assertEqual(cache.stats["evictions"], 1)
+        self.assertEqual(cache.stats["entries"], 2)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from pyathena.model import AthenaQueryExecution
+from pyathena.query_history import QueryHistory
+
+
+def _query_execution(
+    query_id,
+    query,
+    completion_date_time,
+    state=AthenaQueryExecution.STATE_SUCCEEDED,
+    statement_type=AthenaQueryExecution.STATEMENT_TYPE_DML,
+    work_group="primary",
+):
+    return AthenaQueryExecution(
+        {
+            "QueryExecution": {
+                "QueryExecutionId": query_id,
+                "Query": query,
+                "StatementType": statement_type,
+                "WorkGroup": work_group,
+                "Status": {
+                    "State": state,
+                    "CompletionDateTime": completion_date_time,
+                },
+            }
+        }
+    )
+
+
+class TestQueryHistory(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "query_history.db")
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_add_get(self):
+        history = QueryHistory()
+        self.assertIsNone(history.get("SELECT 1"))
+        history.add(_query_execution("1", "SELECT 1", self.now - timedelta(hours=1)))
+        history.add(_query_execution("2", "SELECT 1", self.now))
+        history.add(_query_execution("3", "SELECT 1", self.now - timedelta(hours=2)))
+        self.assertEqual(history.get("SELECT 1"), "2")
+        self.assertEqual(history.get("SELECT 1", "primary"), "2")
+        self.assertIsNone(history.get("SELECT 1", "other"))
+        self.assertIsNone(history.get("SELECT 2"))
+        self.assertIsNone(
+            history.get("SELECT 1", expiration_time=self.now + timedelta(minutes=1))
+        )
+
+    def test_get_cache_size(self):
+        history = QueryHistory()
+        history.add(_query_execution("1", "SELECT 1", self.now - timedelta(hours=2)))
+        history.add(_query_execution("2", "SELECT 2", self.now - timedelta(hours=1)))
+        history.add(_query_execution("3", "SELECT 3", self.now))
+        history.add(_query_execution("4", "SELECT 4", self.now, work_group="other"))
+        self.assertEqual(history.get("SELECT 1", cache_size=3), "1")
+        self.assertIsNone(history.get("SELECT 1", cache_size=2))
+        self.assertEqual(history.get("SELECT 2", cache_size=2), "2")
+        self.assertEqual(history.get("SELECT 3", cache_size=1), "3")
+        self.assertEqual(history.get("SELECT 4", "other", cache_size=1), "4")
+
+    def test_max_entries(self):
+        history = QueryHistory(self.path, max_entries=2)
+        history.add(_query_execution("1", "SELECT 1", self.now - timedelta(hours=2)))
+        history.add(_query_execution("2", "SELECT 2", self.now - timedelta(hours=1)))
+        history.add(_query_execution("3", "SELECT 3", self.now))
+        self.assertIsNone(history.get("SELECT 1"))
+        self.assertEqual(history.get("SELECT 2"), "2")
+        self.assertEqual(history.get("SELECT 3"), "3")
+        # The query added again is the newest one.
+        history.add(_query_execution("4", "SELECT 2", self.now))
+        history.add(_query_execution("5", "SELECT 4", self.now))
+        self.assertEqual(history.get("SELECT 2", cache_size=2), "4")
+        self.assertIsNone(history.get("SELECT 3"))
+        history.close()
+        history = QueryHistory(self.path, max_entries=2)
+        self.assertIsNone(history.get("SELECT 1"))
+        self.assertIsNone(history.get("SELECT 3"))
+        self.assertEqual(history.get("SELECT 2"), "4")
+        self.assertEqual(history.get("SELECT 4"), "5")
+        history.close()
+
+    def test_add_ignored(self):
+        history = QueryHistory()
+        history.add(
+            _query_execution(
+                "1", "SELECT 1", self.now, state=AthenaQueryExecution.STATE_FAILED
+            )
+        )
+        history.add(
+            _query_execution(
+                "2",
+                "CREATE TABLE foo (a int)",
+                self.now,
+                statement_type=AthenaQueryExecution.STATEMENT_TYPE_DDL,
+            )
+        )
+        self.assertIsNone(history.get("SELECT 1"))
+        self.assertIsNone(history.get("CREATE TABLE foo (a int)"))
+
+    def test_persistence(self):
+        history = QueryHistory(self.path)
+        history.add(_query_execution("1", "SELECT 1", self.now, work_group="wg"))
+        history.set_marker("wg", "1")
+        history.close()
+        history = QueryHistory(self.path)
+        self.assertEqual(history.get("SELECT 1", "wg"), "1")
+        self.assertEqual(history.get_marker("wg"), "1")
+        self.assertIsNone(history.get_marker())
+        history.close()
+
+    def test_needs_sync(self):
+        history = QueryHistory(sync_interval=3600)
+        self.assertTrue(history.needs_sync())
+        history.set_marker(None, None)
+        self.assertFalse(history.needs_sync())
+        self.assertIsNone(history.get_marker())
+        self.assertTrue(history.needs_sync("other"))
+        history = QueryHistory()
+        history.set_marker(None, "1")
+        self.assertTrue(history.needs_sync())
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import os
+import tempfile
+import time
+import unittest
+
+from pyathena.result_cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = self._dir.name
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_get_key(self):
+        key = ResultCache.get_key("SELECT 1", "awsdatacatalog", "default", None)
+        self.assertEqual(
+            key, ResultCache.get_key("SELECT 1", "awsdatacatalog", "default", None)
+        )
+        self.assertNotEqual(
+            key, ResultCache.get_key("SELECT 1", "awsdatacatalog", "other", None)
+        )
+        self.assertNotEqual(
+            key, ResultCache.get_key("SELECT 1", "awsdatacatalog", "default", "wg")
+        )
+
+    def test_get_put(self):
+        cache = ResultCache(self.path)
+        self.assertIsNone(cache.get("key"))
+        cache.put("key", {"pages": [1, 2]})
+        self.assertEqual(cache.get("key"), {"pages": [1, 2]})
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        # The entries are kept on disk.
+        cache = ResultCache(self.path)
+        self.assertEqual(cache.get("key"), {"pages": [1, 2]})
+        cache.clear()
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.size, 0)
+
+    def test_ttl(self):
+        cache = ResultCache(self.path, ttl=0.1)
+        cache.put("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+        time.sleep(0.2)
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_lru_eviction(self):
+        cache = ResultCache(self.path)
+        cache.put("a", "x" * 100)
+        size = cache.size
+        cache = ResultCache(self.path, max_size=size * 2)
+        cache.put("b", "x" * 100)
+        cache.get("a")
+        cache.put("c", "x" * 100)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "x" * 100)
+        self.assertEqual(cache.get("c"), "x" * 100)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.size, size * 2)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+import io
+import unittest
+
+from pyathena.result_set import AthenaStreamingResultSet, _read_csv
+
+
+class TestReadCsv(unittest.TestCase):
+    def test_read_csv(self):
+        lines = [
+            '"a","b","c"\n',
+            '"1","","x"\n',
+            ',"2",\n',
+            '"multi\n',
+            'line","quote""d","3,4"\n',
+            "\n",
+            '"last"',
+        ]
+        self.assertEqual(
+            list(_read_csv(iter(lines))),
+            [
+                ["a", "b", "c"],
+                ["1", "", "x"],
+                [None, "2", None],
+                ["multi\nline", 'quote"d', "3,4"],
+                [None],
+                ["last"],
+            ],
+        )
+
+    def test_read_csv_crlf(self):
+        self.assertEqual(
+            list(_read_csv(iter(['"a",\r\n', '"b\r\n', 'c"\r\n']))),
+            [["a", None], ["b\r\nc"]],
+        )
+
+    def test_read_csv_line_boundaries(self):
+        result_set = AthenaStreamingResultSet.__new__(AthenaStreamingResultSet)
+        result_set._body = io.BytesIO(
+            '"a","b"\n"x\ry","\x0b\x1c\u2028"\n"","é"\n,\n'.encode("utf-8")
+        )
+        # The lines and the characters are split across the blocks.
+        result_set._block_size = 3
+        self.assertEqual(
+            list(_read_csv(result_set._iter_lines())),
+            [["a", "b"], ["x\ry", "\x0b\x1c\u2028"], ["", "é"], [None, None]],
+        )
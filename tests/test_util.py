@@ -1,8 +1,16 @@
 # -*- coding: utf-8 -*-
+import io
+import threading
 import unittest
+from concurrent.futures.thread import ThreadPoolExecutor
 
-from pyathena import DataError
-from pyathena.util import parse_output_location
+from pyathena import DataError, OperationalError
+from pyathena.util import (
+    RetryConfig,
+    get_object_ranges,
+    parse_output_location,
+    synchronized,
+)
 from tests import WithConnect
 
 
@@ -16,3 +24,62 @@ class TestUtil(unittest.TestCase, WithConnect):
         # invalid
         with self.assertRaises(DataError):
             parse_output_location("http://foobar")
+
+    def test_synchronized(self):
+        class Synchronized(object):
+            def __init__(self, barrier):
+                self.barrier = barrier
+
+            @synchronized
+            def wait(self):
+                return self.barrier.wait(timeout=10)
+
+            @synchronized
+            def reenter(self):
+                return self.reenter_inner()
+
+            @synchronized
+            def reenter_inner(self):
+                return True
+
+        # The lock is not shared by the instances.
+        barrier = threading.Barrier(2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fs = [
+                executor.submit(Synchronized(barrier).wait),
+                executor.submit(Synchronized(barrier).wait),
+            ]
+            self.assertEqual(sorted(f.result() for f in fs), [0, 1])
+        self.assertTrue(Synchronized(barrier).reenter())
+
+    def test_get_object_ranges(self):
+        data = bytes(range(256)) * 100
+        requested = []
+        lock = threading.Lock()
+
+        class Client(object):
+            def get_object(self, Bucket, Key, Range):
+                start, end = [int(v) for v in Range.split("=")[1].split("-")]
+                stop = end + 1
+                with lock:
+                    requested.append(start)
+                return {"Body": io.BytesIO(data[start:stop])}
+
+        with get_object_ranges(
+            Client(), "bucket", "key", len(data), 1000, 4, RetryConfig()
+        ) as body:
+            self.assertEqual(body.read(10), data[:10])
+            # The parts are not downloaded further ahead than the workers.
+            self.assertLessEqual(len(requested), 5)
+            self.assertEqual(body.read(), data[10:])
+        self.assertEqual(sorted(requested), list(range(0, len(data), 1000)))
+
+    def test_get_object_ranges_error(self):
+        class Client(object):
+            def get_object(self, Bucket, Key, Range):
+                raise ValueError("Failed")
+
+        with get_object_ranges(
+            Client(), "bucket", "key", 100, 10, 2, RetryConfig()
+        ) as body:
+            self.assertRaises(OperationalError, body.read)
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import asyncio
 import codecs
 import contextlib
 import functools
@@ -10,7 +11,10 @@ def with_cursor(**opts):
         def wrapped_fn(self, *args, **kwargs):
             with contextlib.closing(self.connect(**opts)) as conn:
                 with conn.cursor() as cursor:
-                    fn(self, cursor, *args, **kwargs)
+                    if asyncio.iscoroutinefunction(fn):
+                        asyncio.run(fn(self, cursor, *args, **kwargs))
+                    else:
+                        fn(self, cursor, *args, **kwargs)
 
         return wrapped_fn
 